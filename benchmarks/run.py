@@ -0,0 +1,338 @@
+"""Benchmark suite for the package's hot paths.
+
+Runs offline with synthetic data. Timings are stored as seconds per item,
+so that they can be compared against the stored baseline ('baseline.json'),
+together with their noise: the ratio of the slowest to the best timed round.
+A benchmark regresses if it's slower than the threshold times its noise.
+Benchmarks that build a Python object per item are capped by their 'max_size'.
+
+Usage:
+    python benchmarks/run.py                      # compare against baseline
+    python benchmarks/run.py --sizes 1000 1000000 # custom sizes
+    python benchmarks/run.py --update             # overwrite baseline
+"""
+
+import argparse
+import datetime as dt
+import json
+import sys
+from os.path import abspath, dirname, join
+from timeit import Timer
+from typing import Callable
+
+import numpy as np
+
+project_root = abspath(join(dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from dbdie_classes.code.version import filter_images_with_dbdv  # noqa: E402
+from dbdie_classes.consistency import ConsistencyEngine, dense_array  # noqa: E402
+from dbdie_classes.extract import CropCoords  # noqa: E402
+from dbdie_classes.groupings import PredictableTuples  # noqa: E402
+from dbdie_classes.options import FMT  # noqa: E402
+from dbdie_classes.schemas.adapters import dump_json_many, validate_many  # noqa: E402
+from dbdie_classes.schemas.groupings import (  # noqa: E402
+    LabelsBatch,
+    LabelsOut,
+    MatchOut,
+    PlayerIn,
+    PlayerOut,
+)
+from dbdie_classes.schemas.helpers import DBDVersionOut, DBDVersionRange  # noqa: E402
+from dbdie_classes.schemas.predictables import (  # noqa: E402
+    AddonOut,
+    CharacterOut,
+    ItemOut,
+    OfferingOut,
+    PerkOut,
+    StatusOut,
+)
+from tests.mocks import mock_labels  # noqa: E402
+
+BASELINE_PATH = join(dirname(__file__), "baseline.json")
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 1.5  # max allowed slowdown ratio against the baseline, before noise
+OBJECTS_MAX_SIZE = 100_000  # max size of the benchmarks with a Python object per item
+
+Benchmark = Callable[[int], Callable[[], object]]  # size -> timed function
+Timing = dict[str, float]  # seconds per item ('secs') and noise ratio ('noise')
+BENCHMARKS: dict[str, Benchmark] = {}
+MAX_SIZES: dict[str, int | None] = {}
+
+
+def benchmark(func: Benchmark | None = None, *, max_size: int | None = None):
+    """Register a benchmark, optionally capping the sizes it runs with."""
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[func.__name__] = func
+        MAX_SIZES[func.__name__] = max_size
+        return func
+
+    return register if func is None else register(func)
+
+
+# * Benchmarks
+
+
+@benchmark
+def crop_coords_geometry(n: int):
+    crops = [CropCoords(i % 500, i % 300, i % 500 + 50, i % 300 + 40) for i in range(n)]
+    big = CropCoords(0, 0, 520, 330)
+
+    def run():
+        for cc in crops:
+            cc.shape
+            cc.size
+            cc.is_fully_inside(big)
+            cc.check_overlap(big)
+
+    return run
+
+
+@benchmark
+def predictable_tuples_iteration(n: int):
+    fmts = [FMT.ALL[i % len(FMT.ALL)] for i in range(n)]
+    pred_tuples = PredictableTuples.from_fmts(fmts)
+
+    def run():
+        for _ in pred_tuples:
+            pass
+        pred_tuples.fmts
+        pred_tuples.mts
+        pred_tuples.ifks
+
+    return run
+
+
+@benchmark
+def fmt_from_fmts(n: int):
+    fmts = [FMT.ALL[i % len(FMT.ALL)] for i in range(n)]
+    return lambda: FMT.from_fmts(fmts)
+
+
+@benchmark(max_size=OBJECTS_MAX_SIZE)
+def player_in_to_sqla(n: int):
+    players = [
+        PlayerIn(
+            id=i % 5,
+            character_id=i % 40,
+            perk_ids=[i % 90, i % 91, i % 92, i % 93],
+            item_id=i % 20,
+            addon_ids=[i % 50, i % 51],
+            offering_id=i % 30,
+            status_id=i % 6,
+        )
+        for i in range(n)
+    ]
+
+    def run():
+        for player in players:
+            player.to_sqla(player.filled_predictables(), strict=False)
+
+    return run
+
+
+@benchmark(max_size=OBJECTS_MAX_SIZE)
+def labels_out_from_labels(n: int):
+    rows = [mock_labels(i) for i in range(n)]
+
+    def run():
+        for row in rows:
+            LabelsOut.from_labels(row)
+
+    return run
+
+
+@benchmark(max_size=OBJECTS_MAX_SIZE)
+def labels_out_from_labels_many(n: int):
+    rows = [mock_labels(i) for i in range(n)]
+    return lambda: LabelsOut.from_labels_many(rows)
+
+
+@benchmark(max_size=OBJECTS_MAX_SIZE)
+def labels_batch_to_json(n: int):
+    rows = [mock_labels(i) for i in range(n)]
+    return lambda: LabelsBatch.from_labels(rows).to_json()
+
+
+@benchmark(max_size=OBJECTS_MAX_SIZE)
+def player_out_construction(n: int):
+    character = CharacterOut(
+        id=5, name="Char", ifk=False, base_char_id=None, dbdv_id=None,
+        common_name=None, emoji=None, power_id=None,
+    )
+    perk = PerkOut(id=3, name="Perk", character_id=5, dbdv_id=None, emoji=None)
+    item = ItemOut(id=2, name="Item", type_id=2, dbdv_id=None, rarity_id=None)
+    addon = AddonOut(id=4, name="Addon", type_id=2, dbdv_id=None, item_id=2, rarity_id=None)
+    offering = OfferingOut(id=6, name="Offering", type_id=0, user_id=2, dbdv_id=None, rarity_id=None)
+    status = StatusOut(id=2, name="Escaped", character_id=2, is_dead=False, dbdv_id=None, emoji=None)
+
+    def run():
+        for i in range(n):
+            PlayerOut(
+                id=i % 4,
+                character=character,
+                perks=[perk, perk, perk, perk],
+                item=item,
+                addons=[addon, addon],
+                offering=offering,
+                status=status,
+                points=10_000,
+                prestige=10,
+            )
+
+    return run
+
+
+@benchmark(max_size=OBJECTS_MAX_SIZE)
+def matches_validate_dump_many(n: int):
+    dicts = [
+        {
+            "id": i,
+            "filename": f"match_{i}.png",
+            "match_date": dt.date(2024, 1, 1),
+            "dbdv_id": i % 50,
+            "special_mode": None,
+            "user_id": 1,
+            "extr_id": None,
+            "kills": i % 5,
+            "date_created": dt.datetime(2024, 1, 1),
+            "date_modified": dt.datetime(2024, 1, 2),
+        }
+        for i in range(n)
+    ]
+    return lambda: dump_json_many(MatchOut, validate_many(MatchOut, dicts))
+
+
+@benchmark
+def consistency_engine_check(n: int):
+    engine = ConsistencyEngine(
+        char_ifk=dense_array({i: i % 2 for i in range(40)}),
+        perk_ifk=dense_array({i: i % 3 - 1 for i in range(300)}),
+        offering_ifk=dense_array({i: i % 3 - 1 for i in range(60)}),
+        item_type=dense_array({i: i % 4 for i in range(30)}),
+        addon_type=dense_array({i: i % 7 for i in range(500)}),
+        status_char=dense_array({i: i % 3 for i in range(8)}),
+    )
+    ids = np.column_stack(
+        [np.arange(n) % 40]
+        + [np.arange(n) % (290 + j) for j in range(4)]
+        + [np.arange(n) % 30]
+        + [np.arange(n) % (490 + j) for j in range(2)]
+        + [np.arange(n) % 60, np.arange(n) % 8]
+    )
+    return lambda: engine.check(ids)
+
+
+@benchmark(max_size=OBJECTS_MAX_SIZE)
+def dbdv_range_intersection(n: int):
+    versions = [
+        DBDVersionOut(id=i, name=f"{i // 100}.{i // 10 % 10}.{i % 10}", common_name=None, release_date=None)
+        for i in range(20)
+    ]
+    ranges = [
+        DBDVersionRange(
+            dbdv_min=versions[i % 10],
+            dbdv_max=versions[10 + i % 10] if i % 3 else None,
+        )
+        for i in range(n)
+    ]
+
+    def run():
+        for dbdvr_a, dbdvr_b in zip(ranges, ranges[1:] + ranges[:1]):
+            dbdvr_a & dbdvr_b
+
+    return run
+
+
+@benchmark
+def filter_images_dbdv(n: int):
+    matches = [{"id": i, "dbdv_id": i % 50} for i in range(n)]
+
+    def run():
+        filter_images_with_dbdv(matches, 10, 40)
+        filter_images_with_dbdv(matches, 10, None)
+
+    return run
+
+
+# * Runner
+
+
+def time_per_item(bench: Benchmark, n: int, repeat: int) -> Timing:
+    """Best time over 'repeat' rounds, in seconds per item, and the noise of the rounds.
+    Each round loops the benchmark as many times as `Timer.autorange` needs
+    to last at least 0.2 seconds, so that fast benchmarks aren't timer noise.
+    """
+    timer = Timer(bench(n))
+    number, _ = timer.autorange()
+    rounds = timer.repeat(repeat=repeat, number=number)
+    return {"secs": min(rounds) / (number * n), "noise": max(rounds) / min(rounds)}
+
+
+def run_benchmarks(names: list[str], sizes: list[int], repeat: int) -> dict[str, Timing]:
+    results = {}
+    for name in names:
+        for n in sizes:
+            key = f"{name}[{n}]"
+            if (MAX_SIZES[name] is not None) and (n > MAX_SIZES[name]):
+                print(f"{key:<45} {'skipped':>12}")
+                continue
+            results[key] = time_per_item(BENCHMARKS[name], n, repeat)
+            print(
+                f"{key:<45} {1e9 * results[key]['secs']:>12.1f} ns/item"
+                f"  (noise {results[key]['noise']:.2f}x)"
+            )
+    return results
+
+
+def compare(
+    results: dict[str, Timing],
+    baseline: dict[str, Timing],
+    threshold: float,
+) -> list[str]:
+    """Names of the benchmarks that regressed more than the threshold,
+    widened by the largest noise of the benchmark (baseline or current).
+    """
+    regressions = []
+    for key, timing in results.items():
+        if key not in baseline:
+            continue
+        ratio = timing["secs"] / baseline[key]["secs"]
+        limit = threshold * max(timing["noise"], baseline[key]["noise"])
+        flag = "REGRESSION" if ratio > limit else "ok"
+        print(f"{key:<45} {ratio:>6.2f}x baseline (limit {limit:.2f}x)  {flag}")
+        if ratio > limit:
+            regressions.append(key)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--update", action="store_true", help="Overwrite the stored baseline")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.only, args.sizes, args.repeat)
+
+    if args.update:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=4, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline updated: {BASELINE_PATH}")
+        return 0
+
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.2f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
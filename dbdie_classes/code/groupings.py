@@ -1,29 +1,138 @@
 """Extra code for groupings classes."""
 
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
 from dbdie_classes.options import MODEL_TYPE as MT
 from dbdie_classes.options import SQL_COLS
+from dbdie_classes.options.NULL_IDS import NULL_SENTINEL
+
+MCKD_NULL = -1  # null manual check in int8 manual checks matrices
+
+# Column plan: compiled once, ordered as SQL_COLS.ALL_FLATTENED and MANUALLY_CHECKED_COLS
+LABELS_ATTRS = attrgetter(*SQL_COLS.ALL_FLATTENED)
+CHECKS_ATTRS = attrgetter(*SQL_COLS.MANUALLY_CHECKED_COLS)
+LABELS_ITEMS = itemgetter(*SQL_COLS.ALL_FLATTENED)
+CHECKS_ITEMS = itemgetter(*SQL_COLS.MANUALLY_CHECKED_COLS)
 
 
 def labels_model_to_labeled_predictables(labels_model):
     """Labels SQLAlchemy model to the labeled predictables."""
-    return [
-        getattr(labels_model, col)
-        for col in SQL_COLS.ALL_FLATTENED
-    ]
+    return list(LABELS_ATTRS(labels_model))
+
+
+def _rows_getters(
+    row,
+    columns: list[str] | None,
+) -> tuple[Callable[[Any], tuple], Callable[[Any], tuple]]:
+    """Getters of the labels and manual checks of a kind of row."""
+    if isinstance(row, dict):
+        return LABELS_ITEMS, CHECKS_ITEMS
+    elif isinstance(row, (tuple, list)) or columns is not None:
+        if columns is None:
+            columns = SQL_COLS.ALL_FLATTENED + SQL_COLS.MANUALLY_CHECKED_COLS
+        col_ixs = {col: ix for ix, col in enumerate(columns)}
+        return (
+            itemgetter(*(col_ixs[col] for col in SQL_COLS.ALL_FLATTENED)),
+            itemgetter(*(col_ixs[col] for col in SQL_COLS.MANUALLY_CHECKED_COLS)),
+        )
+    else:
+        return LABELS_ATTRS, CHECKS_ATTRS
+
+
+def labels_models_to_matrices(
+    rows: Iterable,
+    columns: list[str] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Bulk version of `labels_model_to_labeled_predictables` and `labels_model_to_checks`.
+
+    Rows can be SQLAlchemy `Labels` models (or any object with those attributes),
+    dicts, or tuples laid out as 'columns' (default: `SQL_COLS.ALL_FLATTENED`
+    followed by `SQL_COLS.MANUALLY_CHECKED_COLS`).
+
+    Returns an int64 (n_rows, len(SQL_COLS.ALL_FLATTENED)) labels matrix
+    with `NULL_SENTINEL` for nulls, and an int8 (n_rows, len(MT.ALL)) manual
+    checks matrix with 1 (True), 0 (False) and `MCKD_NULL` (None).
+    """
+    rows = iter(rows)
+    try:
+        first = next(rows)
+    except StopIteration:
+        return (
+            np.empty((0, len(SQL_COLS.ALL_FLATTENED)), dtype=np.int64),
+            np.empty((0, len(SQL_COLS.MANUALLY_CHECKED_COLS)), dtype=np.int8),
+        )
+
+    get_labels, get_checks = _rows_getters(first, columns)
+    labels, checks = [], []
+    for row in chain([first], rows):
+        labels.append(get_labels(row))
+        checks.append(get_checks(row))
+
+    labels = np.array(labels, dtype=float)
+    checks = np.array(checks, dtype=float)
+    return (
+        np.where(np.isnan(labels), NULL_SENTINEL, labels).astype(np.int64),
+        np.where(np.isnan(checks), MCKD_NULL, checks).astype(np.int8),
+    )
 
 
 def labels_model_to_checks(labels_model):
     """Labels SQLAlchemy model to its manual check columns."""
-    return [
-        labels_model.addons_mckd,
-        labels_model.character_mckd,
-        labels_model.item_mckd,
-        labels_model.offering_mckd,
-        labels_model.perks_mckd,
-        labels_model.points_mckd,
-        labels_model.prestige_mckd,
-        labels_model.status_mckd,
-    ]
+    return list(CHECKS_ATTRS(labels_model))
+
+
+# * Packed manual checks
+# 2 bits per model type (in MT.ALL order) in a uint16: 0 (None), 1 (False), 2 (True),
+# i.e. the value in the int8 manual checks matrices plus 1
+
+MCKD_CODES = {None: 0, False: 1, True: 2}
+MCKD_FROM_CODES = [None, False, True]
+MCKD_SHIFTS = np.arange(0, 2 * len(MT.ALL), 2, dtype=np.uint16)
+MCKD_ALL_TRUE = int(sum(2 << int(sh) for sh in MCKD_SHIFTS))  # 0b1010...10
+MCKD_FLAGS = ["is_init", "in_progress", "completed"]
+
+
+def encode_checks(checks: list) -> int:
+    """Pack the `ManualChecks` of all model types (in `MT.ALL` order) into an int."""
+    packed = 0
+    for i, chk in enumerate(checks):
+        packed |= MCKD_CODES[chk] << (2 * i)
+    return packed
+
+
+def decode_checks(packed: int) -> list:
+    """Unpack an int into the `ManualChecks` of all model types (in `MT.ALL` order)."""
+    return [MCKD_FROM_CODES[(packed >> (2 * i)) & 3] for i in range(len(MT.ALL))]
+
+
+def checks_flags(packed: int) -> tuple[bool, bool, bool]:
+    """Whether packed checks are initialized (at least 1 check is not None),
+    in progress (at least 1 check is true) and completed (all checks are true).
+    """
+    return packed != 0, (packed & MCKD_ALL_TRUE) != 0, packed == MCKD_ALL_TRUE
+
+
+def pack_checks(checks: np.ndarray) -> np.ndarray:
+    """Pack an int8 (N, len(MT.ALL)) manual checks matrix into (N,) uint16 codes."""
+    codes = (checks.astype(np.int16) + 1).astype(np.uint16)
+    return np.bitwise_or.reduce(codes << MCKD_SHIFTS, axis=1).astype(np.uint16)
+
+
+def unpack_checks(packed: np.ndarray) -> np.ndarray:
+    """Unpack (N,) uint16 codes into an int8 (N, len(MT.ALL)) manual checks matrix."""
+    packed = np.asarray(packed, dtype=np.uint16)
+    return ((packed[:, None] >> MCKD_SHIFTS) & 3).astype(np.int8) - 1
+
+
+def packed_checks_flags(packed: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `checks_flags`: is_init, in_progress and completed bool arrays."""
+    packed = np.asarray(packed, dtype=np.uint16)
+    return packed != 0, (packed & MCKD_ALL_TRUE) != 0, packed == MCKD_ALL_TRUE
 
 
 def predictables_for_sqld(player, fps: list[str]) -> dict:
@@ -59,3 +168,92 @@ def check_strict(strict: bool, sqld: dict) -> None:
             if any(c in sqld for c in cols)
         ]
         assert len(all_fps_cols) == 1, "There can't be different model types in strict mode"
+
+
+# * Batch SQL dicts
+
+PLAYER_PREDICTABLES: list[str] = [
+    MT.TO_ID_NAMES[mt]
+    for mt in [
+        MT.CHARACTER,
+        MT.PERKS,
+        MT.ITEM,
+        MT.ADDONS,
+        MT.OFFERING,
+        MT.STATUS,
+        MT.POINTS,
+        MT.PRESTIGE,
+    ]
+]  # ! order is that of the PlayerIn fields
+LABELS_CREATE_COLS = ["match_id", "user_id", "extr_id"]
+
+
+def filled_predictables_signature(player) -> tuple[str, ...]:
+    """Fast `PlayerIn.filled_predictables` as a hashable tuple."""
+    return tuple(name for name in PLAYER_PREDICTABLES if getattr(player, name) is not None)
+
+
+@lru_cache(maxsize=None)
+def sqld_plan(fps: tuple[str, ...]) -> tuple[list[str], Callable[[Any], tuple]]:
+    """Columns and row getter of the SQL dicts of the players with the filled
+    predictables 'fps', equivalent to `predictables_for_sqld` plus the player ID.
+    """
+    mts = [mt for mt in MT.UNIQUE_PER_PLAYER if MT.TO_ID_NAMES[mt] in fps]
+    id_names = [MT.TO_ID_NAMES[mt] for mt in mts]
+    has_perks = MT.TO_ID_NAMES[MT.PERKS] in fps
+    has_addons = MT.TO_ID_NAMES[MT.ADDONS] in fps
+
+    cols = ["player_id"] + mts + [f"{mt}_mckd" for mt in mts]
+    if has_perks:
+        cols += SQL_COLS.PERKS + ["perks_mckd"]
+    if has_addons:
+        cols += SQL_COLS.ADDONS + ["addons_mckd"]
+
+    checks = (True,) * len(mts)
+
+    def get_row(player) -> tuple:
+        row = (player.id,) + tuple(getattr(player, name) for name in id_names) + checks
+        if has_perks:
+            row += tuple(player.perk_ids) + (True,)
+        if has_addons:
+            row += tuple(player.addon_ids) + (True,)
+        return row
+
+    return cols, get_row
+
+
+def sqlds_by_signature(
+    items: Iterable,
+    strict: bool,
+) -> dict[tuple[str, ...], tuple[list[str], list[tuple]]]:
+    """Batch version of `PlayerIn.to_sqla` for many `PlayerIns` or `LabelsCreates`.
+
+    Items are grouped by their filled predictables signature, and each group
+    gets its columns and row tuples, ready for an executemany.
+    `LabelsCreates` also get the `LABELS_CREATE_COLS` columns.
+    Strict mode is checked once per group.
+    """
+    groups: dict[tuple[str, ...], list] = {}
+    are_labels = set()
+    for item in items:
+        is_labels = hasattr(item, "player")
+        are_labels.add(is_labels)
+        player = item.player if is_labels else item
+        groups.setdefault(filled_predictables_signature(player), []).append(item)
+    assert len(are_labels) <= 1, "Items can't be a mix of PlayerIns and LabelsCreates"
+
+    params = {}
+    for fps, group in groups.items():
+        cols, get_row = sqld_plan(fps)
+        check_strict(strict, dict.fromkeys(cols))
+        if are_labels == {True}:
+            params[fps] = (
+                cols + LABELS_CREATE_COLS,
+                [
+                    get_row(labels.player) + (labels.match_id, labels.user_id, labels.extr_id)
+                    for labels in group
+                ],
+            )
+        else:
+            params[fps] = (cols, [get_row(player) for player in group])
+    return params
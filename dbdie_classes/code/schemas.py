@@ -5,14 +5,33 @@ from typing import TYPE_CHECKING, Union
 from dbdie_classes.options import PLAYER_TYPE as PT
 
 if TYPE_CHECKING:
+    from dbdie_classes.base import IsForKiller, LabelId
     from dbdie_classes.schemas.predictables import AddonOut, OfferingOut, PerkOut
 
 ALL_CHARS_IDS = {"all": 0, PT.KILLER: 1, PT.SURV: 2}
 ADDONS_IDS = {"none": 0, PT.KILLER: 1, "base": (2, 3, 4, 5, 6)}
+USER_ID_TO_IFK = {
+    ALL_CHARS_IDS["all"]: None,
+    ALL_CHARS_IDS[PT.KILLER]: True,
+    ALL_CHARS_IDS[PT.SURV]: False,
+}
+
 
 # * PlayerOut
 
 
+def perk_ifk(
+    character_id: "LabelId",
+    chars_ifk: dict["LabelId", "IsForKiller"],
+) -> "IsForKiller":
+    """Is for Killer of a perk, from its character ID: the special IDs
+    (all, killer or survivor) map directly, other perks take their character's ifk.
+    """
+    if character_id in USER_ID_TO_IFK:
+        return USER_ID_TO_IFK[character_id]
+    return chars_ifk.get(character_id)
+
+
 def check_killer_consistency(
     ifk: bool,
     obj: Union["OfferingOut", "PerkOut"],
@@ -20,6 +39,16 @@ def check_killer_consistency(
     return obj.ifk is None or (obj.ifk == ifk)
 
 
+def check_perks_consistency(
+    ifk: bool,
+    perks: list["PerkOut"],
+    chars_ifk: dict["LabelId", "IsForKiller"],
+) -> bool:
+    """Perks consistency with the `perk_ifk` rule, the same as `ConsistencyEngine`."""
+    perks_ifk = (perk_ifk(perk.character_id, chars_ifk) for perk in perks)
+    return all(p_ifk is None or (p_ifk == ifk) for p_ifk in perks_ifk)
+
+
 def check_item_consistency(ifk: bool, item_type_id: int) -> bool:
     # TODO: Decouple from addons
     return ifk == (item_type_id == ADDONS_IDS[PT.KILLER])
@@ -0,0 +1,103 @@
+"""Fixed-width little-endian binary codec for the extract classes.
+
+Each player is packed into a fixed-size record of a NumPy structured dtype,
+so whole batches are encoded with a single `tobytes` call and decoded
+as zero-copy views with `np.frombuffer`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from dbdie_classes.extract import (
+    MATCH_INFO_DTYPE,
+    PLAYER_INFO_DTYPE,
+    MatchInfoTable,
+    PlayerInfo,
+)
+
+if TYPE_CHECKING:
+    from dbdie_classes.base import EncodedInfo
+    from dbdie_classes.extract import PlayersInfoDict
+
+Buffer = bytes | bytearray | memoryview
+
+PLAYERS_INFO_DTYPE = np.dtype([("player_id", "u1")] + PLAYER_INFO_DTYPE.descr)
+ENCODED_INFO_DTYPE = np.dtype(
+    [("player_id", "u1")] + PLAYER_INFO_DTYPE.descr[:6]
+)  # ! order is that of EncodedInfo
+
+
+def _from_buffer(buf: Buffer, dtype: np.dtype) -> np.ndarray:
+    assert len(buf) % dtype.itemsize == 0, (
+        f"Buffer length must be a multiple of the record size ({dtype.itemsize} bytes)"
+    )
+    return np.frombuffer(buf, dtype=dtype)
+
+
+# * PlayerInfo
+
+
+def encode_player_infos(infos: list[PlayerInfo]) -> bytes:
+    """Pack `PlayerInfos` into `PLAYER_INFO_DTYPE` records."""
+    return np.array([info.to_record() for info in infos], dtype=PLAYER_INFO_DTYPE).tobytes()
+
+
+def decode_player_infos(buf: Buffer) -> np.ndarray:
+    """Unpack `PLAYER_INFO_DTYPE` records as a read-only structured array (no copy).
+    Use `PlayerInfo.from_record` to get back individual `PlayerInfos`.
+    """
+    return _from_buffer(buf, PLAYER_INFO_DTYPE)
+
+
+# * PlayersInfoDict
+
+
+def encode_players_info(players_info: PlayersInfoDict) -> bytes:
+    """Pack the `PlayersInfoDict` of a match into `PLAYERS_INFO_DTYPE` records."""
+    return np.array(
+        [(pid,) + info.to_record() for pid, info in players_info.items()],
+        dtype=PLAYERS_INFO_DTYPE,
+    ).tobytes()
+
+
+def decode_players_info(buf: Buffer) -> PlayersInfoDict:
+    """Unpack `PLAYERS_INFO_DTYPE` records into the `PlayersInfoDict` of a match."""
+    return {
+        int(record["player_id"]): PlayerInfo.from_record(record)
+        for record in _from_buffer(buf, PLAYERS_INFO_DTYPE)
+    }
+
+
+# * Matches
+
+
+def encode_matches(table: MatchInfoTable) -> bytes:
+    """Pack a `MatchInfoTable` into `MATCH_INFO_DTYPE` records."""
+    return table.data.tobytes()
+
+
+def decode_matches(buf: Buffer) -> MatchInfoTable:
+    """Unpack `MATCH_INFO_DTYPE` records into a `MatchInfoTable` (no copy).
+    Its rows are read-only if the buffer is, but it can still be appended to.
+    """
+    return MatchInfoTable(_from_buffer(buf, MATCH_INFO_DTYPE))
+
+
+# * EncodedInfo
+
+
+def encode_encoded_infos(encoded_infos: list["EncodedInfo"]) -> bytes:
+    """Pack `EncodedInfo` tuples into `ENCODED_INFO_DTYPE` records."""
+    return np.array(encoded_infos, dtype=ENCODED_INFO_DTYPE).tobytes()
+
+
+def decode_encoded_infos(buf: Buffer) -> list["EncodedInfo"]:
+    """Unpack `ENCODED_INFO_DTYPE` records into `EncodedInfo` tuples."""
+    return [
+        (pid, char, tuple(perks.tolist()), item, tuple(addons.tolist()), offering, status)
+        for pid, char, perks, item, addons, offering, status
+        in _from_buffer(buf, ENCODED_INFO_DTYPE).tolist()
+    ]
@@ -0,0 +1,248 @@
+"""Vectorized player consistency checks over dense catalog arrays.
+
+`ConsistencyEngine` is the batch version of `PlayerOut._check_consistency`.
+Catalog attributes (e.g. perks' ifk or addons' type) are precomputed into
+dense arrays indexed by label ID, so that the players don't need their full
+`PerkOut`, `ItemOut`, etc. to be checked, just their label IDs.
+
+Tri-state ifk arrays use -1 (None), 0 (False) and 1 (True).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+from dbdie_classes.code.schemas import ADDONS_IDS, ALL_CHARS_IDS, USER_ID_TO_IFK, perk_ifk
+from dbdie_classes.options import PLAYER_TYPE as PT
+from dbdie_classes.options import SQL_COLS
+from dbdie_classes.options.NULL_IDS import NULL_SENTINEL
+
+if TYPE_CHECKING:
+    from dbdie_classes.base import IsForKiller
+
+UNKNOWN = -2  # fill value of the catalog arrays for IDs that aren't in the catalog
+IFK_NULL = -1
+
+# Failure reasons, as bits of a uint8 bitmask
+CHARACTER  = "character"
+PERKS      = "perks"
+ITEM       = "item"
+ADDONS     = "addons"
+OFFERING   = "offering"
+STATUS     = "status"
+UNKNOWN_ID = "unknown_id"
+REASONS = [CHARACTER, PERKS, ITEM, ADDONS, OFFERING, STATUS, UNKNOWN_ID]
+REASONS_BITS = {reason: np.uint8(1 << i) for i, reason in enumerate(REASONS)}
+
+COL_IXS = {col: j for j, col in enumerate(SQL_COLS.ALL_FLATTENED)}
+TOTAL_PLAYERS = 5  # ! the killer is the last one
+
+
+def ifk_code(ifk: "IsForKiller") -> int:
+    """Tri-state ifk to its int8 code."""
+    return IFK_NULL if ifk is None else int(ifk)
+
+
+def dense_array(values: dict[int, int]) -> np.ndarray:
+    """Dense int64 array indexed by ID, with `UNKNOWN` for the missing IDs."""
+    arr = np.full(max(values, default=-1) + 1, UNKNOWN, dtype=np.int64)
+    if values:
+        arr[list(values)] = list(values.values())
+    return arr
+
+
+def explain(reasons: int) -> list[str]:
+    """Failure reasons of a reasons bitmask."""
+    return [reason for reason, bit in REASONS_BITS.items() if reasons & bit]
+
+
+def match_rules(char_ifk: np.ndarray, status_dead: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Batch version of the `FullMatchOut` rules over (N, 5) tri-state arrays of the
+    characters' ifk and the statuses' is_dead: players 0-3 can't be killers
+    and player 4 must be one. Returns a bool consistency array and
+    an int8 kills array (dead survivors).
+    """
+    assert char_ifk.shape == status_dead.shape, "Arrays must be of the same shape"
+    assert char_ifk.ndim == 2 and char_ifk.shape[1] == TOTAL_PLAYERS, (
+        f"Arrays must have {TOTAL_PLAYERS} players per match"
+    )
+    consistent = (char_ifk[:, :-1] != 1).all(axis=1) & (char_ifk[:, -1] == 1)
+    kills = (status_dead[:, :-1] == 1).sum(axis=1).astype(np.int8)
+    return consistent, kills
+
+
+class ConsistencyEngine:
+    """Vectorized consistency checks of players' label IDs.
+
+    Each catalog array is indexed by label ID, with `UNKNOWN` for the IDs
+    that aren't in the catalog:
+    - char_ifk: tri-state ifk of each character.
+    - perk_ifk: tri-state ifk of each perk.
+    - offering_ifk: tri-state ifk of each offering.
+    - item_type: type ID of each item.
+    - addon_type: type ID of each addon.
+    - status_char: special character ID of each status.
+    - status_dead: tri-state is_dead of each status (only needed for matches).
+    """
+
+    def __init__(
+        self,
+        char_ifk: np.ndarray,
+        perk_ifk: np.ndarray,
+        offering_ifk: np.ndarray,
+        item_type: np.ndarray,
+        addon_type: np.ndarray,
+        status_char: np.ndarray,
+        status_dead: np.ndarray | None = None,
+    ) -> None:
+        self.char_ifk = char_ifk
+        self.perk_ifk = perk_ifk
+        self.offering_ifk = offering_ifk
+        self.item_type = item_type
+        self.addon_type = addon_type
+        self.status_char = status_char
+        self.status_dead = status_dead
+
+    @classmethod
+    def from_catalogs(
+        cls,
+        characters: Iterable,
+        perks: Iterable,
+        items: Iterable,
+        addons: Iterable,
+        offerings: Iterable,
+        statuses: Iterable,
+    ) -> ConsistencyEngine:
+        """Create `ConsistencyEngine` from the predictables' output schemas
+        (or their SQLAlchemy models).
+        """
+        chars_ifk = {c.id: c.ifk for c in characters}
+        return cls(
+            char_ifk=dense_array({cid: ifk_code(ifk) for cid, ifk in chars_ifk.items()}),
+            perk_ifk=dense_array(
+                {p.id: ifk_code(perk_ifk(p.character_id, chars_ifk)) for p in perks}
+            ),
+            offering_ifk=dense_array(
+                {o.id: ifk_code(USER_ID_TO_IFK.get(o.user_id)) for o in offerings}
+            ),
+            item_type=dense_array({i.id: i.type_id for i in items}),
+            addon_type=dense_array({a.id: a.type_id for a in addons}),
+            status_char=dense_array({s.id: s.character_id for s in statuses}),
+            status_dead=dense_array({s.id: ifk_code(s.is_dead) for s in statuses}),
+        )
+
+    @staticmethod
+    def _lookup(arr: np.ndarray, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Catalog values of the IDs, plus their null and unknown masks."""
+        is_null = ids == NULL_SENTINEL
+        is_known = (ids >= 0) & (ids < arr.shape[0])
+        values = np.full(ids.shape, UNKNOWN, dtype=np.int64)
+        values[is_known] = arr[ids[is_known]]
+        is_known &= values != UNKNOWN
+        return values, is_null, ~is_null & ~is_known
+
+    def _tri_state(self, arr: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """Tri-state catalog values of the IDs, with `IFK_NULL` for null and unknown IDs."""
+        values, is_null, is_unk = self._lookup(arr, np.asarray(ids, dtype=np.int64))
+        values[is_null | is_unk] = IFK_NULL
+        return values
+
+    def check(self, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Check the consistency of an (N, len(SQL_COLS.ALL_FLATTENED)) label IDs
+        matrix, e.g. that of `labels_models_to_matrices` or `LabelsBatch`,
+        with `NULL_SENTINEL` for nulls.
+
+        Null labels aren't checked, and neither are the labels of the players
+        whose character is null. Returns a bool consistency array and
+        a uint8 failure reasons bitmask array (see `explain`).
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        assert ids.ndim == 2 and ids.shape[1] == len(COL_IXS), (
+            "IDs must be laid out as SQL_COLS.ALL_FLATTENED"
+        )
+
+        def cols(sql_cols: list[str]) -> np.ndarray:
+            return ids[:, [COL_IXS[col] for col in sql_cols]]
+
+        char_ifk, char_null, char_unk = self._lookup(self.char_ifk, cols(SQL_COLS.CHARACTER))
+        perk_ifk, perks_null, perks_unk = self._lookup(self.perk_ifk, cols(SQL_COLS.PERKS))
+        item_type, item_null, item_unk = self._lookup(self.item_type, cols(SQL_COLS.ITEM))
+        addon_type, addons_null, addons_unk = self._lookup(self.addon_type, cols(SQL_COLS.ADDONS))
+        off_ifk, off_null, off_unk = self._lookup(self.offering_ifk, cols(SQL_COLS.OFFERING))
+        status_char, status_null, status_unk = self._lookup(self.status_char, cols(SQL_COLS.STATUS))
+
+        ifk = char_ifk == 1  # (N, 1), broadcasts against the other columns
+        to_check = ~char_null & ~char_unk & (char_ifk != IFK_NULL)
+
+        def fails(wrong: np.ndarray, is_null: np.ndarray, is_unk: np.ndarray) -> np.ndarray:
+            return (to_check & wrong & ~is_null & ~is_unk).any(axis=1)
+
+        failures = {
+            CHARACTER: (~char_null & ~char_unk & (char_ifk == IFK_NULL)).any(axis=1),
+            PERKS: fails((perk_ifk != IFK_NULL) & ((perk_ifk == 1) != ifk), perks_null, perks_unk),
+            ITEM: fails(
+                (item_type == ADDONS_IDS[PT.KILLER]) != ifk,
+                item_null,
+                item_unk,
+            ),
+            ADDONS: fails(
+                (addon_type != ADDONS_IDS["none"])
+                & ((addon_type == ADDONS_IDS[PT.KILLER]) != ifk),
+                addons_null,
+                addons_unk,
+            ),
+            OFFERING: fails((off_ifk != IFK_NULL) & ((off_ifk == 1) != ifk), off_null, off_unk),
+            STATUS: fails(
+                ~(
+                    (status_char == ALL_CHARS_IDS["all"])
+                    | ((status_char == ALL_CHARS_IDS[PT.SURV]) == ~ifk)
+                    | ((status_char == ALL_CHARS_IDS[PT.KILLER]) == ifk)
+                ),
+                status_null,
+                status_unk,
+            ),
+            UNKNOWN_ID: np.hstack(
+                [char_unk, perks_unk, item_unk, addons_unk, off_unk, status_unk]
+            ).any(axis=1),
+        }
+
+        reasons = np.zeros(ids.shape[0], dtype=np.uint8)
+        for reason, failed in failures.items():
+            reasons[failed] |= REASONS_BITS[reason]
+        return reasons == 0, reasons
+
+    def check_matches(
+        self,
+        char_ids: np.ndarray,
+        status_ids: np.ndarray,
+        players_consistent: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Batch `FullMatchOut` consistency and kills of (N, 5) character and
+        status IDs arrays (see `match_rules`). If given, the (N, 5) players'
+        consistency (see `check`) is also required for a match to be consistent.
+        """
+        assert self.status_dead is not None, "Statuses' is_dead are needed for matches"
+        consistent, kills = match_rules(
+            self._tri_state(self.char_ifk, char_ids),
+            self._tri_state(self.status_dead, status_ids),
+        )
+        if players_consistent is not None:
+            consistent &= np.asarray(players_consistent).all(axis=1)
+        return consistent, kills
+
+    def check_matches_labels(self, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Batch `FullMatchOut` consistency (players' included) and kills
+        of an (N, 5, len(SQL_COLS.ALL_FLATTENED)) label IDs array.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        assert ids.ndim == 3 and ids.shape[1] == TOTAL_PLAYERS, (
+            f"IDs must have {TOTAL_PLAYERS} players per match"
+        )
+        players_consistent, _ = self.check(ids.reshape(-1, ids.shape[2]))
+        return self.check_matches(
+            ids[:, :, COL_IXS[SQL_COLS.CHARACTER[0]]],
+            ids[:, :, COL_IXS[SQL_COLS.STATUS[0]]],
+            players_consistent.reshape(-1, TOTAL_PLAYERS),
+        )
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
-    from dbdie_classes.base import CropCoordsRaw, ImgSize, LabelId, PlayerId
+    from dbdie_classes.base import (
+        CropCoordsRaw, FullModelType, ImgSize, LabelId, MatchId, PlayerId
+    )
 
 
 @dataclass(eq=True)
@@ -23,6 +28,10 @@ class CropCoords:
         """Get crop in raw fom: 4-int-tuple LTRB."""
         return (self.left, self.top, self.right, self.bottom)
 
+    def view(self, img: np.ndarray) -> np.ndarray:
+        """Apply crop to an HxW(xC) image, returning a strided view (no copy)."""
+        return img[self.top:self.bottom, self.left:self.right]
+
     def __iter__(self):
         return self
 
@@ -54,7 +63,9 @@ class CropCoords:
         )
 
     def check_overlap(self, cc: CropCoords) -> bool:
-        """Check if 2 crops of the SAME SIZE overlap."""
+        """Check if 2 crops overlap.
+        Use `find_overlapping_pairs` for checking a whole layout.
+        """
         return not (
             (cc.right <= self.left)
             or (self.right <= cc.left)
@@ -63,6 +74,358 @@ class CropCoords:
         )
 
 
+@dataclass(eq=False)
+class CropCoordsArray:
+    """Many crop coordinates stored as a (N, 4) int32 LTRB array.
+
+    Vectorized counterpart of `CropCoords`: every method works on all crops
+    at once and returns NumPy arrays instead of Python scalars.
+    """
+
+    coords: np.ndarray
+
+    def __post_init__(self):
+        self.coords = np.asarray(self.coords, dtype=np.int32).reshape(-1, 4)
+
+    @classmethod
+    def from_crops(cls, crops: list[CropCoords]) -> CropCoordsArray:
+        """Create `CropCoordsArray` from a list of `CropCoords`."""
+        return cls(np.array([cc.raw() for cc in crops], dtype=np.int32))
+
+    @classmethod
+    def from_players(cls, players_crops: PlayersCropCoords) -> CropCoordsArray:
+        """Create `CropCoordsArray` from a `PlayersCropCoords` dict,
+        with the crops sorted by player ID.
+        """
+        return cls.from_crops([players_crops[pid] for pid in sorted(players_crops)])
+
+    def to_crops(self) -> list[CropCoords]:
+        """Convert to a list of `CropCoords`."""
+        return [CropCoords(*raw) for raw in self.coords.tolist()]
+
+    def to_players(
+        self,
+        player_ids: list["PlayerId"] | None = None,
+    ) -> PlayersCropCoords:
+        """Convert to a `PlayersCropCoords` dict.
+        Player IDs default to 0, 1, ..., N-1.
+        """
+        if player_ids is None:
+            player_ids = list(range(len(self)))
+        assert len(player_ids) == len(self), "There must be 1 player ID per crop"
+        return {pid: cc for pid, cc in zip(player_ids, self.to_crops())}
+
+    def __len__(self) -> int:
+        return self.coords.shape[0]
+
+    def __getitem__(self, key) -> CropCoords | CropCoordsArray:
+        """Integer keys return a `CropCoords`, any other key a `CropCoordsArray`."""
+        if isinstance(key, (int, np.integer)):
+            return CropCoords(*self.coords[key].tolist())
+        return CropCoordsArray(self.coords[key])
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CropCoordsArray):
+            return NotImplemented
+        return np.array_equal(self.coords, other.coords)
+
+    @property
+    def left(self) -> np.ndarray:
+        return self.coords[:, 0]
+
+    @property
+    def top(self) -> np.ndarray:
+        return self.coords[:, 1]
+
+    @property
+    def right(self) -> np.ndarray:
+        return self.coords[:, 2]
+
+    @property
+    def bottom(self) -> np.ndarray:
+        return self.coords[:, 3]
+
+    @property
+    def shapes(self) -> np.ndarray:
+        """Shapes of the crops as a (N, 2) array of (width, height)."""
+        return self.coords[:, 2:] - self.coords[:, :2]
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Sizes of the crops in square px as a (N,) array."""
+        shapes = self.shapes.astype(np.int64)
+        return shapes[:, 0] * shapes[:, 1]
+
+    def is_fully_inside(self, cc: CropCoords | CropCoordsArray) -> np.ndarray:
+        """Check if each crop is fully inside the 'cc' crop(s).
+        'cc' is broadcast: either a single crop or one crop per crop.
+        """
+        return _is_fully_inside(self.coords, _as_coords(cc))
+
+    def check_overlap(self, cc: CropCoords | CropCoordsArray) -> np.ndarray:
+        """Check if each crop overlaps the 'cc' crop(s).
+        'cc' is broadcast: either a single crop or one crop per crop.
+        """
+        return _check_overlap(self.coords, _as_coords(cc))
+
+    def is_fully_inside_matrix(self, other: CropCoordsArray) -> np.ndarray:
+        """(N, M) matrix: whether crop i is fully inside crop j of 'other'."""
+        return _is_fully_inside(self.coords[:, None], other.coords[None, :])
+
+    def overlap_matrix(self, other: CropCoordsArray) -> np.ndarray:
+        """(N, M) matrix: whether crop i overlaps crop j of 'other'."""
+        return _check_overlap(self.coords[:, None], other.coords[None, :])
+
+    def overlapping_pairs(self) -> np.ndarray:
+        """All pairs of overlapping crops, of any size (see `find_overlapping_pairs`)."""
+        return find_overlapping_pairs(self)
+
+
+def find_overlapping_pairs(crops: CropCoordsArray | list[CropCoords]) -> np.ndarray:
+    """Find all pairs of overlapping crops, which can be of different sizes.
+    Returns a (K, 2) array of crop indices (i < j), sorted lexicographically.
+
+    Hierarchical uniform grid: level L cells are 2^L times the median crop shape,
+    and each crop belongs to the lowest level whose cells are at least its size.
+    At its level and the ones above a crop covers at most 2x2 cells, so that the
+    work doesn't depend on the crops' area. A pair is checked at the level of
+    its biggest crop, only in the cell that holds the top-left corner of their
+    intersection, so that no pair is repeated.
+    """
+    if not isinstance(crops, CropCoordsArray):
+        crops = CropCoordsArray.from_crops(crops)
+    n = len(crops)
+    if n < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    coords = crops.coords.astype(np.int64)
+    shapes = coords[:, 2:] - coords[:, :2]
+    base = np.maximum(np.median(shapes, axis=0), 1.0)
+    ratios = np.maximum((shapes / base).max(axis=1), 1.0)
+    levels = np.ceil(np.log2(ratios)).astype(np.int64)
+
+    pairs = [
+        _level_pairs(
+            coords,
+            ixs=np.flatnonzero(levels <= level),
+            is_native=levels[levels <= level] == level,
+            cell=np.ceil(base * 2.0 ** level).astype(np.int64),
+        )
+        for level in np.unique(levels).tolist()
+    ]
+    pairs = np.concatenate(pairs)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def _level_pairs(
+    coords: np.ndarray,
+    ixs: np.ndarray,
+    is_native: np.ndarray,
+    cell: np.ndarray,
+) -> np.ndarray:
+    """Overlapping pairs of a `find_overlapping_pairs` grid level, with at least
+    one crop of this level ('is_native'), as a (K, 2) array of indices of 'coords'.
+    """
+    level_coords = coords[ixs]
+    cells_lt = level_coords[:, :2] // cell
+    cells_rb = np.maximum((level_coords[:, 2:] - 1) // cell, cells_lt)
+    cells_wh = cells_rb - cells_lt + 1
+
+    # * (cell, crop) entries, grouped by cell, with the level's crops first
+
+    counts = cells_wh[:, 0] * cells_wh[:, 1]
+    crop_ix = np.repeat(np.arange(ixs.size), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    cells_x = cells_lt[crop_ix, 0] + local % cells_wh[crop_ix, 0]
+    cells_y = cells_lt[crop_ix, 1] + local // cells_wh[crop_ix, 0]
+
+    order = np.lexsort((crop_ix, ~is_native[crop_ix], cells_y, cells_x))
+    crop_ix, cells_x, cells_y = crop_ix[order], cells_x[order], cells_y[order]
+    is_new = np.ones(crop_ix.size, dtype=bool)
+    is_new[1:] = (cells_x[1:] != cells_x[:-1]) | (cells_y[1:] != cells_y[:-1])
+    group_starts = np.flatnonzero(is_new)
+    stops = np.repeat(np.append(group_starts[1:], crop_ix.size), np.diff(np.append(group_starts, crop_ix.size)))
+
+    # * Candidate pairs within each cell: each level's crop with the ones after it
+
+    starts = np.arange(1, crop_ix.size + 1)
+    pair_counts = np.where(is_native[crop_ix], stops - starts, 0)
+    first = np.repeat(np.arange(crop_ix.size), pair_counts)
+    offsets = np.arange(pair_counts.sum()) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+    second = np.repeat(starts, pair_counts) + offsets
+
+    a, b = ixs[crop_ix[first]], ixs[crop_ix[second]]
+    mask = _check_overlap(coords[a], coords[b])
+    inter_lt = np.maximum(coords[a, :2], coords[b, :2]) // cell
+    mask &= (inter_lt[:, 0] == cells_x[first]) & (inter_lt[:, 1] == cells_y[first])
+    return np.sort(np.stack([a[mask], b[mask]], axis=1), axis=1)
+
+
+def _as_coords(cc: CropCoords | CropCoordsArray) -> np.ndarray:
+    """Get the raw LTRB array of the crop(s)."""
+    if isinstance(cc, CropCoords):
+        return np.array(cc.raw(), dtype=np.int32)
+    return cc.coords
+
+
+def _is_fully_inside(inner: np.ndarray, outer: np.ndarray) -> np.ndarray:
+    """Broadcasted `CropCoords.is_fully_inside` over raw LTRB arrays."""
+    return (
+        (outer[..., 0] <= inner[..., 0])
+        & (inner[..., 2] <= outer[..., 2])
+        & (outer[..., 1] <= inner[..., 1])
+        & (inner[..., 3] <= outer[..., 3])
+    )
+
+
+def _check_overlap(ccs_a: np.ndarray, ccs_b: np.ndarray) -> np.ndarray:
+    """Broadcasted `CropCoords.check_overlap` over raw LTRB arrays."""
+    return ~(
+        (ccs_b[..., 2] <= ccs_a[..., 0])
+        | (ccs_a[..., 2] <= ccs_b[..., 0])
+        | (ccs_b[..., 3] <= ccs_a[..., 1])
+        | (ccs_a[..., 3] <= ccs_b[..., 1])
+    )
+
+
+def _check_inside_img(crops: CropCoordsArray, img: np.ndarray) -> None:
+    img_crop = CropCoords(0, 0, img.shape[1], img.shape[0])
+    assert (
+        (crops.shapes >= 0).all() and crops.is_fully_inside(img_crop).all()
+    ), "All crops must be fully inside the image"
+
+
+def crop_views(
+    img: np.ndarray,
+    crops: CropCoordsArray | list[CropCoords],
+) -> list[np.ndarray]:
+    """Apply many crops to an HxW(xC) image, returning strided views (no copies)."""
+    if not isinstance(crops, CropCoordsArray):
+        crops = CropCoordsArray.from_crops(crops)
+    _check_inside_img(crops, img)
+    return [img[y0:y1, x0:x1] for x0, y0, x1, y1 in crops.coords.tolist()]
+
+
+def crop_batch(
+    img: np.ndarray,
+    crops: CropCoordsArray | list[CropCoords],
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Apply many same-shape crops to an HxW(xC) image and write them
+    straight into a contiguous (N, h, w(, C)) buffer, without intermediate copies.
+
+    'out' can be a preallocated buffer (e.g. a slice of a bigger batch).
+    """
+    if not isinstance(crops, CropCoordsArray):
+        crops = CropCoordsArray.from_crops(crops)
+    _check_inside_img(crops, img)
+
+    shapes = crops.shapes
+    assert (shapes == shapes[:1]).all(), "All crops must have the same shape"
+    w, h = shapes[0].tolist() if len(crops) else (0, 0)
+
+    exp_shape = (len(crops), h, w, *img.shape[2:])
+    if out is None:
+        out = np.empty(exp_shape, dtype=img.dtype)
+    else:
+        assert out.shape == exp_shape, f"Output buffer must have shape {exp_shape}"
+
+    for i, (x0, y0, x1, y1) in enumerate(crops.coords.tolist()):
+        out[i] = img[y0:y1, x0:x1]
+    return out
+
+
+class CropLayout:
+    """Full crop layout of a reference image size: the players' crops
+    plus the per-FMT sub-crops (relative to the player crop).
+
+    Rescaling to another `ImgSize` is a single vectorized operation over all
+    the crops, and its results are memoized in a bounded LRU cache.
+    """
+
+    def __init__(
+        self,
+        img_size: "ImgSize",
+        players_crops: PlayersCropCoords,
+        fmts_crops: dict["FullModelType", list[CropCoords]],
+        cache_size: int = 16,
+    ) -> None:
+        assert cache_size > 0, "Cache size must be positive"
+        self.img_size = tuple(img_size)
+        self.cache_size = cache_size
+        self._player_ids = list(players_crops)
+        self._fmts_lens = {fmt: len(crops) for fmt, crops in fmts_crops.items()}
+        self._coords = CropCoordsArray.from_crops(
+            list(players_crops.values())
+            + [cc for crops in fmts_crops.values() for cc in crops]
+        )
+        self._cache: OrderedDict["ImgSize", CropLayout] = OrderedDict()
+
+    @classmethod
+    def _from_coords(
+        cls,
+        img_size: "ImgSize",
+        coords: CropCoordsArray,
+        like: CropLayout,
+    ) -> CropLayout:
+        """Create `CropLayout` from already stacked coords, copying the structure of 'like'."""
+        layout = cls.__new__(cls)
+        layout.img_size = tuple(img_size)
+        layout.cache_size = like.cache_size
+        layout._player_ids = like._player_ids
+        layout._fmts_lens = like._fmts_lens
+        layout._coords = coords
+        layout._cache = OrderedDict()
+        return layout
+
+    @property
+    def players_crops(self) -> PlayersCropCoords:
+        """Players' crops."""
+        return self._coords[:len(self._player_ids)].to_players(self._player_ids)
+
+    @property
+    def fmts_crops(self) -> dict["FullModelType", list[CropCoords]]:
+        """Sub-crops of each full model type."""
+        fmts_crops = {}
+        start = len(self._player_ids)
+        for fmt, fmt_len in self._fmts_lens.items():
+            fmts_crops[fmt] = self._coords[start:start + fmt_len].to_crops()
+            start += fmt_len
+        return fmts_crops
+
+    def _rescale_coords(self, img_size: "ImgSize") -> CropCoordsArray:
+        """Rescale the origin and the shape of the crops separately, so that crops
+        of the same shape (e.g. the sub-crops of a FMT) keep a shared shape.
+        Origins are clipped so that the crops don't go past the image.
+        """
+        scale = np.array(img_size, dtype=np.float64) / np.array(self.img_size)
+        coords = self._coords.coords
+        shapes = np.rint((coords[:, 2:] - coords[:, :2]) * scale).astype(np.int32)
+        shapes = np.minimum(shapes, np.array(img_size, dtype=np.int32))
+        origins = np.rint(coords[:, :2] * scale).astype(np.int32)
+        origins = np.minimum(origins, np.array(img_size, dtype=np.int32) - shapes)
+        return CropCoordsArray(np.hstack([origins, origins + shapes]))
+
+    def rescale(self, img_size: "ImgSize") -> CropLayout:
+        """`CropLayout` rescaled to the target image size (memoized)."""
+        img_size = tuple(img_size)
+        if img_size == self.img_size:
+            return self
+
+        try:
+            self._cache.move_to_end(img_size)
+            return self._cache[img_size]
+        except KeyError:
+            pass
+
+        layout = CropLayout._from_coords(img_size, self._rescale_coords(img_size), like=self)
+
+        self._cache[img_size] = layout
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return layout
+
+
 @dataclass
 class PlayerInfo:
     """Integer-encoded DBD information of a player snippet."""
@@ -76,6 +439,159 @@ class PlayerInfo:
     points:       int
     prestige:     int
 
+    def to_record(self) -> tuple:
+        """To a record of `PLAYER_INFO_DTYPE`."""
+        return (
+            self.character_id,
+            self.perks_ids,
+            self.item_id,
+            self.addons_ids,
+            self.offering_id,
+            self.status_id,
+            self.points,
+            self.prestige,
+        )
+
+    @classmethod
+    def from_record(cls, record) -> PlayerInfo:
+        """Create `PlayerInfo` from a record of `PLAYER_INFO_DTYPE`
+        (or of any structured dtype that includes its fields).
+        """
+        return cls(
+            character_id=int(record["character"]),
+            perks_ids=tuple(record["perks"].tolist()),
+            item_id=int(record["item"]),
+            addons_ids=tuple(record["addons"].tolist()),
+            offering_id=int(record["offering"]),
+            status_id=int(record["status"]),
+            points=int(record["points"]),
+            prestige=int(record["prestige"]),
+        )
+
 
 PlayersCropCoords = dict["PlayerId", CropCoords]
 PlayersInfoDict   = dict["PlayerId", PlayerInfo]
+
+PLAYER_INFO_DTYPE = np.dtype(
+    [
+        ("character", "<i2"),
+        ("perks",     "<i2", (4,)),
+        ("item",      "<i2"),
+        ("addons",    "<i2", (2,)),
+        ("offering",  "<i2"),
+        ("status",    "<i2"),
+        ("points",    "<i4"),
+        ("prestige",  "<i2"),
+    ]
+)  # ! order is that of PlayerInfo
+MATCH_INFO_DTYPE = np.dtype(
+    [("match_id", "<i8"), ("player_id", "u1")] + PLAYER_INFO_DTYPE.descr
+)
+
+
+class MatchInfoTable:
+    """Columnar table of players' info keyed by (MatchId, PlayerId).
+    Backed by a growable `MATCH_INFO_DTYPE` NumPy structured array,
+    so each player costs a fixed `MATCH_INFO_DTYPE.itemsize` bytes.
+    Match lookups use a lazily sorted match ID index, rebuilt after appends.
+    """
+
+    def __init__(self, data: np.ndarray | None = None, capacity: int = 1024) -> None:
+        if data is None:
+            self._buffer = np.empty(capacity, dtype=MATCH_INFO_DTYPE)
+            self._size = 0
+        else:
+            assert data.dtype == MATCH_INFO_DTYPE, "Data must be of MATCH_INFO_DTYPE"
+            self._buffer = data
+            self._size = data.shape[0]
+        self._match_index: tuple[np.ndarray, np.ndarray] | None = None
+
+    @classmethod
+    def from_matches(
+        cls,
+        matches: dict["MatchId", PlayersInfoDict],
+    ) -> MatchInfoTable:
+        """Create `MatchInfoTable` from `PlayersInfoDicts` keyed by match ID."""
+        records = [
+            (mid, pid) + info.to_record()
+            for mid, players_info in matches.items()
+            for pid, info in players_info.items()
+        ]
+        return cls(np.array(records, dtype=MATCH_INFO_DTYPE))
+
+    @property
+    def data(self) -> np.ndarray:
+        """Filled part of the underlying structured array (a view)."""
+        return self._buffer[:self._size]
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return MATCH_INFO_DTYPE.names
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, key) -> np.ndarray | MatchInfoTable:
+        """Column names return a column (a view), other keys a `MatchInfoTable`."""
+        if isinstance(key, str):
+            return self.data[key]
+        return MatchInfoTable(np.atleast_1d(self.data[key]))
+
+    def _reserve(self, extra: int) -> None:
+        """Grow the buffer (amortized doubling) to fit 'extra' more rows."""
+        needed = self._size + extra
+        if needed > self._buffer.shape[0]:
+            new_buffer = np.empty(
+                max(needed, 2 * self._buffer.shape[0]),
+                dtype=MATCH_INFO_DTYPE,
+            )
+            new_buffer[:self._size] = self.data
+            self._buffer = new_buffer
+
+    def append(self, match_id: "MatchId", player_id: "PlayerId", info: PlayerInfo) -> None:
+        """Append the `PlayerInfo` of a player."""
+        self._reserve(1)
+        self._buffer[self._size] = (match_id, player_id) + info.to_record()
+        self._size += 1
+        self._match_index = None
+
+    def append_match(self, match_id: "MatchId", players_info: PlayersInfoDict) -> None:
+        """Append the `PlayerInfos` of a whole match."""
+        self.extend(MatchInfoTable.from_matches({match_id: players_info}))
+
+    def extend(self, other: MatchInfoTable) -> None:
+        """Append all the rows of another `MatchInfoTable`."""
+        self._reserve(len(other))
+        self._buffer[self._size:self._size + len(other)] = other.data
+        self._size += len(other)
+        self._match_index = None
+
+    def player_info(self, index: int) -> PlayerInfo:
+        """`PlayerInfo` of the row in position 'index'."""
+        return PlayerInfo.from_record(self.data[index])
+
+    def match_rows(self, match_id: "MatchId") -> np.ndarray:
+        """Row positions of a match, in insertion order, with a binary search
+        over the sorted match ID index.
+        """
+        if self._match_index is None:
+            order = np.argsort(self.data["match_id"], kind="stable")
+            self._match_index = (order, self.data["match_id"][order])
+        order, sorted_ids = self._match_index
+        start = np.searchsorted(sorted_ids, match_id, side="left")
+        stop = np.searchsorted(sorted_ids, match_id, side="right")
+        return order[start:stop]
+
+    def players_info(self, match_id: "MatchId") -> PlayersInfoDict:
+        """`PlayersInfoDict` of a match."""
+        rows = self.data[self.match_rows(match_id)]
+        return {int(row["player_id"]): PlayerInfo.from_record(row) for row in rows}
+
+    def to_matches(self) -> dict["MatchId", PlayersInfoDict]:
+        """Convert to `PlayersInfoDicts` keyed by match ID."""
+        matches: dict["MatchId", PlayersInfoDict] = {}
+        for row in self.data:
+            matches.setdefault(int(row["match_id"]), {})[int(row["player_id"])] = (
+                PlayerInfo.from_record(row)
+            )
+        return matches
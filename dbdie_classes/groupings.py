@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 from dbdie_classes.options.PLAYER_TYPE import ifk_to_pt
 from dbdie_classes.options.FMT import from_fmts
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(frozen=True, kw_only=True)
 class PredictableTuple:
     """Predictable tuple: full model type, model type and killer boolean."""
     fmt: "FullModelType"
@@ -30,13 +30,23 @@ class PredictableTuple:
         return self.fmt, self.mt, self.ifk
 
 
-@dataclass(eq=False, kw_only=True)
+@dataclass(frozen=True, eq=False, kw_only=True)
 class PredictableTuples:
     """Predictable types: full model types, model types and killer boolean.
     The 3 lists must be synched so that they can be looped at the same time.
+
+    It's immutable, so its columns and its full model type index are computed
+    once, and it can be safely shared and looped concurrently.
     """
-    pred_tuples: list[PredictableTuple]
-    index: int = 0  # ! DO NOT USE
+    pred_tuples: tuple[PredictableTuple, ...]
+
+    def __post_init__(self):
+        pred_tuples = tuple(self.pred_tuples)
+        object.__setattr__(self, "pred_tuples", pred_tuples)
+        object.__setattr__(self, "_fmts", tuple(pt.fmt for pt in pred_tuples))
+        object.__setattr__(self, "_mts", tuple(pt.mt for pt in pred_tuples))
+        object.__setattr__(self, "_ifks", tuple(pt.ifk for pt in pred_tuples))
+        object.__setattr__(self, "_index", {pt.fmt: pt for pt in pred_tuples})
 
     @classmethod
     def from_fmts(cls, fmts: list["FullModelType"]) -> PredictableTuples:
@@ -53,43 +63,47 @@ class PredictableTuples:
     ) -> PredictableTuples:
         """Create `PredictableTuples` from 3 synched lists."""
         return cls(
-            pred_tuples=[
+            pred_tuples=tuple(
                 PredictableTuple(fmt=fmt, mt=mt, ifk=ifk)
                 for fmt, mt, ifk in zip(fmts, mts, ifks)
-            ]
+            )
         )
 
-    def __iter__(self):
-        return self
+    def __iter__(self) -> Iterator[PredictableTuple]:
+        return iter(self.pred_tuples)
+
+    def __len__(self) -> int:
+        return len(self.pred_tuples)
+
+    def __getitem__(self, index: int) -> PredictableTuple:
+        return self.pred_tuples[index]
+
+    def __contains__(self, fmt: "FullModelType") -> bool:
+        return fmt in self._index
 
-    def __next__(self) -> PredictableTuple:
-        try:
-            pred_tuple = self.pred_tuples[self.index]
-        except IndexError:
-            self.index = 0
-            raise StopIteration
-        self.index += 1
-        return pred_tuple
+    def get(self, fmt: "FullModelType") -> PredictableTuple | None:
+        """Get the `PredictableTuple` of a full model type (None if not present)."""
+        return self._index.get(fmt)
 
     @property
     def fmts(self) -> list["FullModelType"]:
         """Full model types."""
-        return [pred_tuple.fmt for pred_tuple in self]
+        return list(self._fmts)
 
     @property
     def mts(self) -> list["ModelType"]:
         """Model types."""
-        return [pred_tuple.mt for pred_tuple in self]
+        return list(self._mts)
 
     @property
     def ifks(self) -> list["IsForKiller"]:
         """Killer booleans."""
-        return [pred_tuple.ifk for pred_tuple in self]
+        return list(self._ifks)
 
     @property
     def pts(self) -> list["PlayerType"]:
         """Player types."""
-        return [ifk_to_pt(pred_tuple.ifk) for pred_tuple in self]
+        return [ifk_to_pt(ifk) for ifk in self._ifks]
 
     def to_lists(self) -> tuple[list["FullModelType"], list["ModelType"], list["IsForKiller"]]:
         """Return data as a 3-tuple of lists."""
@@ -0,0 +1,104 @@
+"""Dense `LabelRef` decoders, to decode batched model predictions in one call.
+
+Label refs live in '{LABELS_REF_FD_RP}/{fmt}.csv' (or its inference
+counterpart), with a 'label_id' and a 'name' column. The row number
+of each label is the class index of the models' outputs.
+"""
+
+from __future__ import annotations
+
+from os.path import join
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+import pandas as pd
+
+from dbdie_classes.paths import INFERENCE_LABELS_REF_FD_RP, LABELS_REF_FD_RP, absp
+
+if TYPE_CHECKING:
+    from dbdie_classes.base import FullModelType, LabelId, LabelName, LabelRef, Path
+
+LABEL_REF_EXT = ".csv"
+LABEL_REF_COLS = ["label_id", "name"]
+NULL_CODE = -1  # name code of the label IDs that aren't in the label ref
+
+
+def label_ref_path(fmt: "FullModelType", is_inference: bool = False) -> "Path":
+    """Absolute path of the label ref file of a full model type."""
+    fd_rp = INFERENCE_LABELS_REF_FD_RP if is_inference else LABELS_REF_FD_RP
+    return absp(join(fd_rp, fmt + LABEL_REF_EXT))
+
+
+class LabelRefDecoder:
+    """Compiled `LabelRef` of a full model type.
+
+    - label_ids: (C,) class index -> `LabelId`.
+    - name_codes: (max_id + 1,) `LabelId` -> name code (`NULL_CODE` if missing).
+    - names: (K,) name code -> `LabelName`.
+    - name_to_id: `LabelName` -> `LabelId` (the first one if names repeat).
+    """
+
+    def __init__(self, label_ids: np.ndarray, names: list["LabelName"]) -> None:
+        label_ids = np.asarray(label_ids, dtype=np.int64)
+        assert label_ids.ndim == 1, "Label IDs must be a 1D array"
+        assert label_ids.shape[0] == len(names), "There must be 1 name per label ID"
+        assert (label_ids >= 0).all(), "Label IDs can't be negative"
+        assert np.unique(label_ids).size == label_ids.size, "Label IDs can't repeat"
+
+        self.label_ids = label_ids
+        unique_names, codes = np.unique(np.array(names, dtype=object), return_inverse=True)
+        self.names = unique_names
+        self.name_codes = np.full(label_ids.max(initial=-1) + 1, NULL_CODE, dtype=np.int32)
+        self.name_codes[label_ids] = codes
+        self.name_to_id: dict["LabelName", "LabelId"] = {}
+        for label_id, name in zip(label_ids.tolist(), names):
+            self.name_to_id.setdefault(name, label_id)
+
+    @classmethod
+    def from_label_ref(cls, label_ref: "LabelRef") -> LabelRefDecoder:
+        """Create `LabelRefDecoder` from a `LabelRef` (class indices in its order)."""
+        return cls(np.fromiter(label_ref.keys(), dtype=np.int64), list(label_ref.values()))
+
+    @classmethod
+    def from_csv(cls, path: "Path") -> LabelRefDecoder:
+        """Create `LabelRefDecoder` from a label ref file."""
+        df = pd.read_csv(path, usecols=LABEL_REF_COLS, dtype={"label_id": np.int64, "name": str})
+        return cls(df["label_id"].to_numpy(), df["name"].tolist())
+
+    @classmethod
+    def from_fmt(cls, fmt: "FullModelType", is_inference: bool = False) -> LabelRefDecoder:
+        """Create `LabelRefDecoder` from the label ref file of a full model type."""
+        return cls.from_csv(label_ref_path(fmt, is_inference))
+
+    def __len__(self) -> int:
+        return self.label_ids.shape[0]
+
+    def to_label_ref(self) -> "LabelRef":
+        """Back to a `LabelRef`."""
+        return dict(zip(self.label_ids.tolist(), self.decode_names_of_ids(self.label_ids).tolist()))
+
+    def decode_ids(self, indices: np.ndarray) -> np.ndarray:
+        """Class indices (e.g. (N,) argmax or (N, k) top-k arrays) to `LabelIds`."""
+        return self.label_ids[indices]
+
+    def decode_names_of_ids(self, label_ids: np.ndarray) -> np.ndarray:
+        """`LabelIds` to a `LabelNames` object array of the same shape."""
+        codes = self.name_codes[label_ids]
+        assert (codes != NULL_CODE).all(), "All label IDs must be in the label ref"
+        return self.names[codes]
+
+    def decode_names(self, indices: np.ndarray) -> np.ndarray:
+        """Class indices (e.g. (N,) argmax or (N, k) top-k arrays) to `LabelNames`."""
+        return self.names[self.name_codes[self.label_ids[indices]]]
+
+    def encode_ids(self, names: Iterable["LabelName"]) -> np.ndarray:
+        """`LabelNames` to `LabelIds`."""
+        return np.array([self.name_to_id[name] for name in names], dtype=np.int64)
+
+
+def load_decoders(
+    fmts: Iterable["FullModelType"],
+    is_inference: bool = False,
+) -> dict["FullModelType", LabelRefDecoder]:
+    """`LabelRefDecoders` of many full model types."""
+    return {fmt: LabelRefDecoder.from_fmt(fmt, is_inference) for fmt in fmts}
@@ -0,0 +1,57 @@
+"""pandas categorical dtypes for the model type, player type and fmt columns.
+
+The fmt categories are those of `FMT_CODES.ALL` (i.e. `FMT.ALL` plus the
+player full model types), so the categorical codes are the FMT codes.
+"""
+
+from typing import TYPE_CHECKING
+
+from pandas import CategoricalDtype
+
+from dbdie_classes.options import FMT_CODES
+from dbdie_classes.options import MODEL_TYPE as MT
+from dbdie_classes.options import PLAYER_TYPE as PT
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+MT_DTYPE  = CategoricalDtype(MT.ALL)
+PT_DTYPE  = CategoricalDtype(PT.ALL)
+FMT_DTYPE = CategoricalDtype(FMT_CODES.ALL)
+
+BY_COL: dict[str, CategoricalDtype] = {
+    "mt": MT_DTYPE,
+    "pt": PT_DTYPE,
+    "fmt": FMT_DTYPE,
+}
+
+
+def to_categorical(
+    df: "DataFrame",
+    cols: dict[str, CategoricalDtype] | None = None,
+) -> None:
+    """Cast the DataFrame's columns to their categorical dtypes in place.
+    By default 'mt', 'pt' and 'fmt' columns are cast, if present.
+    Nulls are allowed, but unknown categories raise an AssertionError.
+    """
+    if cols is None:
+        cols = {col: dtype for col, dtype in BY_COL.items() if col in df.columns}
+
+    for col, dtype in cols.items():
+        cat = df[col].astype(dtype)
+        unknown = cat.isna() & df[col].notna()
+        assert not unknown.any(), (
+            f"Unknown categories in column '{col}': {sorted(df.loc[unknown, col].unique())}"
+        )
+        df[col] = cat
+
+
+def from_categorical(df: "DataFrame", cols: list[str] | None = None) -> None:
+    """Cast the DataFrame's categorical columns back to object dtype in place.
+    By default 'mt', 'pt' and 'fmt' columns are cast, if present.
+    """
+    if cols is None:
+        cols = [col for col in BY_COL if col in df.columns]
+
+    for col in cols:
+        df[col] = df[col].astype(object).where(df[col].notna(), None)
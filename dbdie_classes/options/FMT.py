@@ -1,12 +1,12 @@
 """All full model types."""
 
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
 from dbdie_classes.options import MODEL_TYPE as MT
 from dbdie_classes.options import PLAYER_TYPE as PT
 from dbdie_classes.options.COMMON_FMT import ALL as COMMON
 from dbdie_classes.options.KILLER_FMT import ALL as KILLER
+from dbdie_classes.options.PLAYER_FMT import ALL as PLAYER
 from dbdie_classes.options.SURV_FMT import ALL as SURV
 
 if TYPE_CHECKING:
@@ -27,19 +27,32 @@ def to_fmt(mt: "ModelType", ifk: "IsForKiller") -> "FullModelType":
     return mt + ("" if ifk is None else f"__{PT.ifk_to_pt(ifk)}")
 
 
-def from_fmt(
+def parse_fmt(
     fmt: "FullModelType",
 ) -> tuple["ModelType", "PlayerType", "IsForKiller"]:
-    """Extract mt, pt, and ifk from fmt.
-    Doesn't validate if the format is correct,
-    use `assert_mt_and_pt` for that purpose.
-    """
+    """Parse mt, pt, and ifk from fmt (see `from_fmt`)."""
     ix = fmt.find("__")
     if ix > -1:
         pt = fmt[ix + 2:]
         return fmt[:ix], pt, pt == PT.KILLER
     else:
-        return deepcopy(fmt), None, None
+        return fmt, None, None
+
+
+FROM_FMT = {fmt: parse_fmt(fmt) for fmt in ALL + PLAYER}
+
+
+def from_fmt(
+    fmt: "FullModelType",
+) -> tuple["ModelType", "PlayerType", "IsForKiller"]:
+    """Extract mt, pt, and ifk from fmt.
+    Doesn't validate if the format is correct,
+    use `assert_mt_and_pt` for that purpose.
+    """
+    try:
+        return FROM_FMT[fmt]
+    except KeyError:
+        return parse_fmt(fmt)
 
 
 def assert_mt_and_pt(mt: str, pt: str | None) -> None:
@@ -51,9 +64,7 @@ def from_fmts(
     fmts: list["FullModelType"]
 ) -> tuple[list["ModelType"], list["PlayerType"], list["IsForKiller"]]:
     """Extract mts, pts, and ifks from a list of fmts."""
-    mts_and_pts = [from_fmt(fmt) for fmt in fmts]
-    return (
-        [tup[0] for tup in mts_and_pts],
-        [tup[1] for tup in mts_and_pts],
-        [tup[2] for tup in mts_and_pts],
-    )
+    if not fmts:
+        return [], [], []
+    mts, pts, ifks = zip(*(from_fmt(fmt) for fmt in fmts))
+    return list(mts), list(pts), list(ifks)
@@ -0,0 +1,85 @@
+"""Stable small integer codes for the full model types.
+
+Precomputed at import time, with O(1) lookups in every direction:
+fmt <-> code <-> (mt, pt, ifk). The code of a `FMT.ALL` full model type
+is its position in that list, i.e. the same as in `ExtractorModelsIds`.
+"""
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from dbdie_classes.options import FMT
+from dbdie_classes.options import IMPLEMENTED
+from dbdie_classes.options import PLAYER_FMT
+from dbdie_classes.options import PLAYER_TYPE as PT
+
+if TYPE_CHECKING:
+    from dbdie_classes.base import (
+        FullModelType, IsForKiller, ModelType, PlayerType
+    )
+
+ALL: list["FullModelType"] = FMT.ALL + PLAYER_FMT.ALL  # ! order is maintained, only append
+assert len(ALL) < 255, "Codes must fit in a uint8"
+NULL_CODE = 255
+DTYPE = np.uint8
+
+CODES: dict["FullModelType", int] = {fmt: code for code, fmt in enumerate(ALL)}
+MTS: list["ModelType"] = [FMT.from_fmt(fmt)[0] for fmt in ALL]
+PTS: list["PlayerType"] = [FMT.from_fmt(fmt)[1] for fmt in ALL]
+IFKS: list["IsForKiller"] = [FMT.from_fmt(fmt)[2] for fmt in ALL]
+MT_IFK_TO_CODE: dict[tuple["ModelType", "IsForKiller"], int] = {
+    (mt, ifk): code for code, (mt, ifk) in enumerate(zip(MTS, IFKS))
+}
+
+IMPLEMENTED_CODES: list[int] = [CODES[fmt] for fmt in IMPLEMENTED.FMTS]
+IS_IMPLEMENTED = np.zeros(len(ALL), dtype=bool)
+IS_IMPLEMENTED[IMPLEMENTED_CODES] = True
+
+_ALL_ARRAY = np.array(ALL, dtype=object)
+
+
+def to_code(fmt: "FullModelType") -> int:
+    """Full model type to its code."""
+    return CODES[fmt]
+
+
+def from_code(code: int) -> "FullModelType":
+    """Code to its full model type."""
+    return ALL[code]
+
+
+def code_to_mt_pt_ifk(code: int) -> tuple["ModelType", "PlayerType", "IsForKiller"]:
+    """Code to its model type, player type and killer boolean."""
+    return MTS[code], PTS[code], IFKS[code]
+
+
+def mt_and_pt_to_code(mt: "ModelType", pt: "PlayerType") -> int:
+    """Model type and player type to the code of their full model type."""
+    return MT_IFK_TO_CODE[(mt, PT.pt_to_ifk(pt))]
+
+
+def to_codes(fmts) -> np.ndarray:
+    """Vectorized `to_code` for an array-like (list, NumPy array or pandas Series)
+    of full model types. Nulls are encoded as `NULL_CODE`.
+    """
+    fmts = np.asarray(fmts, dtype=object)
+    is_null = (fmts == None) | (fmts != fmts)  # noqa: E711
+    uniques, inverse = np.unique(np.where(is_null, "", fmts).astype(str), return_inverse=True)
+
+    unknown = [fmt for fmt in uniques.tolist() if fmt and (fmt not in CODES)]
+    assert not unknown, f"Unknown full model types: {unknown}"
+
+    lookup = np.array([CODES.get(fmt, NULL_CODE) for fmt in uniques.tolist()], dtype=DTYPE)
+    return lookup[inverse.reshape(fmts.shape)]
+
+
+def from_codes(codes) -> np.ndarray:
+    """Vectorized `from_code` for an array-like of codes.
+    `NULL_CODE` is decoded as None.
+    """
+    codes = np.asarray(codes)
+    is_null = codes == NULL_CODE
+    is_valid = is_null | ((codes >= 0) & (codes < len(ALL)))
+    assert is_valid.all(), f"Unknown codes: {np.unique(codes[~is_valid]).tolist()}"
+    return np.where(is_null, None, _ALL_ARRAY[np.where(is_null, 0, codes)])
@@ -2,12 +2,15 @@
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from dbdie_classes.options import MODEL_TYPE as MT
+from dbdie_classes.options import SQL_COLS
 
 if TYPE_CHECKING:
-    from pandas import Series
+    from pandas import DataFrame, Series
 
-    from dbdie_classes.base import LabelId, ModelType
+    from dbdie_classes.base import IsForKiller, LabelId, ModelType
 
 ADDONS_KILLER    = "NoKillerAddon"
 ADDONS_SURV      = "NoSurvAddon"
@@ -66,8 +69,99 @@ INT_IDS: dict["ModelType", list["LabelId"]] = {
     MT.PERKS     : [1, 0],
     MT.STATUS    : [0, 1],
 }
+INT_IDS_SETS: dict["ModelType", set["LabelId"]] = {
+    mt: set(ids) for mt, ids in INT_IDS.items()
+}
+
+
+def _int_ids_by_ifk(mt: "ModelType") -> dict["IsForKiller", list["LabelId"]]:
+    """Null ids of the ModelType for surv (False), killer (True) and unknown (None) rows."""
+    ids = INT_IDS[mt]
+    if mt == MT.STATUS:
+        return {False: ids, True: ids, None: ids}
+    elif mt == MT.CHARACTER:
+        return {False: [ids[0], ids[2]], True: [ids[1], ids[2]], None: ids}  # AllCharacters
+    else:
+        return {False: [ids[0]], True: [ids[1]], None: ids}
+
+
+INT_IDS_BY_IFK: dict["ModelType", dict["IsForKiller", list["LabelId"]]] = {
+    mt: _int_ids_by_ifk(mt) for mt in INT_IDS
+}
+
+NULL_SENTINEL: "LabelId" = -1  # null value in integer label matrices
 
 
 def mt_is_null(data: "Series", mt: "ModelType") -> "Series":
     """Boolean mask that checks if the ModelType is null."""
-    return data.isnull() | data.isin(set(INT_IDS[mt]))
+    return data.isnull() | data.isin(INT_IDS_SETS[mt])
+
+
+def _build_null_table() -> np.ndarray:
+    """(3, len(SQL_COLS.ALL_FLATTENED), max null id + 1) boolean table
+    of whether an id is null for a column, for surv (0), killer (1) and unknown (2) rows.
+    """
+    max_id = max(max(ids) for ids in INT_IDS.values())
+    table = np.zeros((3, len(SQL_COLS.ALL_FLATTENED), max_id + 1), dtype=bool)
+    col_to_mt = {col: mt for mt, cols in SQL_COLS.MT_TO_COLS.items() for col in cols}
+    for col_ix, col in enumerate(SQL_COLS.ALL_FLATTENED):
+        for state, ifk in enumerate([False, True, None]):
+            table[state, col_ix, INT_IDS_BY_IFK[col_to_mt[col]][ifk]] = True
+    return table
+
+
+NULL_TABLE = _build_null_table()
+
+
+def _ifk_to_states(ifk, n_rows: int) -> np.ndarray:
+    """Killer booleans (None, a bool or one per row) to row states
+    (0 surv, 1 killer, 2 unknown).
+    """
+    if ifk is None:
+        return np.full(n_rows, 2, dtype=np.intp)
+    ifk = np.broadcast_to(np.asarray(ifk, dtype=object), (n_rows,))
+    return np.where(ifk == True, 1, np.where(ifk == False, 0, 2)).astype(np.intp)  # noqa: E712
+
+
+def labels_null_mask(
+    data: "DataFrame | np.ndarray",
+    ifk: "IsForKiller | list[IsForKiller] | np.ndarray | Series" = None,
+) -> "DataFrame | np.ndarray":
+    """Boolean mask of null labels for all the `SQL_COLS.ALL_FLATTENED` columns
+    at once, using the null ids of the player type of each row.
+
+    'data' is a labels DataFrame (with those columns) or a NumPy matrix laid out
+    like them, where nulls are NaN, None or `NULL_SENTINEL`. 'ifk' is the killer
+    boolean of all the rows or of each row, where None means unknown, in which
+    case the null ids of both player types are used (like `mt_is_null`).
+    The 'AllCharacters' id is null for every row.
+    """
+    is_df = hasattr(data, "columns")
+    values = (
+        data[SQL_COLS.ALL_FLATTENED].to_numpy(dtype=float, na_value=np.nan)
+        if is_df
+        else np.asarray(data, dtype=float)
+    )
+    assert values.ndim == 2 and values.shape[1] == len(SQL_COLS.ALL_FLATTENED), (
+        f"Data must have {len(SQL_COLS.ALL_FLATTENED)} columns"
+    )
+
+    is_missing = np.isnan(values) | (values == NULL_SENTINEL)
+    ids = np.where(is_missing, 0, values).astype(np.intp)
+    in_table = (ids >= 0) & (ids < NULL_TABLE.shape[2])
+
+    states = _ifk_to_states(ifk, values.shape[0])
+    mask = is_missing | (
+        in_table
+        & NULL_TABLE[
+            states[:, None],
+            np.arange(values.shape[1])[None, :],
+            np.where(in_table, ids, 0),
+        ]
+    )
+
+    if is_df:
+        from pandas import DataFrame
+
+        return DataFrame(mask, index=data.index, columns=SQL_COLS.ALL_FLATTENED)
+    return mask
@@ -0,0 +1,182 @@
+"""Streaming crop pipeline, from the pending to the cropped images folders.
+
+Stages run in order: scan, load, crop, write and move. Loading, cropping and
+writing are done by the caller-provided functions (e.g. a `CropperSwarm`),
+optionally on a process pool with a bounded number of images in flight.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from os import makedirs, rename, scandir
+from os.path import basename, join
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from dbdie_classes.options.CROP_TYPES import DEFAULT_CROP_TYPES_SEQ
+from dbdie_classes.paths import (
+    CROP_PENDING_IMG_FD_RP,
+    CROPPED_IMG_FD_RP,
+    INFERENCE_CROP_PENDING_IMG_FD_RP,
+    INFERENCE_CROPPED_IMG_FD_RP,
+    absp,
+)
+
+if TYPE_CHECKING:
+    from dbdie_classes.base import CropType, Filename, Path, PathToFolder
+
+SCAN  = "scan"
+LOAD  = "load"
+CROP  = "crop"
+WRITE = "write"
+MOVE  = "move"
+STAGES = [SCAN, LOAD, CROP, WRITE, MOVE]
+
+IMG_EXTS = (".jpg", ".jpeg", ".png")
+
+LoadFunc  = Callable[["Path"], Any]
+CropFunc  = Callable[[Any, "CropType"], Any]  # (image or previous level crops, crop type)
+WriteFunc = Callable[["Filename", dict["CropType", Any]], None]
+
+
+@dataclass
+class StageStats:
+    """Throughput statistics of a pipeline stage."""
+
+    name:    str
+    items:   int   = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Processed items per second."""
+        return self.items / self.seconds if self.seconds > 0.0 else 0.0
+
+
+def process_image(
+    path: "Path",
+    load_fn: LoadFunc,
+    crop_fn: CropFunc,
+    write_fn: WriteFunc,
+    crop_types_seq: list[list["CropType"]],
+) -> dict[str, float]:
+    """Load, crop and write an image. Returns the seconds spent in each stage.
+
+    Crop levels run in order: the first level crops the image, and each next
+    level crops the outputs of the previous one, which are passed to 'crop_fn'
+    as a dict keyed by `CropType` (e.g. 'surv_player' crops come from the 'surv'
+    crop). The crops of every level are written.
+    """
+    seconds = {}
+
+    start = perf_counter()
+    img = load_fn(path)
+    seconds[LOAD] = perf_counter() - start
+
+    start = perf_counter()
+    crops = {}
+    src = img
+    for crop_types in crop_types_seq:
+        level_crops = {crop_type: crop_fn(src, crop_type) for crop_type in crop_types}
+        crops |= level_crops
+        src = level_crops
+    seconds[CROP] = perf_counter() - start
+
+    start = perf_counter()
+    write_fn(basename(path), crops)
+    seconds[WRITE] = perf_counter() - start
+
+    return seconds
+
+
+class CropPipeline:
+    """Streaming crop pipeline from the pending to the cropped images folder.
+
+    With `n_workers=0` the images are processed serially in this process.
+    Otherwise they are processed on a process pool with at most `max_pending`
+    images in flight, so that the scan doesn't run ahead of the workers.
+    Functions must be picklable (i.e. module-level) to use a process pool.
+    """
+
+    def __init__(
+        self,
+        load_fn: LoadFunc,
+        crop_fn: CropFunc,
+        write_fn: WriteFunc,
+        is_inference: bool = False,
+        crop_types_seq: list[list["CropType"]] | None = None,
+        n_workers: int = 0,
+        max_pending: int | None = None,
+    ) -> None:
+        assert n_workers >= 0, "Number of workers can't be negative"
+        self.load_fn = load_fn
+        self.crop_fn = crop_fn
+        self.write_fn = write_fn
+        self.crop_types_seq = (
+            DEFAULT_CROP_TYPES_SEQ if crop_types_seq is None else crop_types_seq
+        )
+        self.n_workers = n_workers
+        self.max_pending = 2 * n_workers if max_pending is None else max_pending
+        assert (n_workers == 0) or (self.max_pending > 0), "There must be at least 1 pending image"
+
+        self.src_fd: "PathToFolder" = absp(
+            INFERENCE_CROP_PENDING_IMG_FD_RP if is_inference else CROP_PENDING_IMG_FD_RP
+        )
+        self.dst_fd: "PathToFolder" = absp(
+            INFERENCE_CROPPED_IMG_FD_RP if is_inference else CROPPED_IMG_FD_RP
+        )
+        self.stats = {stage: StageStats(stage) for stage in STAGES}
+
+    def scan(self) -> Iterator["Path"]:
+        """Lazily scan the pending folder for images."""
+        start = perf_counter()
+        with scandir(self.src_fd) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.lower().endswith(IMG_EXTS):
+                    self._add_stats(SCAN, perf_counter() - start)
+                    yield entry.path
+                    start = perf_counter()
+
+    def move(self, path: "Path") -> "Filename":
+        """Move a processed image to the cropped folder."""
+        start = perf_counter()
+        filename = basename(path)
+        makedirs(self.dst_fd, exist_ok=True)
+        rename(path, join(self.dst_fd, filename))
+        self._add_stats(MOVE, perf_counter() - start)
+        return filename
+
+    def _add_stats(self, stage: str, seconds: float) -> None:
+        self.stats[stage].items += 1
+        self.stats[stage].seconds += seconds
+
+    def _finish(self, path: "Path", seconds: dict[str, float]) -> "Filename":
+        for stage, secs in seconds.items():
+            self._add_stats(stage, secs)
+        return self.move(path)
+
+    def run(self) -> Iterator["Filename"]:
+        """Run the pipeline, yielding the filename of each cropped image."""
+        args = (self.load_fn, self.crop_fn, self.write_fn, self.crop_types_seq)
+
+        if self.n_workers == 0:
+            for path in self.scan():
+                yield self._finish(path, process_image(path, *args))
+            return
+
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            pending = {}
+            for path in self.scan():
+                if len(pending) >= self.max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        yield self._finish(pending.pop(fut), fut.result())
+                pending[executor.submit(process_image, path, *args)] = path
+
+            for fut in wait(pending).done:
+                yield self._finish(pending.pop(fut), fut.result())
+
+    def summary(self) -> dict[str, float]:
+        """Throughput (items per second) of each stage."""
+        return {stage: st.throughput for stage, st in self.stats.items()}
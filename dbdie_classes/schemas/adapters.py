@@ -0,0 +1,86 @@
+"""Cached list validators and serializers for the public schemas.
+
+`TypeAdapter(list[Schema])` compiles its core schema on creation, so building
+one per request is expensive. Here they are built once per schema, and whole
+lists are validated and dumped inside pydantic-core instead of looping
+over the items in Python.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable, Literal
+
+from pydantic import BaseModel, TypeAdapter
+
+from dbdie_classes.schemas import groupings, helpers, objects, predictables, types
+
+SCHEMAS_MODULES = [groupings, helpers, objects, predictables, types]
+PUBLIC_SCHEMAS: dict[str, type[BaseModel]] = {
+    name: obj
+    for mod in SCHEMAS_MODULES
+    for name, obj in vars(mod).items()
+    if (
+        isinstance(obj, type)
+        and issubclass(obj, BaseModel)
+        and obj.__module__ == mod.__name__
+        and not name.startswith("_")
+    )
+}
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Cached `TypeAdapter` of a list of 'schema'."""
+    return TypeAdapter(list[schema])
+
+
+def validate_many(
+    schema: type[BaseModel],
+    data: Iterable,
+    from_attributes: bool = False,
+) -> list:
+    """Validate many dicts (or objects, with 'from_attributes') as 'schema'."""
+    if not isinstance(data, list):
+        data = list(data)
+    return list_adapter(schema).validate_python(data, from_attributes=from_attributes)
+
+
+def validate_json_many(schema: type[BaseModel], data: str | bytes) -> list:
+    """Validate a JSON array as a list of 'schema'."""
+    return list_adapter(schema).validate_json(data)
+
+
+def dump_many(
+    schema: type[BaseModel],
+    items: Iterable[BaseModel],
+    mode: Literal["python", "json"] = "python",
+    **kwargs: Any,
+) -> list[dict]:
+    """Dump many 'schema' objects to dicts. 'kwargs' go to `TypeAdapter.dump_python`."""
+    if not isinstance(items, list):
+        items = list(items)
+    return list_adapter(schema).dump_python(items, mode=mode, **kwargs)
+
+
+def dump_json_many(
+    schema: type[BaseModel],
+    items: Iterable[BaseModel],
+    **kwargs: Any,
+) -> bytes:
+    """Dump many 'schema' objects to a JSON array. 'kwargs' go to `TypeAdapter.dump_json`."""
+    if not isinstance(items, list):
+        items = list(items)
+    return list_adapter(schema).dump_json(items, **kwargs)
+
+
+def warm_up(schemas: Iterable[type[BaseModel]] | None = None) -> int:
+    """Build the list adapters (default: all `PUBLIC_SCHEMAS`), e.g. at worker start.
+    Returns the number of built adapters.
+    """
+    schemas = PUBLIC_SCHEMAS.values() if schemas is None else schemas
+    total = 0
+    for schema in schemas:
+        list_adapter(schema).dump_json([])
+        total += 1
+    return total
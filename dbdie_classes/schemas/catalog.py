@@ -0,0 +1,178 @@
+"""In-memory catalog of the predictables, to resolve label IDs without I/O."""
+
+from __future__ import annotations
+
+from functools import cached_property
+from hashlib import sha256
+from typing import TYPE_CHECKING, Iterable
+
+from dbdie_classes.consistency import ConsistencyEngine
+from dbdie_classes.options import MODEL_TYPE as MT
+from dbdie_classes.schemas.adapters import dump_json_many, validate_many
+from dbdie_classes.schemas.groupings import FullMatchOut, PlayerIn, PlayerOut
+from dbdie_classes.schemas.helpers import DBDVersionOut
+from dbdie_classes.schemas.predictables import (
+    AddonOut,
+    CharacterOut,
+    ItemOut,
+    OfferingOut,
+    PerkOut,
+    StatusOut,
+)
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from dbdie_classes.base import IsForKiller, LabelId, LabelName, ModelType
+
+SCHEMAS: dict["ModelType", type[BaseModel]] = {
+    MT.CHARACTER: CharacterOut,
+    MT.PERKS: PerkOut,
+    MT.ITEM: ItemOut,
+    MT.ADDONS: AddonOut,
+    MT.OFFERING: OfferingOut,
+    MT.STATUS: StatusOut,
+}  # ! order is that of the version hash
+
+
+class PredictablesCatalog:
+    """In-memory catalog of all the predictables, indexed by ID and by name.
+
+    It is loaded once (e.g. per service) and then used to build `PlayerOuts`
+    and `FullMatchOuts` from label IDs. Its 'version' is a hash of its
+    contents, so that a cached catalog can be invalidated when it changes.
+    """
+
+    def __init__(
+        self,
+        characters: list[CharacterOut],
+        perks: list[PerkOut],
+        items: list[ItemOut],
+        addons: list[AddonOut],
+        offerings: list[OfferingOut],
+        statuses: list[StatusOut],
+        dbdvs: list[DBDVersionOut] | None = None,
+    ) -> None:
+        self.predictables: dict["ModelType", list] = {
+            MT.CHARACTER: sorted(characters, key=lambda c: c.id),
+            MT.PERKS: sorted(perks, key=lambda p: p.id),
+            MT.ITEM: sorted(items, key=lambda i: i.id),
+            MT.ADDONS: sorted(addons, key=lambda a: a.id),
+            MT.OFFERING: sorted(offerings, key=lambda o: o.id),
+            MT.STATUS: sorted(statuses, key=lambda s: s.id),
+        }
+        self.by_id: dict["ModelType", dict["LabelId", BaseModel]] = {
+            mt: {obj.id: obj for obj in objs}
+            for mt, objs in self.predictables.items()
+        }
+        for mt, objs in self.predictables.items():
+            assert len(self.by_id[mt]) == len(objs), f"IDs can't repeat ({mt})"
+
+        self._by_name: dict["ModelType", dict["LabelName", list]] = {}
+        for mt, objs in self.predictables.items():
+            names = self._by_name[mt] = {}
+            for obj in objs:
+                names.setdefault(obj.name, []).append(obj)
+
+        self.dbdvs = {} if dbdvs is None else {dbdv.id: dbdv for dbdv in dbdvs}
+
+    @classmethod
+    def from_models(
+        cls,
+        characters: Iterable,
+        perks: Iterable,
+        items: Iterable,
+        addons: Iterable,
+        offerings: Iterable,
+        statuses: Iterable,
+        dbdvs: Iterable | None = None,
+    ) -> PredictablesCatalog:
+        """Create `PredictablesCatalog` from SQLAlchemy models (or any objects with
+        the output schemas' attributes), validated in bulk.
+        """
+        return cls(
+            characters=validate_many(CharacterOut, characters, from_attributes=True),
+            perks=validate_many(PerkOut, perks, from_attributes=True),
+            items=validate_many(ItemOut, items, from_attributes=True),
+            addons=validate_many(AddonOut, addons, from_attributes=True),
+            offerings=validate_many(OfferingOut, offerings, from_attributes=True),
+            statuses=validate_many(StatusOut, statuses, from_attributes=True),
+            dbdvs=None if dbdvs is None else [DBDVersionOut.from_model(dbdv) for dbdv in dbdvs],
+        )
+
+    @cached_property
+    def version(self) -> str:
+        """Hash of the catalog contents (DBD versions excluded)."""
+        h = sha256()
+        for mt, schema in SCHEMAS.items():
+            h.update(mt.encode())
+            h.update(dump_json_many(schema, self.predictables[mt]))
+        return h.hexdigest()
+
+    @cached_property
+    def chars_ifk(self) -> dict["LabelId", "IsForKiller"]:
+        """Characters' ifk by ID, to check the perks of regular characters."""
+        return {c.id: c.ifk for c in self.predictables[MT.CHARACTER]}
+
+    @cached_property
+    def engine(self) -> ConsistencyEngine:
+        """`ConsistencyEngine` of the catalog."""
+        return ConsistencyEngine.from_catalogs(
+            characters=self.predictables[MT.CHARACTER],
+            perks=self.predictables[MT.PERKS],
+            items=self.predictables[MT.ITEM],
+            addons=self.predictables[MT.ADDONS],
+            offerings=self.predictables[MT.OFFERING],
+            statuses=self.predictables[MT.STATUS],
+        )
+
+    def __len__(self) -> int:
+        return sum(len(objs) for objs in self.predictables.values())
+
+    def get(self, mt: "ModelType", label_id: "LabelId"):
+        """Predictable of a model type by its ID."""
+        return self.by_id[mt][label_id]
+
+    def get_by_name(self, mt: "ModelType", name: "LabelName"):
+        """Predictable of a model type by its name, which must be unambiguous."""
+        objs = self._by_name[mt][name]
+        assert len(objs) == 1, f"There are {len(objs)} {mt} named '{name}'"
+        return objs[0]
+
+    def ids_by_name(self, mt: "ModelType", name: "LabelName") -> list["LabelId"]:
+        """IDs of all the predictables of a model type with a certain name."""
+        return [obj.id for obj in self._by_name[mt].get(name, [])]
+
+    def player_out(self, player: PlayerIn) -> PlayerOut:
+        """Build a `PlayerOut` from a fully labeled `PlayerIn`."""
+        assert player.perk_ids is not None, "Player perks must be labeled"
+        assert player.addon_ids is not None, "Player addons must be labeled"
+        by_id = self.by_id
+        return PlayerOut.model_validate(
+            {
+                "id": player.id,
+                "character": by_id[MT.CHARACTER][player.character_id],
+                "perks": [by_id[MT.PERKS][pid] for pid in player.perk_ids],
+                "item": by_id[MT.ITEM][player.item_id],
+                "addons": [by_id[MT.ADDONS][aid] for aid in player.addon_ids],
+                "offering": by_id[MT.OFFERING][player.offering_id],
+                "status": by_id[MT.STATUS][player.status_id],
+                "points": player.points,
+                "prestige": player.prestige,
+            },
+            context={"chars_ifk": self.chars_ifk},
+        )
+
+    def full_match_out(
+        self,
+        players: list[PlayerIn],
+        version: DBDVersionOut | int,
+    ) -> FullMatchOut:
+        """Build a `FullMatchOut` from its 5 fully labeled `PlayerIns`
+        (sorted by player ID) and its DBD version (or its ID).
+        """
+        assert [pl.id for pl in players] == [0, 1, 2, 3, 4], "There must be 5 sorted players"
+        return FullMatchOut(
+            version=version if isinstance(version, DBDVersionOut) else self.dbdvs[version],
+            players=[self.player_out(pl) for pl in players],
+        )
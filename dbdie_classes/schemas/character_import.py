@@ -0,0 +1,126 @@
+"""Bulk import of `FullCharacterCreate` definitions from YAML.
+
+A YAML stream can hold one character definition per document, or documents
+with lists of definitions. Definitions are numbered in stream order.
+All the errors are collected, instead of failing on the first one:
+validation errors of each definition, and perk, addon or character names
+that repeat across the whole batch.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO, Iterator
+
+import yaml
+from pydantic import ValidationError
+
+from dbdie_classes.schemas.groupings import FullCharacterCreate
+
+YAML_ERROR_IX = -1  # errors key of the YAML parsing errors
+
+
+def validate_character(info) -> tuple[FullCharacterCreate | None, list[str]]:
+    """Validate a character definition, returning its error messages instead
+    of raising them (so that they can be sent back from a worker process).
+    """
+    if not isinstance(info, dict):
+        return None, ["Character definition must be a mapping"]
+    try:
+        return FullCharacterCreate.model_validate(info), []
+    except ValidationError as e:
+        return None, [
+            f"{'.'.join(str(loc) for loc in err['loc']) or 'character'}: {err['msg']}"
+            for err in e.errors()
+        ]
+
+
+@dataclass
+class CharacterImport:
+    """Result of a bulk character import, keyed by definition number."""
+
+    characters: dict[int, FullCharacterCreate] = field(default_factory=dict)
+    errors:     dict[int, list[str]]           = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def add_error(self, ix: int, msg: str) -> None:
+        self.errors.setdefault(ix, []).append(msg)
+
+    def raise_for_errors(self) -> None:
+        """Raise a ValueError with all the errors, if any."""
+        if self.errors:
+            lines = [
+                f"#{ix}: {msg}"
+                for ix, msgs in sorted(self.errors.items())
+                for msg in msgs
+            ]
+            raise ValueError(f"{len(lines)} character import error(s):\n" + "\n".join(lines))
+
+    def check_uniqueness(self) -> None:
+        """Check that character, perk and addon names don't repeat across the batch,
+        using a hashed index per kind of name.
+        """
+        indexes: dict[str, dict[str, int]] = {"character": {}, "perk": {}, "addon": {}}
+        for ix, char in self.characters.items():
+            names = {
+                "character": [char.name],
+                "perk": char.perk_names,
+                "addon": char.addon_names or [],
+            }
+            for kind, kind_names in names.items():
+                index = indexes[kind]
+                for i, name in enumerate(kind_names):
+                    first_ix = index.setdefault(name, ix)
+                    if first_ix != ix or name in kind_names[:i]:
+                        self.add_error(ix, f"Repeated {kind} name '{name}' (first in #{first_ix})")
+
+
+def iter_definitions(stream: str | IO, result: CharacterImport) -> Iterator:
+    """Lazily iterate over the character definitions of a YAML stream.
+    A parsing error stops the iteration and is added to the 'result' errors.
+    """
+    try:
+        for doc in yaml.safe_load_all(stream):
+            if doc is None:
+                continue
+            elif isinstance(doc, list):
+                yield from doc
+            else:
+                yield doc
+    except yaml.YAMLError as e:
+        result.add_error(YAML_ERROR_IX, f"Invalid YAML: {e}")
+
+
+def import_characters(
+    stream: str | IO,
+    n_workers: int = 0,
+    chunksize: int = 8,
+) -> CharacterImport:
+    """Import and validate the `FullCharacterCreate` definitions of a YAML stream.
+
+    With `n_workers=0` definitions are validated serially in this process.
+    Otherwise they are validated on a process pool, in chunks of 'chunksize'.
+    Call `raise_for_errors` on the result to fail if there is any error.
+    """
+    assert n_workers >= 0, "Number of workers can't be negative"
+    result = CharacterImport()
+    infos = iter_definitions(stream, result)
+
+    if n_workers == 0:
+        validated = list(map(validate_character, infos))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            validated = list(executor.map(validate_character, infos, chunksize=chunksize))
+
+    for ix, (char, msgs) in enumerate(validated):
+        if char is not None:
+            result.characters[ix] = char
+        for msg in msgs:
+            result.add_error(ix, msg)
+
+    result.check_uniqueness()
+    return result
@@ -0,0 +1,108 @@
+"""Streaming NDJSON and CSV exporters.
+
+Exporters consume (possibly lazy) iterables of Pydantic models,
+e.g. `MatchOut` or `LabelsOut`, or of raw dict rows, and yield bytes chunks
+of about `chunk_size` bytes, so memory doesn't grow with the dataset size.
+A chunk is yielded as soon as it reaches `chunk_size`, so it can only go
+over it by a single line.
+
+Raw SQLAlchemy rows can be exported lazily by mapping them first, e.g.
+`iter_ndjson(LabelsOut.from_labels(row) for row in query)`.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from io import StringIO
+from itertools import chain
+from typing import Any, Iterable, Iterator
+
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+DEFAULT_CHUNK_SIZE = 1 << 16  # bytes
+
+
+def _to_json(item: BaseModel | dict) -> bytes:
+    if isinstance(item, BaseModel):
+        return item.__pydantic_serializer__.to_json(item)  # compiled once per class
+    return to_json(item)
+
+
+def _to_jsonable(item: BaseModel | dict) -> dict:
+    if isinstance(item, BaseModel):
+        return item.__pydantic_serializer__.to_python(item, mode="json")
+    return to_jsonable_python(item)
+
+
+def flatten_record(record: dict, prefix: str = "") -> dict[str, Any]:
+    """Flatten a JSON-able record for a CSV row.
+    Nested keys are joined with a dot and lists are JSON-encoded.
+    """
+    flat = {}
+    for k, v in record.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict):
+            flat |= flatten_record(v, prefix=f"{key}.")
+        elif isinstance(v, list):
+            flat[key] = json.dumps(v, separators=(",", ":"))
+        else:
+            flat[key] = v
+    return flat
+
+
+def iter_ndjson(
+    items: Iterable[BaseModel | dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Stream items as NDJSON (1 JSON object per line) bytes chunks."""
+    assert chunk_size > 0, "Chunk size must be positive"
+    buf = bytearray()
+    for item in items:
+        buf += _to_json(item)
+        buf += b"\n"
+        if len(buf) >= chunk_size:
+            yield bytes(buf)
+            buf.clear()
+    if buf:
+        yield bytes(buf)
+
+
+def iter_csv(
+    items: Iterable[BaseModel | dict],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    fieldnames: list[str] | None = None,
+) -> Iterator[bytes]:
+    """Stream items as UTF-8 CSV bytes chunks, header included.
+    Rows are flattened with `flatten_record`, and the default 'fieldnames'
+    are those of the first row.
+    """
+    assert chunk_size > 0, "Chunk size must be positive"
+    items = iter(items)
+    first = next(items, None)
+    if first is None:
+        if fieldnames is not None:
+            yield (",".join(fieldnames) + "\r\n").encode()
+        return
+
+    first_record = flatten_record(_to_jsonable(first))
+    records = chain(
+        [first_record],
+        (flatten_record(_to_jsonable(item)) for item in items),
+    )
+
+    buf = StringIO()
+    writer = csv.DictWriter(
+        buf,
+        fieldnames=list(first_record) if fieldnames is None else fieldnames,
+    )
+    writer.writeheader()
+    for record in records:
+        writer.writerow(record)
+        if buf.tell() >= chunk_size:
+            yield buf.getvalue().encode()
+            buf.seek(0)
+            buf.truncate()
+    if buf.tell():
+        yield buf.getvalue().encode()
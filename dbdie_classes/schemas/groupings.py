@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Optional
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from typing import Iterator, Optional
 from typing_extensions import Self
 
+import numpy as np
+import pandas as pd
 from pydantic import (
     BaseModel,
     Field,
@@ -27,15 +31,27 @@ from dbdie_classes.base import (
     PlayerId,
 )
 from dbdie_classes.code.groupings import (
-    check_strict, labels_model_to_checks, predictables_for_sqld
+    MCKD_FLAGS,
+    MCKD_NULL,
+    check_strict,
+    checks_flags,
+    decode_checks,
+    encode_checks,
+    labels_model_to_checks,
+    labels_models_to_matrices,
+    pack_checks,
+    predictables_for_sqld,
+    sqlds_by_signature,
 )
 from dbdie_classes.code.predictables import emoji_len_func
 from dbdie_classes.code.schemas import (
     check_addons_consistency,
     check_item_consistency,
     check_killer_consistency,
+    check_perks_consistency,
     check_status_consistency,
 )
+from dbdie_classes.schemas.export import DEFAULT_CHUNK_SIZE
 from dbdie_classes.schemas.helpers import DBDVersionOut
 from dbdie_classes.schemas.predictables import (
     AddonOut,
@@ -45,7 +61,9 @@ from dbdie_classes.schemas.predictables import (
     PerkOut,
     StatusOut,
 )
+from dbdie_classes.options import SQL_COLS
 from dbdie_classes.options.MODEL_TYPE import ALL as ALL_MT
+from dbdie_classes.options.NULL_IDS import NULL_SENTINEL
 
 # * Full characters
 
@@ -125,31 +143,33 @@ class PlayerIn(BaseModel):
     points:                 int | None = Field(None, description="Bloodpoints earned", ge=0)
     prestige:               int | None = Field(None, description="Prestige", ge=0, le=100)
 
+    @staticmethod
+    def _labels_kwargs(labels) -> dict:
+        perks = [getattr(labels, col, None) for col in SQL_COLS.PERKS]
+        addons = [getattr(labels, col, None) for col in SQL_COLS.ADDONS]
+        return {
+            "id": labels.player_id,
+            "character_id": getattr(labels, "character", None),
+            "perk_ids": perks if all(p is not None for p in perks) else None,
+            "item_id": getattr(labels, "item", None),
+            "addon_ids": addons if all(a is not None for a in addons) else None,
+            "offering_id": getattr(labels, "offering", None),
+            "status_id": getattr(labels, "status", None),
+            "points": getattr(labels, "points", None),
+            "prestige": getattr(labels, "prestige", None),
+        }
+
     @classmethod
     def from_labels(cls, labels) -> PlayerIn:
-        try:
-            perks = [labels.perks_0, labels.perks_1, labels.perks_2, labels.perks_3]
-            perks = perks if all(p is not None for p in perks) else None
-        except AttributeError:
-            perks = None
-
-        try:
-            addons = [labels.addons_0, labels.addons_1]
-            addons = addons if all(a is not None for a in addons) else None
-        except AttributeError:
-            addons = None
-
-        return PlayerIn(
-            id=labels.player_id,
-            character_id=getattr(labels, "character", None),
-            perk_ids=perks,
-            item_id=getattr(labels, "item", None),
-            addon_ids=addons,
-            offering_id=getattr(labels, "offering", None),
-            status_id=getattr(labels, "status", None),
-            points=getattr(labels, "points", None),
-            prestige=getattr(labels, "prestige", None),
-        )
+        """Create `PlayerIn` from SQLAlchemy labels."""
+        return PlayerIn.model_validate(PlayerIn._labels_kwargs(labels))
+
+    @classmethod
+    def from_labels_many(cls, labels_rows) -> list[PlayerIn]:
+        """Create `PlayerIns` from many SQLAlchemy labels, validated in bulk."""
+        from dbdie_classes.schemas.adapters import validate_many  # adapters imports this module
+
+        return validate_many(PlayerIn, map(PlayerIn._labels_kwargs, labels_rows))
 
     @field_validator("perk_ids", "addon_ids")
     @classmethod
@@ -183,6 +203,16 @@ class PlayerIn(BaseModel):
         check_strict(strict, sqld)
         return sqld
 
+    @staticmethod
+    def to_sqla_many(
+        players: list[PlayerIn],
+        strict: bool,
+    ) -> dict[tuple[str, ...], tuple[list[str], list[tuple]]]:
+        """Batch `to_sqla`: columns and row tuples for each filled predictables
+        signature, ready for an executemany.
+        """
+        return sqlds_by_signature(players, strict)
+
     @staticmethod
     def flatten_predictables(info: dict) -> dict:
         new_info = {
@@ -208,23 +238,27 @@ class PlayerOut(BaseModel):
     is_consistent: StrictBool = Field(True, description="[AUTOCALC] Whether all the player info is consistent")
 
     def model_post_init(self, __context) -> None:
-        self._check_consistency()
+        self._check_consistency(None if __context is None else __context.get("chars_ifk"))
 
     @property
     def ifk(self) -> IsForKiller:
         return self.character.ifk
 
-    def _check_consistency(self) -> None:
+    def _check_consistency(self, chars_ifk: dict[LabelId, IsForKiller] | None = None) -> None:
         """Execute all consistency checks.
         It's purposefully separated so that in the future we could have
         customized self healing methods.
+
+        Perks of regular characters take their character's ifk from 'chars_ifk'
+        (the "chars_ifk" validation context), see `perk_ifk`. Without it,
+        only the player's own character is known.
         """
         assert self.is_consistent
+        if chars_ifk is None:
+            chars_ifk = {self.character.id: self.ifk}
         self.is_consistent = (
             self.ifk is not None
-            and not any(
-                not check_killer_consistency(self.ifk, perk) for perk in self.perks
-            )
+            and check_perks_consistency(self.ifk, self.perks, chars_ifk)
             and check_killer_consistency(self.ifk, self.offering)
             and check_item_consistency(self.ifk, self.item.type_id)
             and check_addons_consistency(self.ifk, self.addons)
@@ -234,6 +268,16 @@ class PlayerOut(BaseModel):
 
 # * Matches
 
+ALL_MT_SET = set(ALL_MT)
+
+
+def set_checks_flags(manual_checks: ManualChecksIn | ManualChecksOut, packed: int) -> None:
+    """Set the [AUTOCALC] flags of manual checks from their packed checks.
+    They are set directly, as they are already valid booleans.
+    """
+    manual_checks.__dict__.update(zip(MCKD_FLAGS, checks_flags(packed)))
+    manual_checks.__pydantic_fields_set__.update(MCKD_FLAGS)
+
 
 class ManualChecksIn(BaseModel):
     """Manual predictables checks input schema."""
@@ -253,16 +297,17 @@ class ManualChecksIn(BaseModel):
         assert not self.is_init
         assert not self.in_progress
         assert not self.completed
+        set_checks_flags(self, encode_checks(self.checks))
 
-        self.is_init = any(c is not None for c in self.checks)
+    @classmethod
+    def from_packed(cls, packed: int) -> ManualChecksIn:
+        """Create `ManualChecksIn` from packed checks (see `encode_checks`)."""
+        return cls(**dict(zip(ALL_MT, decode_checks(packed))))
 
-        if not self.is_init:
-            self.in_progress = False
-            self.completed = False
-        else:
-            conds = [(c is not None and c) for c in self.checks]
-            self.in_progress = any(conds)
-            self.completed = all(conds)
+    @property
+    def packed(self) -> int:
+        """`ManualChecks` packed in 2 bits per model type (see `encode_checks`)."""
+        return encode_checks(self.checks)
 
     @property
     def checks(self) -> list[ManualCheck]:
@@ -307,28 +352,39 @@ class ManualChecksOut(BaseModel):
         assert not self.completed
 
         # Dict must have exactly all expected keys
-        assert set(mt for mt in ALL_MT) == set(self.predictables.keys())
+        assert self.predictables.keys() == ALL_MT_SET
+        set_checks_flags(self, encode_checks(self.checks))
 
-        self.is_init = any(c is not None for c in self.checks)
-        conds = [(c is not None and c) for c in self.checks]
-        self.in_progress = any(conds)
-        self.completed = all(conds)
+    @classmethod
+    def from_packed(cls, packed: int) -> ManualChecksOut:
+        """Create `ManualChecksOut` from packed checks (see `encode_checks`)."""
+        return cls(predictables=dict(zip(ALL_MT, decode_checks(packed))))
+
+    @property
+    def packed(self) -> int:
+        """`ManualChecks` packed in 2 bits per model type (see `encode_checks`)."""
+        return encode_checks(self.checks)
+
+    @staticmethod
+    def _labels_kwargs(labels) -> dict:
+        return {
+            "predictables": {
+                mt: getattr(labels, col)
+                for mt, col in zip(ALL_MT, SQL_COLS.MANUALLY_CHECKED_COLS)
+            },
+        }
 
     @classmethod
     def from_labels(cls, labels) -> ManualChecksOut:
         """Create `ManualChecksOut` from the SQLAlchemy `Labels` model."""
-        return ManualChecksOut(
-            predictables={
-                "addons": labels.addons_mckd,
-                "character": labels.character_mckd,
-                "item": labels.item_mckd,
-                "offering": labels.offering_mckd,
-                "perks": labels.perks_mckd,
-                "prestige": labels.prestige_mckd,
-                "points": labels.points_mckd,
-                "status": labels.status_mckd,
-            }
-        )
+        return ManualChecksOut.model_validate(ManualChecksOut._labels_kwargs(labels))
+
+    @classmethod
+    def from_labels_many(cls, labels_rows) -> list[ManualChecksOut]:
+        """Create `ManualChecksOuts` from many SQLAlchemy labels, validated in bulk."""
+        from dbdie_classes.schemas.adapters import validate_many  # adapters imports this module
+
+        return validate_many(ManualChecksOut, map(ManualChecksOut._labels_kwargs, labels_rows))
 
 
 class MatchCreate(BaseModel):
@@ -367,6 +423,16 @@ class LabelsCreate(BaseModel):
     extr_id:        int | None     = Field(None, description="ID of the InfoExtractor used for extraction", ge=0)
     manual_checks:  ManualChecksIn = Field(...,  description="Manual predictables checks")
 
+    @staticmethod
+    def to_sqla_many(
+        labels: list[LabelsCreate],
+        strict: bool,
+    ) -> dict[tuple[str, ...], tuple[list[str], list[tuple]]]:
+        """Columns and row tuples for the 'Labels' SQLAlchemy model for each
+        filled predictables signature, ready for an executemany.
+        """
+        return sqlds_by_signature(labels, strict)
+
 
 class LabelsOut(LabelsCreate):
     """Labels output schema."""
@@ -374,18 +440,323 @@ class LabelsOut(LabelsCreate):
     date_modified:  dt.datetime     = Field(..., description="Last modification datetime")
     manual_checks:  ManualChecksOut = Field(..., description="Manual predictables checks")
 
+    @staticmethod
+    def _labels_kwargs(labels) -> dict:
+        return {
+            "match_id": labels.match_id,
+            "player": PlayerIn._labels_kwargs(labels),
+            "date_modified": labels.date_modified,
+            "user_id": labels.user_id,
+            "extr_id": labels.extr_id,
+            "manual_checks": ManualChecksOut._labels_kwargs(labels),
+        }
+
     @classmethod
     def from_labels(cls, labels) -> LabelsOut:
         """Create `LabelsOut` from SQLAlchemy labels."""
-        labels_out = LabelsOut(
-            match_id=labels.match_id,
-            player=PlayerIn.from_labels(labels),
-            date_modified=labels.date_modified,
-            user_id=labels.user_id,
-            extr_id=labels.extr_id,
-            manual_checks=ManualChecksOut.from_labels(labels),
+        return LabelsOut.model_validate(LabelsOut._labels_kwargs(labels))
+
+    @classmethod
+    def from_labels_many(cls, labels_rows) -> list[LabelsOut]:
+        """Create `LabelsOuts` from many SQLAlchemy labels, validated in bulk
+        (in a single pydantic-core call instead of one per row).
+        """
+        from dbdie_classes.schemas.adapters import validate_many  # adapters imports this module
+
+        return validate_many(LabelsOut, map(LabelsOut._labels_kwargs, labels_rows))
+
+
+LABELS_BATCH_META_COLS = [
+    "match_id",
+    "player_id",
+    "points",
+    "prestige",
+    "user_id",
+    "extr_id",
+    "date_modified",
+]
+MCKD_VALUES = np.array([False, True, None], dtype=object)  # indexed by int8 manual checks
+LABELS_BLOCK_ROWS = 4096  # rows validated at once when iterating or streaming JSON
+
+
+def _nullable_ints(values: list) -> np.ndarray:
+    """Nullable ints to an int64 array with `NULL_SENTINEL` for nulls."""
+    arr = np.array(values, dtype=float)
+    return np.where(np.isnan(arr), NULL_SENTINEL, arr).astype(np.int64)
+
+
+def _utc_dates(dates: list) -> tuple[np.ndarray, dt.tzinfo | None]:
+    """Datetimes to a naive 'datetime64[us]' array (in UTC if they are tz-aware)
+    and their shared timezone (None if they are naive).
+    """
+    tzs = {date.tzinfo for date in dates}
+    assert len(tzs) <= 1, "Dates must be all naive or all share the same timezone"
+    tz = tzs.pop() if tzs else None
+    if tz is not None:
+        dates = [date.astimezone(dt.timezone.utc).replace(tzinfo=None) for date in dates]
+    return np.array(dates, dtype="datetime64[us]"), tz
+
+
+def _to_optional(arr: np.ndarray) -> np.ndarray:
+    """Int array with `NULL_SENTINEL` nulls to an object array with None nulls."""
+    out = arr.astype(object)
+    out[arr == NULL_SENTINEL] = None
+    return out
+
+
+@dataclass(eq=False)
+class LabelsBatch:
+    """Struct-of-arrays batch of labels, so that bulk reads and exports
+    don't need a `LabelsOut` (and its nested schemas) per row.
+
+    Nullable int columns use `NULL_SENTINEL` for nulls, and the int8
+    'checks' matrix uses `MCKD_NULL` (see `labels_models_to_matrices`).
+    Dates are naive 'datetime64[us]', in UTC if 'tz' (their timezone) isn't None.
+    """
+
+    match_id:      np.ndarray  # (N,) int64
+    player_id:     np.ndarray  # (N,) int64
+    labels:        np.ndarray  # (N, len(SQL_COLS.ALL_FLATTENED)) int64
+    points:        np.ndarray  # (N,) int64
+    prestige:      np.ndarray  # (N,) int64
+    checks:        np.ndarray  # (N, len(MODEL_TYPE.ALL)) int8
+    user_id:       np.ndarray  # (N,) int64
+    extr_id:       np.ndarray  # (N,) int64
+    date_modified: np.ndarray  # (N,) datetime64[us]
+    tz:            dt.tzinfo | None = None
+
+    def __post_init__(self) -> None:
+        n = self.match_id.shape[0]
+        assert all(
+            arr.shape[0] == n
+            for arr in [
+                self.player_id,
+                self.labels,
+                self.points,
+                self.prestige,
+                self.checks,
+                self.user_id,
+                self.extr_id,
+                self.date_modified,
+            ]
+        ), "All columns must be of the same length"
+        assert self.labels.shape[1:] == (len(SQL_COLS.ALL_FLATTENED),)
+        assert self.checks.shape[1:] == (len(ALL_MT),)
+
+    @classmethod
+    def from_labels(cls, rows) -> LabelsBatch:
+        """Create `LabelsBatch` from SQLAlchemy `Labels` models (or dicts)."""
+        rows = list(rows)
+        labels, checks = labels_models_to_matrices(rows)
+        if not rows:
+            meta = [[] for _ in LABELS_BATCH_META_COLS]
+        else:
+            get_meta = (
+                itemgetter(*LABELS_BATCH_META_COLS)
+                if isinstance(rows[0], dict)
+                else attrgetter(*LABELS_BATCH_META_COLS)
+            )
+            meta = list(zip(*map(get_meta, rows)))
+        match_id, player_id, points, prestige, user_id, extr_id, date_modified = meta
+        date_modified, tz = _utc_dates(date_modified)
+        return cls(
+            match_id=np.array(match_id, dtype=np.int64),
+            player_id=np.array(player_id, dtype=np.int64),
+            labels=labels,
+            points=_nullable_ints(points),
+            prestige=_nullable_ints(prestige),
+            checks=checks,
+            user_id=_nullable_ints(user_id),
+            extr_id=_nullable_ints(extr_id),
+            date_modified=date_modified,
+            tz=tz,
         )
-        return labels_out
+
+    @classmethod
+    def from_numpy(cls, arrays: dict[str, np.ndarray], tz: dt.tzinfo | None = None) -> LabelsBatch:
+        """Create `LabelsBatch` from the column arrays of `to_numpy` (and its 'tz')."""
+        return cls(
+            match_id=arrays["match_id"],
+            player_id=arrays["player_id"],
+            labels=np.column_stack([arrays[col] for col in SQL_COLS.ALL_FLATTENED]),
+            points=arrays["points"],
+            prestige=arrays["prestige"],
+            checks=np.column_stack([arrays[col] for col in SQL_COLS.MANUALLY_CHECKED_COLS]),
+            user_id=arrays["user_id"],
+            extr_id=arrays["extr_id"],
+            date_modified=arrays["date_modified"],
+            tz=tz,
+        )
+
+    @classmethod
+    def from_pandas(cls, df: pd.DataFrame) -> LabelsBatch:
+        """Create `LabelsBatch` from the DataFrame of `to_pandas`."""
+        arrays = {
+            col: df[col].to_numpy(dtype=np.int64, na_value=NULL_SENTINEL)
+            for col in LABELS_BATCH_META_COLS[:-1] + SQL_COLS.ALL_FLATTENED
+        }
+        arrays |= {
+            col: np.where(
+                df[col].isna().to_numpy(),
+                MCKD_NULL,
+                df[col].to_numpy(dtype=bool, na_value=False),
+            ).astype(np.int8)
+            for col in SQL_COLS.MANUALLY_CHECKED_COLS
+        }
+        dates = df["date_modified"]
+        tz = dates.dt.tz
+        if tz is not None:
+            dates = dates.dt.tz_convert("UTC").dt.tz_localize(None)
+        arrays["date_modified"] = dates.to_numpy(dtype="datetime64[us]")
+        return cls.from_numpy(arrays, tz)
+
+    def __len__(self) -> int:
+        return self.match_id.shape[0]
+
+    def __getitem__(self, key) -> LabelsOut | LabelsBatch:
+        """An integer key returns a `LabelsOut` (built on access),
+        any other key (slice, mask, indices) returns a `LabelsBatch`.
+        """
+        if isinstance(key, (int, np.integer)):
+            i = range(len(self))[key]
+            return next(iter(self._take(slice(i, i + 1))))
+        return self._take(key)
+
+    def __iter__(self) -> Iterator[LabelsOut]:
+        """Iterate over the rows as `LabelsOuts`, built lazily and validated
+        in bulk `LABELS_BLOCK_ROWS` rows at a time.
+        """
+        for start in range(0, len(self), LABELS_BLOCK_ROWS):
+            yield from self._take(slice(start, start + LABELS_BLOCK_ROWS))._labels_outs()
+
+    def _take(self, key) -> LabelsBatch:
+        return LabelsBatch(
+            match_id=self.match_id[key],
+            player_id=self.player_id[key],
+            labels=self.labels[key],
+            points=self.points[key],
+            prestige=self.prestige[key],
+            checks=self.checks[key],
+            user_id=self.user_id[key],
+            extr_id=self.extr_id[key],
+            date_modified=self.date_modified[key],
+            tz=self.tz,
+        )
+
+    @property
+    def packed_checks(self) -> np.ndarray:
+        """(N,) uint16 packed manual checks (see `pack_checks`)."""
+        return pack_checks(self.checks)
+
+    def to_numpy(self) -> dict[str, np.ndarray]:
+        """Columns as NumPy arrays (no copy), keyed by their SQL column names."""
+        return (
+            {"match_id": self.match_id, "player_id": self.player_id}
+            | {col: self.labels[:, j] for j, col in enumerate(SQL_COLS.ALL_FLATTENED)}
+            | {"points": self.points, "prestige": self.prestige}
+            | {col: self.checks[:, j] for j, col in enumerate(SQL_COLS.MANUALLY_CHECKED_COLS)}
+            | {
+                "user_id": self.user_id,
+                "extr_id": self.extr_id,
+                "date_modified": self.date_modified,
+            }
+        )
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Columns as a DataFrame with nullable 'Int64' and 'boolean' columns.
+        The masked arrays wrap the batch arrays instead of boxing each value.
+        """
+        nullable = {"points", "prestige", "user_id", "extr_id"} | set(SQL_COLS.ALL_FLATTENED)
+        columns = {}
+        for col, arr in self.to_numpy().items():
+            if col in nullable:
+                columns[col] = pd.arrays.IntegerArray(
+                    np.ascontiguousarray(arr),
+                    arr == NULL_SENTINEL,
+                )
+            elif col in SQL_COLS.MANUALLY_CHECKED_COLS:
+                columns[col] = pd.arrays.BooleanArray(arr == 1, arr == MCKD_NULL)
+            elif (col == "date_modified") and (self.tz is not None):
+                columns[col] = pd.DatetimeIndex(arr).tz_localize("UTC").tz_convert(self.tz)
+            else:
+                columns[col] = arr
+        return pd.DataFrame(columns, copy=False)
+
+    def to_json(self) -> str:
+        """JSON array of the rows (see `iter_json`)."""
+        return b"".join(self.iter_json()).decode()
+
+    def iter_json(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Stream the rows as a JSON array, in bytes chunks of about 'chunk_size' bytes.
+        Rows are dumped by the cached `LabelsOut` list serializer, `LABELS_BLOCK_ROWS`
+        rows at a time, so that there are never more `LabelsOuts` than a block.
+        """
+        from dbdie_classes.schemas.adapters import dump_json_many  # adapters imports this module
+
+        assert chunk_size > 0, "Chunk size must be positive"
+        buf = bytearray(b"[")
+        for start in range(0, len(self), LABELS_BLOCK_ROWS):
+            block = self._take(slice(start, start + LABELS_BLOCK_ROWS))._labels_outs()
+            if start > 0:
+                buf += b","
+            buf += dump_json_many(LabelsOut, block)[1:-1]  # without its brackets
+            if len(buf) >= chunk_size:
+                yield bytes(buf)
+                buf.clear()
+        buf += b"]"
+        yield bytes(buf)
+
+    def _labels_outs(self) -> list[LabelsOut]:
+        from dbdie_classes.schemas.adapters import validate_many  # adapters imports this module
+
+        return validate_many(LabelsOut, self._records())
+
+    def _records(self) -> Iterator[dict]:
+        """Rows in the `LabelsOut.from_labels` input dict form."""
+        ixs = {col: j for j, col in enumerate(SQL_COLS.ALL_FLATTENED)}
+        perks_ixs = slice(ixs[SQL_COLS.PERKS[0]], ixs[SQL_COLS.PERKS[-1]] + 1)
+        addons_ixs = slice(ixs[SQL_COLS.ADDONS[0]], ixs[SQL_COLS.ADDONS[-1]] + 1)
+        char_ix, item_ix = ixs[SQL_COLS.CHARACTER[0]], ixs[SQL_COLS.ITEM[0]]
+        offering_ix, status_ix = ixs[SQL_COLS.OFFERING[0]], ixs[SQL_COLS.STATUS[0]]
+
+        checks = MCKD_VALUES[self.checks].tolist()  # MCKD_NULL (-1) indexes None
+        dates = self.date_modified.tolist()
+        if self.tz is not None:
+            dates = [date.replace(tzinfo=dt.timezone.utc).astimezone(self.tz) for date in dates]
+
+        for (
+            match_id, player_id, labels, points, prestige, user_id, extr_id, mckd, date,
+        ) in zip(
+            self.match_id.tolist(),
+            self.player_id.tolist(),
+            _to_optional(self.labels).tolist(),
+            _to_optional(self.points).tolist(),
+            _to_optional(self.prestige).tolist(),
+            _to_optional(self.user_id).tolist(),
+            _to_optional(self.extr_id).tolist(),
+            checks,
+            dates,
+        ):
+            perks = labels[perks_ixs]
+            addons = labels[addons_ixs]
+            yield {
+                "match_id": match_id,
+                "player": {
+                    "id": player_id,
+                    "character_id": labels[char_ix],
+                    "perk_ids": perks if None not in perks else None,
+                    "item_id": labels[item_ix],
+                    "addon_ids": addons if None not in addons else None,
+                    "offering_id": labels[offering_ix],
+                    "status_id": labels[status_ix],
+                    "points": points,
+                    "prestige": prestige,
+                },
+                "user_id": user_id,
+                "extr_id": extr_id,
+                "manual_checks": {"predictables": dict(zip(ALL_MT, mckd))},
+                "date_modified": date,
+            }
 
 
 class FullMatchOut(BaseModel):
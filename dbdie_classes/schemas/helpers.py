@@ -72,27 +72,27 @@ class DBDVersionOut(DBDVersionCreate):
 
     def __eq__(self, other) -> bool:
         check_type(other, DBDVersionOut, allow_none=True)
-        return coalesce(other, self.id == other.id, else_val=False)
+        return coalesce(other, (other is not None) and (self.id == other.id), else_val=False)
 
     def __ne__(self, other) -> bool:
         check_type(other, DBDVersionOut, allow_none=True)
-        return coalesce(other, self.id != other.id, else_val=True)
+        return coalesce(other, (other is not None) and (self.id != other.id), else_val=True)
 
     def __le__(self, other) -> bool:
         check_type(other, DBDVersionOut, allow_none=True)
-        return coalesce(other, self.id <= other.id, else_val=True)
+        return coalesce(other, (other is not None) and (self.id <= other.id), else_val=True)
 
     def __lt__(self, other) -> bool:
         check_type(other, DBDVersionOut, allow_none=True)
-        return coalesce(other, self.id < other.id, else_val=True)
+        return coalesce(other, (other is not None) and (self.id < other.id), else_val=True)
 
     def __ge__(self, other) -> bool:
         check_type(other, DBDVersionOut, allow_none=True)
-        return coalesce(other, self.id >= other.id, else_val=False)
+        return coalesce(other, (other is not None) and (self.id >= other.id), else_val=False)
 
     def __gt__(self, other) -> bool:
         check_type(other, DBDVersionOut, allow_none=True)
-        return coalesce(other, self.id > other.id, else_val=False)
+        return coalesce(other, (other is not None) and (self.id > other.id), else_val=False)
 
 
 class DBDVersionRange(BaseModel):
@@ -149,7 +149,7 @@ class DBDVersionRange(BaseModel):
             else other.dbdv_min
         )
         dbdv_max = intersect_dbdv_max(self, other)
-        return DBDVersionRange(dbdv_min, dbdv_max)
+        return DBDVersionRange(dbdv_min=dbdv_min, dbdv_max=dbdv_max)
 
     @classmethod
     def from_dicts(cls, dbdv_min: dict, dbdv_max: dict | None) -> DBDVersionRange:
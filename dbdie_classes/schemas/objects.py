@@ -179,22 +179,36 @@ class ExtractorOut(ExtractorCreate):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @staticmethod
+    def _sqla_kwargs(extractor) -> dict:
+        return {
+            "id": extractor.id,
+            "name": extractor.name,
+            "user_id": extractor.user_id,
+            "dbdv_min_id": extractor.dbdv_min_id,
+            "dbdv_max_id": extractor.dbdv_max_id,
+            "special_mode": extractor.special_mode,
+            "cps_id": extractor.cps_id,
+            "models_ids": {
+                f"mid_{i}": getattr(extractor, f"mid_{i}")
+                for i in range(TOTAL_VALID_FMTS)
+            },
+            "date_created": extractor.date_created,
+            "date_modified": extractor.date_modified,
+            "date_last_trained": extractor.date_last_trained,
+        }
+
     @classmethod
     def from_sqla(cls, extractor) -> ExtractorOut:
         """Create `ExtractorOut` from a SQLAlchemy Extractor model."""
-        return cls(
-            id=extractor.id,
-            name=extractor.name,
-            user_id=extractor.user_id,
-            dbdv_min_id=extractor.dbdv_min_id,
-            dbdv_max_id=extractor.dbdv_max_id,
-            special_mode=extractor.special_mode,
-            cps_id=extractor.cps_id,
-            models_ids=ExtractorModelsIds.from_extractor(extractor),
-            date_created=extractor.date_created,
-            date_modified=extractor.date_modified,
-            date_last_trained=extractor.date_last_trained,
-        )
+        return cls.model_validate(cls._sqla_kwargs(extractor))
+
+    @classmethod
+    def from_sqla_many(cls, extractors) -> list[ExtractorOut]:
+        """Create `ExtractorOuts` from many SQLAlchemy Extractor models, validated in bulk."""
+        from dbdie_classes.schemas.adapters import validate_many  # adapters imports this module
+
+        return validate_many(cls, map(cls._sqla_kwargs, extractors))
 
     def model_post_init(self, __context) -> None:
         pass  # TODO: After registering a working Extractor, reinstate the any condition
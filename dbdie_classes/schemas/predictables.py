@@ -4,6 +4,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from dbdie_classes.base import Emoji, IsForKiller, LabelId, LabelName
 from dbdie_classes.code.predictables import emoji_len_func
+from dbdie_classes.code.schemas import USER_ID_TO_IFK
 
 
 class ItemCreate(BaseModel):
@@ -83,6 +84,14 @@ class PerkOut(PerkCreate):
     id: LabelId  = Field(..., description="Perk's ID")
     model_config = ConfigDict(from_attributes=True)
 
+    @property
+    def ifk(self) -> IsForKiller:
+        """Is for Killer, from the special character ID (None if for all).
+        Perks of regular characters also return None, since their ifk
+        is their character's (see `perk_ifk`).
+        """
+        return USER_ID_TO_IFK.get(self.character_id)
+
 
 class OfferingCreate(BaseModel):
     """Offering creation schema."""
@@ -100,6 +109,11 @@ class OfferingOut(OfferingCreate):
     id: LabelId  = Field(..., description="Offering's ID")
     model_config = ConfigDict(from_attributes=True)
 
+    @property
+    def ifk(self) -> IsForKiller:
+        """Is for Killer, from the special user ID (None if for all)."""
+        return USER_ID_TO_IFK.get(self.user_id)
+
 
 class StatusCreate(BaseModel):
     """Final player match status creation schema."""
@@ -0,0 +1,234 @@
+"""Memory-mapped crop shards.
+
+A shard holds many fixed-shape crops of a single full model type, so that
+training doesn't need to open one small image file per crop. Shards live in
+'{CROPS_MAIN_FD_RP}/{fmt}/shards' and are made of 2 files:
+
+- '{name}.npy': (N, h, w, C) uint8 array with the crops.
+- '{name}.index.npy': (N,) `SHARD_INDEX_DTYPE` sidecar index that maps
+  each (MatchId, PlayerId, slot) to its row offset in the crops array.
+
+The slot is the position of the crop in the player snippet, e.g. 0-3 for perks.
+"""
+
+from __future__ import annotations
+
+from os import listdir, makedirs
+from os.path import isdir, join
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from dbdie_classes.paths import CROPS_MAIN_FD_RP, INFERENCE_CROPS_MAIN_FD_RP, absp
+
+if TYPE_CHECKING:
+    from dbdie_classes.base import FullModelType, MatchId, Path, PathToFolder, PlayerId
+
+ShardKey = tuple["MatchId", "PlayerId", int]  # match id, player id, slot
+
+SHARDS_FD = "shards"
+CROPS_EXT = ".npy"
+INDEX_EXT = ".index.npy"
+
+SHARD_INDEX_DTYPE = np.dtype(
+    [
+        ("match_id",  "<i8"),
+        ("player_id", "u1"),
+        ("slot",      "u1"),
+        ("row",       "<i8"),
+    ]
+)
+
+
+def shards_fd(fmt: "FullModelType", is_inference: bool = False) -> "PathToFolder":
+    """Absolute path of the shards folder of a full model type."""
+    main_rp = INFERENCE_CROPS_MAIN_FD_RP if is_inference else CROPS_MAIN_FD_RP
+    return absp(join(main_rp, fmt, SHARDS_FD))
+
+
+def shard_paths(fd: "PathToFolder", name: str) -> tuple["Path", "Path"]:
+    """Paths of the crops and index files of a shard."""
+    return join(fd, name + CROPS_EXT), join(fd, name + INDEX_EXT)
+
+
+def write_shard(
+    fd: "PathToFolder",
+    name: str,
+    crops: np.ndarray,
+    keys: list[ShardKey],
+) -> None:
+    """Write a shard of same-shape crops, one `ShardKey` per crop."""
+    assert crops.ndim in (3, 4), "Crops must be a (N, h, w) or (N, h, w, C) array"
+    assert len(keys) == crops.shape[0], "There must be 1 key per crop"
+
+    index = np.array(
+        [(mid, pid, slot, row) for row, (mid, pid, slot) in enumerate(keys)],
+        dtype=SHARD_INDEX_DTYPE,
+    )
+    assert np.unique(index[["match_id", "player_id", "slot"]]).size == len(keys), (
+        "Shard keys can't repeat"
+    )
+
+    crops_path, index_path = shard_paths(fd, name)
+    makedirs(fd, exist_ok=True)
+    np.save(crops_path, np.ascontiguousarray(crops))
+    np.save(index_path, index)
+
+
+def key_codes(keys) -> np.ndarray:
+    """`ShardKeys` (a (B, 3) array-like or a `SHARD_INDEX_DTYPE` index)
+    to sortable int64 codes: match id, player id and slot packed in 1 int.
+    """
+    if isinstance(keys, np.ndarray) and keys.dtype.names:
+        match_ids, player_ids, slots = keys["match_id"], keys["player_id"], keys["slot"]
+    else:
+        keys = np.asarray(keys, dtype=np.int64).reshape(-1, 3)
+        match_ids, player_ids, slots = keys[:, 0], keys[:, 1], keys[:, 2]
+    return (
+        (match_ids.astype(np.int64) << 16)
+        | (player_ids.astype(np.int64) << 8)
+        | slots.astype(np.int64)
+    )
+
+
+def _search(sorted_codes: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Positions of 'codes' in 'sorted_codes', raising a KeyError for missing codes."""
+    pos = np.minimum(np.searchsorted(sorted_codes, codes), sorted_codes.size - 1)
+    found = (sorted_codes[pos] == codes) if sorted_codes.size else np.zeros(codes.shape, dtype=bool)
+    if not found.all():
+        raise KeyError(f"{np.count_nonzero(~found)} shard key(s) not found")
+    return pos
+
+
+class CropShard:
+    """Memory-mapped crop shard.
+    Integer and slice keys return zero-copy views of the crops.
+    `ShardKeys` are looked up with a binary search over the sorted index codes.
+    """
+
+    def __init__(self, crops: np.ndarray, index: np.ndarray) -> None:
+        assert crops.shape[0] == index.shape[0], "Crops and index must be of the same length"
+        self.crops = crops
+        self.index = index
+        codes = key_codes(index)
+        order = np.argsort(codes, kind="stable")
+        self._codes = codes[order]
+        self._rows = index["row"][order]
+
+    @classmethod
+    def open(cls, fd: "PathToFolder", name: str) -> CropShard:
+        """Memory-map an existing shard."""
+        crops_path, index_path = shard_paths(fd, name)
+        return cls(
+            crops=np.load(crops_path, mmap_mode="r"),
+            index=np.load(index_path),
+        )
+
+    def __len__(self) -> int:
+        return self.crops.shape[0]
+
+    def __getitem__(self, key: int | slice) -> np.ndarray:
+        return self.crops[key]
+
+    def __contains__(self, key: ShardKey) -> bool:
+        try:
+            self.row(key)
+        except KeyError:
+            return False
+        return True
+
+    def rows_of(self, keys) -> np.ndarray:
+        """Row offsets of many `ShardKeys`."""
+        return self._rows[_search(self._codes, key_codes(keys))]
+
+    def row(self, key: ShardKey) -> int:
+        """Row offset of a `ShardKey`."""
+        return int(self.rows_of([key])[0])
+
+    def get(self, key: ShardKey) -> np.ndarray:
+        """Crop of a `ShardKey` (no copy)."""
+        return self.crops[self.row(key)]
+
+    def batch(self, rows: np.ndarray | list[int], out: np.ndarray | None = None) -> np.ndarray:
+        """Random-access batch of rows, copied into a contiguous (B, h, w(, C)) array.
+        'out' can be a preallocated buffer.
+        """
+        return np.take(self.crops, rows, axis=0, out=out)
+
+
+class CropShardReader:
+    """Reader of all the crop shards of a full model type.
+    The shards' index codes are merged into a single sorted array of global
+    positions, which map back to their shard with a per-shard offsets array.
+    """
+
+    def __init__(self, fd: "PathToFolder") -> None:
+        self.fd = fd
+        names = sorted(
+            f[:-len(INDEX_EXT)]
+            for f in (listdir(fd) if isdir(fd) else [])
+            if f.endswith(INDEX_EXT)
+        )
+        self.shards = {name: CropShard.open(fd, name) for name in names}
+        self._shards = list(self.shards.values())
+        lens = [len(shard) for shard in self._shards]
+        self._offsets = np.cumsum([0] + lens)[:-1]
+
+        codes = np.concatenate([np.empty(0, dtype=np.int64)] + [sh._codes for sh in self._shards])
+        positions = np.concatenate(
+            [np.empty(0, dtype=np.int64)]
+            + [sh._rows + offset for sh, offset in zip(self._shards, self._offsets.tolist())]
+        )
+        order = np.argsort(codes, kind="stable")
+        self._codes = codes[order]
+        self._positions = positions[order]
+        assert (np.diff(self._codes) != 0).all(), "Shard keys can't repeat across shards"
+
+    @classmethod
+    def from_fmt(cls, fmt: "FullModelType", is_inference: bool = False) -> CropShardReader:
+        """Create `CropShardReader` for the shards folder of a full model type."""
+        return cls(shards_fd(fmt, is_inference))
+
+    def __len__(self) -> int:
+        return self._codes.size
+
+    def __contains__(self, key: ShardKey) -> bool:
+        try:
+            self.locate([key])
+        except KeyError:
+            return False
+        return True
+
+    @property
+    def keys(self) -> list[ShardKey]:
+        """All the `ShardKeys`, in shard and row order."""
+        index = np.concatenate([np.empty(0, dtype=SHARD_INDEX_DTYPE)] + [sh.index for sh in self._shards])
+        return list(zip(*(index[col].tolist() for col in ["match_id", "player_id", "slot"])))
+
+    def locate(self, keys) -> tuple[np.ndarray, np.ndarray]:
+        """Shard numbers (in `shards` order) and row offsets of many `ShardKeys`."""
+        positions = self._positions[_search(self._codes, key_codes(keys))]
+        shard_ixs = np.searchsorted(self._offsets, positions, side="right") - 1
+        return shard_ixs, positions - self._offsets[shard_ixs]
+
+    def get(self, key: ShardKey) -> np.ndarray:
+        """Crop of a `ShardKey` (no copy)."""
+        shard_ixs, rows = self.locate([key])
+        return self._shards[shard_ixs[0]][rows[0]]
+
+    def batch(self, keys: list[ShardKey], out: np.ndarray | None = None) -> np.ndarray:
+        """Random-access batch of `ShardKeys`, copied into a contiguous array.
+        'out' can be a preallocated buffer.
+        """
+        shard_ixs, rows = self.locate(keys)
+        if out is None:
+            assert self.shards, "Can't infer the crop shape of an empty batch without shards"
+            crops = self._shards[shard_ixs[0] if len(keys) else 0].crops
+            out = np.empty((len(keys), *crops.shape[1:]), dtype=crops.dtype)
+        else:
+            assert out.shape[0] == len(keys), "Output buffer must have 1 row per key"
+
+        for shard_ix in np.unique(shard_ixs).tolist():
+            positions = np.flatnonzero(shard_ixs == shard_ix)
+            out[positions] = self._shards[shard_ix].crops[rows[positions]]
+        return out
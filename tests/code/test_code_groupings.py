@@ -1,9 +1,41 @@
 """Tests for groupings extra code."""
 
+from itertools import product
+from types import SimpleNamespace
+
+import numpy as np
 from pytest import mark, raises
 
 from dbdie_classes.options import SQL_COLS
-from dbdie_classes.code.groupings import check_strict
+from dbdie_classes.code.groupings import (
+    MCKD_NULL,
+    check_strict,
+    checks_flags,
+    decode_checks,
+    encode_checks,
+    labels_model_to_checks,
+    labels_model_to_labeled_predictables,
+    labels_models_to_matrices,
+    pack_checks,
+    packed_checks_flags,
+    sqlds_by_signature,
+    unpack_checks,
+)
+from dbdie_classes.options.NULL_IDS import NULL_SENTINEL
+from dbdie_classes.schemas.groupings import (
+    LabelsCreate,
+    ManualChecksIn,
+    ManualChecksOut,
+    PlayerIn,
+)
+from dbdie_classes.options.MODEL_TYPE import ALL as ALL_MT
+
+COLS = SQL_COLS.ALL_FLATTENED + SQL_COLS.MANUALLY_CHECKED_COLS
+ROWS = [
+    dict(zip(COLS, list(range(10)) + [True, False, None, True, True, None, None, False])),
+    dict(zip(COLS, [None] * 10 + [None] * 8)),
+    dict(zip(COLS, [7, 1, 2, 3, 4, None, 5, 6, 8, 9] + [True] * 8)),
+]
 
 
 class TestCodeGroupings:
@@ -33,3 +65,97 @@ class TestCodeGroupings:
                 match= "There can't be different model types in strict mode",
             ):
                 check_strict(strict, sqld)
+
+    def test_labels_models_to_matrices(self):
+        models = [SimpleNamespace(**row) for row in ROWS]
+        exp_labels = [
+            [NULL_SENTINEL if v is None else v for v in labels_model_to_labeled_predictables(m)]
+            for m in models
+        ]
+        exp_checks = [
+            [{True: 1, False: 0, None: MCKD_NULL}[v] for v in labels_model_to_checks(m)]
+            for m in models
+        ]
+        for rows, columns in [
+            (ROWS, None),
+            (iter(models), None),
+            ([tuple(row[c] for c in COLS) for row in ROWS], None),
+            ([tuple(row[c] for c in COLS[::-1]) for row in ROWS], COLS[::-1]),
+        ]:
+            labels, checks = labels_models_to_matrices(rows, columns)
+            assert labels.shape == (3, len(SQL_COLS.ALL_FLATTENED))
+            assert labels.tolist() == exp_labels
+            assert checks.dtype == "int8"
+            assert checks.tolist() == exp_checks
+
+        labels, checks = labels_models_to_matrices([])
+        assert labels.shape == (0, 10) and checks.shape == (0, 8)
+
+    def test_sqlds_by_signature(self):
+        players = [
+            PlayerIn(id=0, character_id=3, perk_ids=[1, 2, 3, 4]),
+            PlayerIn(id=1, item_id=5, addon_ids=[6, 7], points=100),
+            PlayerIn(id=2, character_id=8, perk_ids=[9, 10, 11, 12]),
+            PlayerIn(id=3, status_id=2),
+        ]
+        params = sqlds_by_signature(players, strict=False)
+        assert len(params) == 3
+
+        for player in players:
+            fps = player.filled_predictables()
+            cols, rows = params[tuple(fps)]
+            exp = player.to_sqla(fps, strict=False)
+            assert any(dict(zip(cols, row)) == exp for row in rows)
+
+        labels = [
+            LabelsCreate(match_id=10 + p.id, player=p, user_id=1, manual_checks=ManualChecksIn())
+            for p in players
+        ]
+        cols, rows = sqlds_by_signature(labels, strict=False)[("status_id",)]
+        assert dict(zip(cols, rows[0])) == {
+            "player_id": 3, "status": 2, "status_mckd": True,
+            "match_id": 13, "user_id": 1, "extr_id": None,
+        }
+
+    def test_sqlds_by_signature_strict(self):
+        sqlds_by_signature([PlayerIn(id=0, status_id=2)], strict=True)
+        with raises(AssertionError):
+            sqlds_by_signature([PlayerIn(id=0, character_id=3, status_id=2)], strict=True)
+
+    def test_packed_checks(self):
+        rng = np.random.default_rng(0)
+        all_checks = [list(chks) for chks in product([None, False, True], repeat=3)]
+        all_checks = [
+            chks + rng.choice([None, False, True], size=len(ALL_MT) - 3).tolist()
+            for chks in all_checks
+        ] + [[True] * len(ALL_MT), [None] * len(ALL_MT)]
+
+        for checks in all_checks:
+            packed = encode_checks(checks)
+            assert 0 <= packed < 2 ** 16
+            assert decode_checks(packed) == checks
+
+            mco = ManualChecksOut(predictables=dict(zip(ALL_MT, checks)))
+            mci = ManualChecksIn(**dict(zip(ALL_MT, checks)))
+            flags = (mco.is_init, mco.in_progress, mco.completed)
+            assert checks_flags(packed) == flags
+            assert (mci.is_init, mci.in_progress, mci.completed) == flags
+            assert mco.packed == mci.packed == packed
+            assert ManualChecksOut.from_packed(packed) == mco
+            assert ManualChecksIn.from_packed(packed) == mci
+
+    def test_packed_checks_vectorized(self):
+        _, checks = labels_models_to_matrices(ROWS)
+        packed = pack_checks(checks)
+        assert packed.dtype == np.uint16
+        assert packed.tolist() == [
+            encode_checks([row[col] for col in SQL_COLS.MANUALLY_CHECKED_COLS])
+            for row in ROWS
+        ]
+        assert (unpack_checks(packed) == checks).all()
+
+        is_init, in_progress, completed = packed_checks_flags(packed)
+        assert is_init.tolist() == [True, False, True]
+        assert in_progress.tolist() == [True, False, True]
+        assert completed.tolist() == [False, False, True]
+        assert pack_checks(np.empty((0, len(ALL_MT)), dtype=np.int8)).shape == (0,)
@@ -5,6 +5,7 @@ from dbdie_classes.code.schemas import (
     check_item_consistency,
     check_killer_consistency,
     check_status_consistency,
+    perk_ifk,
 )
 
 
@@ -105,3 +106,17 @@ class TestCodeSchemas:
         ifk,
     ):
         assert exp == check_status_consistency(status_character_id, ifk)
+
+    @mark.parametrize(
+        "exp,character_id",
+        [
+            (None,  0),
+            (True,  1),
+            (False, 2),
+            (True,  10),
+            (False, 11),
+            (None,  99),
+        ],
+    )
+    def test_perk_ifk(self, exp, character_id):
+        assert exp == perk_ifk(character_id, {1: False, 10: True, 11: False})
@@ -0,0 +1,39 @@
+"""Mock objects shared by the tests (and the benchmarks)."""
+
+import datetime as dt
+from types import SimpleNamespace
+
+from dbdie_classes.extract import PlayerInfo
+from dbdie_classes.options import SQL_COLS
+from dbdie_classes.options.MODEL_TYPE import ALL as ALL_MT
+
+
+def mock_player_info(seed: int) -> PlayerInfo:
+    return PlayerInfo(
+        character_id=seed,
+        perks_ids=(seed + 1, seed + 2, seed + 3, seed + 4),
+        item_id=seed + 5,
+        addons_ids=(seed + 6, seed + 7),
+        offering_id=seed + 8,
+        status_id=seed + 9,
+        points=1000 * seed,
+        prestige=seed % 100,
+    )
+
+
+def mock_labels(i: int, **kwargs) -> SimpleNamespace:
+    """Mock SQLAlchemy `Labels` row."""
+    return SimpleNamespace(
+        **{
+            "match_id": i,
+            "player_id": i % 5,
+            "user_id": 1,
+            "extr_id": None,
+            "date_modified": dt.datetime(2024, 1, 1),
+            "points": None,
+            "prestige": None,
+            **{col: i % 17 for col in SQL_COLS.ALL_FLATTENED},
+            **{f"{mt}_mckd": bool(i % 2) for mt in ALL_MT},
+        }
+        | kwargs
+    )
@@ -0,0 +1,42 @@
+"""Tests for CATEGORICAL options script."""
+
+import pandas as pd
+from pytest import raises
+
+from dbdie_classes.options import FMT_CODES
+from dbdie_classes.options.CATEGORICAL import (
+    FMT_DTYPE, from_categorical, to_categorical
+)
+
+
+def mock_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "fmt": ["perks__killer", "points", "status__surv", None],
+            "mt": ["perks", "points", "status", None],
+            "pt": ["killer", None, "surv", None],
+            "other": [1, 2, 3, 4],
+        }
+    )
+
+
+class TestCategorical:
+    def test_to_categorical(self):
+        df = mock_df()
+        to_categorical(df)
+        assert df["fmt"].dtype == FMT_DTYPE
+        assert all(df[col].dtype == "category" for col in ["fmt", "mt", "pt"])
+        assert df["other"].dtype == "int64"
+        assert df["fmt"].cat.codes.tolist()[:3] == FMT_CODES.to_codes(
+            ["perks__killer", "points", "status__surv"]
+        ).tolist()
+        assert df.groupby("pt", observed=True)["other"].sum().to_dict() == {"surv": 3, "killer": 1}
+
+        from_categorical(df)
+        assert df.equals(mock_df())
+
+    def test_to_categorical_raises(self):
+        df = mock_df()
+        df.loc[1, "mt"] = "anothermt"
+        with raises(AssertionError, match="anothermt"):
+            to_categorical(df)
@@ -0,0 +1,41 @@
+"""Tests for FMT_CODES options script."""
+
+import numpy as np
+import pandas as pd
+from pytest import raises
+
+from dbdie_classes.options import FMT, IMPLEMENTED, PLAYER_FMT
+from dbdie_classes.options import FMT_CODES as FC
+
+
+class TestFMTCodes:
+    def test_registry(self):
+        assert FC.ALL[:len(FMT.ALL)] == FMT.ALL
+        assert set(PLAYER_FMT.ALL) <= set(FC.ALL)
+        for code, fmt in enumerate(FC.ALL):
+            assert FC.to_code(fmt) == code
+            assert FC.from_code(code) == fmt
+            mt, pt, ifk = FC.code_to_mt_pt_ifk(code)
+            assert (mt, pt, ifk) == FMT.from_fmt(fmt)
+            assert FC.mt_and_pt_to_code(mt, pt) == code
+        assert FC.from_codes(FC.IMPLEMENTED_CODES).tolist() == IMPLEMENTED.FMTS
+        assert FC.IS_IMPLEMENTED.sum() == len(IMPLEMENTED.FMTS)
+
+    def test_vectorized(self):
+        fmts = ["perks__killer", "points", None, "player__surv", "perks__killer"]
+        codes = FC.to_codes(fmts)
+        assert codes.dtype == np.uint8
+        assert codes.tolist() == [4, 11, FC.NULL_CODE, 13, 4]
+        assert FC.from_codes(codes).tolist() == fmts
+
+        series = pd.Series(["status__surv", np.nan])
+        assert FC.to_codes(series).tolist() == [FC.CODES["status__surv"], FC.NULL_CODE]
+        assert FC.to_codes(np.array([["points"], ["prestige"]])).shape == (2, 1)
+
+    def test_vectorized_raises(self):
+        with raises(AssertionError):
+            FC.to_codes(["perks__killer", "anotherfmt"])
+        with raises(AssertionError):
+            FC.from_codes(np.array([4, len(FC.ALL), FC.NULL_CODE], dtype=np.uint8))
+        with raises(AssertionError):
+            FC.from_codes([4, -1])
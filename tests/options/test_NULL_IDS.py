@@ -4,7 +4,8 @@ import pandas as pd
 from pytest import mark
 
 from dbdie_classes.options import MODEL_TYPE as MT
-from dbdie_classes.options.NULL_IDS import mt_is_null
+from dbdie_classes.options import SQL_COLS
+from dbdie_classes.options.NULL_IDS import NULL_SENTINEL, labels_null_mask, mt_is_null
 
 T = True
 F = False
@@ -35,3 +36,35 @@ class TestNullIds:
         assert (
             mt_is_null(pd.Series(data), mt) == pd.Series(exp)
         ).all()
+
+    def test_labels_null_mask(self):
+        # character, perks_0-3, item, addons_0-1, offering, status
+        data = [
+            [0, 5, 1, 0, 1,    1, 0, 9, 1, 0],  # surv
+            [2, 5, 1, 0, 1,    0, 0, 9, 0, 1],  # killer
+            [1, 5, 1, 0, None, 7, 0, 9, 1, 5],  # unknown
+        ]
+        exp = [
+            [T, F, T, F, T, T, F, F, T, T],
+            [F, F, F, T, F, T, T, F, T, T],
+            [T, F, T, T, T, F, T, F, T, F],
+        ]
+        df = pd.DataFrame(data, columns=SQL_COLS.ALL_FLATTENED)
+        ifks = [False, True, None]
+
+        mask = labels_null_mask(df, ifks)
+        assert mask.columns.tolist() == SQL_COLS.ALL_FLATTENED
+        assert mask.to_numpy().tolist() == exp
+
+        matrix = df.fillna(NULL_SENTINEL).to_numpy(dtype=int)
+        assert labels_null_mask(matrix, ifks).tolist() == exp
+
+    def test_labels_null_mask_unknown_ifk(self):
+        df = pd.DataFrame(
+            [[0, 1, 2, 3, 4, 0, 1, 2, 3, 4], [None] * 10],
+            columns=SQL_COLS.ALL_FLATTENED,
+        )
+        mask = labels_null_mask(df)
+        for col in SQL_COLS.ALL_FLATTENED:
+            mt = col.split("_")[0]
+            assert (mask[col] == mt_is_null(df[col], mt)).all()
@@ -0,0 +1,64 @@
+"""Tests for the cached list adapters."""
+
+import datetime as dt
+import json
+from types import SimpleNamespace
+
+from pydantic_core import ValidationError
+from pytest import raises
+
+from dbdie_classes.schemas.adapters import (
+    PUBLIC_SCHEMAS,
+    dump_json_many,
+    dump_many,
+    list_adapter,
+    validate_json_many,
+    validate_many,
+    warm_up,
+)
+from dbdie_classes.schemas.groupings import MatchOut
+from dbdie_classes.schemas.predictables import CharacterOut
+
+MATCH_DICT = {
+    "id": 1,
+    "filename": "match.png",
+    "match_date": dt.date(2024, 1, 1),
+    "dbdv_id": None,
+    "special_mode": None,
+    "user_id": 1,
+    "extr_id": None,
+    "kills": 2,
+    "date_created": dt.datetime(2024, 2, 1),
+    "date_modified": dt.datetime(2024, 2, 2),
+}
+
+
+class TestAdapters:
+    def test_public_schemas(self):
+        assert PUBLIC_SCHEMAS["MatchOut"] is MatchOut
+        assert PUBLIC_SCHEMAS["CharacterOut"] is CharacterOut
+        assert "LabelsBatch" not in PUBLIC_SCHEMAS
+        assert "BaseModel" not in PUBLIC_SCHEMAS
+
+    def test_cached(self):
+        assert list_adapter(MatchOut) is list_adapter(MatchOut)
+        assert warm_up() == len(PUBLIC_SCHEMAS)
+        assert warm_up([MatchOut]) == 1
+
+    def test_roundtrip(self):
+        dicts = [MATCH_DICT | {"id": i} for i in range(5)]
+        matches = validate_many(MatchOut, iter(dicts))
+        assert matches == [MatchOut(**d) for d in dicts]
+        assert dump_many(MatchOut, matches) == dicts
+
+        dumped = dump_json_many(MatchOut, matches)
+        assert json.loads(dumped) == [json.loads(m.model_dump_json()) for m in matches]
+        assert validate_json_many(MatchOut, dumped) == matches
+
+    def test_from_attributes(self):
+        rows = [SimpleNamespace(**MATCH_DICT)]
+        assert validate_many(MatchOut, rows, from_attributes=True) == [MatchOut(**MATCH_DICT)]
+        with raises(ValidationError):
+            validate_many(MatchOut, rows)
+        with raises(ValidationError):
+            validate_many(MatchOut, [MATCH_DICT | {"kills": 5}])
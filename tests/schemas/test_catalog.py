@@ -0,0 +1,129 @@
+"""Tests for the predictables catalog."""
+
+from types import SimpleNamespace
+
+from pytest import fixture, raises
+
+from dbdie_classes.options import MODEL_TYPE as MT
+from dbdie_classes.schemas.catalog import PredictablesCatalog
+from dbdie_classes.schemas.groupings import PlayerIn
+from dbdie_classes.schemas.helpers import DBDVersionOut
+from dbdie_classes.schemas.predictables import (
+    AddonOut,
+    CharacterOut,
+    ItemOut,
+    OfferingOut,
+    PerkOut,
+    StatusOut,
+)
+
+
+def mock_catalog_kwargs() -> dict[str, list]:
+    return {
+        "characters": [
+            CharacterOut(
+                id=i, name=f"char{i}", ifk=i == 5, base_char_id=None,
+                dbdv_id=None, common_name=None, emoji=None, power_id=None,
+            )
+            for i in range(6)
+        ],
+        "perks": [
+            PerkOut(id=i, name=f"perk{i}", character_id=5 if i >= 4 else 2, dbdv_id=None, emoji=None)
+            for i in range(8)
+        ],
+        "items": [
+            ItemOut(id=0, name="Toolbox", type_id=2, dbdv_id=None, rarity_id=None),
+            ItemOut(id=1, name="Power", type_id=1, dbdv_id=None, rarity_id=None),
+        ],
+        "addons": [
+            AddonOut(id=i, name="addon" if i < 2 else f"addon{i}", type_id=i // 2, dbdv_id=None, item_id=None, rarity_id=None)
+            for i in range(4)
+        ],
+        "offerings": [
+            OfferingOut(id=i, name=f"offering{i}", type_id=0, user_id=i, dbdv_id=None, rarity_id=None)
+            for i in range(3)
+        ],
+        "statuses": [
+            StatusOut(id=i, name=f"status{i}", character_id=i, is_dead=i == 2, dbdv_id=None, emoji=None)
+            for i in range(3)
+        ],
+        "dbdvs": [DBDVersionOut(id=7, name="7.5.0", common_name=None, release_date=None)],
+    }
+
+
+@fixture
+def catalog() -> PredictablesCatalog:
+    return PredictablesCatalog(**mock_catalog_kwargs())
+
+
+def surv(pid: int) -> PlayerIn:
+    return PlayerIn(
+        id=pid, character_id=pid, perk_ids=[0, 1, 2, 3], item_id=0, addon_ids=[0, 1],
+        offering_id=2, status_id=2 if pid < 2 else 0, points=1000, prestige=1,
+    )
+
+
+class TestPredictablesCatalog:
+    def test_indexes(self, catalog):
+        assert len(catalog) == 6 + 8 + 2 + 4 + 3 + 3
+        assert catalog.get(MT.PERKS, 3).name == "perk3"
+        assert catalog.get_by_name(MT.ITEM, "Power").id == 1
+        assert catalog.ids_by_name(MT.ADDONS, "addon") == [0, 1]
+        assert catalog.ids_by_name(MT.ADDONS, "unknown") == []
+        with raises(AssertionError):
+            catalog.get_by_name(MT.ADDONS, "addon")
+        with raises(KeyError):
+            catalog.get(MT.CHARACTER, 99)
+
+    def test_version(self, catalog):
+        kwargs = mock_catalog_kwargs()
+        kwargs["perks"] = kwargs["perks"][::-1]
+        assert PredictablesCatalog(**kwargs).version == catalog.version
+
+        kwargs["perks"][0] = kwargs["perks"][0].model_copy(update={"name": "renamed"})
+        assert PredictablesCatalog(**kwargs).version != catalog.version
+
+    def test_repeated_ids(self):
+        kwargs = mock_catalog_kwargs()
+        kwargs["items"].append(kwargs["items"][0])
+        with raises(AssertionError):
+            PredictablesCatalog(**kwargs)
+
+    def test_from_models(self, catalog):
+        kwargs = mock_catalog_kwargs()
+        models = {
+            k: [SimpleNamespace(**obj.model_dump()) for obj in objs]
+            for k, objs in kwargs.items()
+        }
+        from_models = PredictablesCatalog.from_models(**models)
+        assert from_models.version == catalog.version
+        assert from_models.dbdvs[7] == catalog.dbdvs[7]
+
+    def test_player_out(self, catalog):
+        player = catalog.player_out(surv(1))
+        assert player.character.name == "char1"
+        assert [p.id for p in player.perks] == [0, 1, 2, 3]
+        assert player.is_consistent
+        with raises(AssertionError):
+            catalog.player_out(PlayerIn(id=0, character_id=1))
+
+    def test_full_match_out(self, catalog):
+        killer = PlayerIn(
+            id=4, character_id=5, perk_ids=[4, 5, 6, 7], item_id=1, addon_ids=[2, 3],
+            offering_id=1, status_id=1, points=1000, prestige=1,
+        )
+        players = [surv(pid) for pid in range(4)] + [killer]
+        match = catalog.full_match_out(players, 7)
+        assert match.is_consistent
+        assert match.kills == 2
+        assert match.version.name == "7.5.0"
+
+        consistent, kills = catalog.engine.check_matches(
+            [[pl.character_id for pl in players]],
+            [[pl.status_id for pl in players]],
+        )
+        assert consistent.tolist() == [True]
+        assert kills.tolist() == [2]
+        assert catalog.engine.perk_ifk.tolist() == [0] * 4 + [1] * 4
+        with raises(AssertionError):
+            catalog.full_match_out(players[::-1], 7)
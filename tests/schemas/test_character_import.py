@@ -0,0 +1,102 @@
+"""Tests for the bulk character importer."""
+
+import yaml
+from pytest import mark, raises
+
+from dbdie_classes.schemas.character_import import (
+    YAML_ERROR_IX,
+    import_characters,
+    validate_character,
+)
+
+DBDV = {"id": 311, "name": "7.5.0", "common_name": "Alan Wake", "release_date": "2024-01-30"}
+
+
+def surv_def(name: str, perks: list[str]) -> dict:
+    return {
+        "name": name,
+        "ifk": False,
+        "power_name": None,
+        "perk_names": perks,
+        "addon_names": None,
+        "dbdv": DBDV,
+        "common_name": name.split()[0],
+        "emoji": "🤠",
+    }
+
+
+def killer_def(name: str, perks: list[str], addons: list[str]) -> dict:
+    return surv_def(name, perks) | {"ifk": True, "power_name": f"{name} power", "addon_names": addons}
+
+
+def addons(prefix: str) -> list[str]:
+    return [f"{prefix} addon {i}" for i in range(20)]
+
+
+class TestCharacterImport:
+    @mark.parametrize("n_workers", [0, 2])
+    def test_import(self, n_workers):
+        stream = yaml.safe_dump_all(
+            [
+                surv_def("John Doe", ["A", "B", "C"]),
+                [
+                    killer_def("The Killer", ["D", "E", "F"], addons("K")),
+                    surv_def("Jane Doe", ["G", "H", "I"]),
+                ],
+            ],
+            allow_unicode=True,
+        )
+        result = import_characters(stream, n_workers=n_workers, chunksize=1)
+        assert result.ok
+        result.raise_for_errors()
+        assert [c.name for c in result.characters.values()] == ["John Doe", "The Killer", "Jane Doe"]
+        assert result.characters[1].addon_names == addons("K")
+
+    def test_all_errors_reported(self):
+        killer = killer_def("The Killer", ["D", "E", "A"], addons("K"))
+        killer["addon_names"][3] = killer["addon_names"][2]
+        stream = yaml.safe_dump_all(
+            [
+                surv_def("John Doe", ["A", "B", "C"]),
+                surv_def("Jane Doe", ["A", "A", "C"]),
+                killer,
+                surv_def("John Doe", ["X", "Y", "Z"]),
+                surv_def("No Emoji", ["P", "Q", "R"]) | {"emoji": None, "perk_names": ["P"]},
+                "not a mapping",
+            ],
+            allow_unicode=True,
+        )
+        result = import_characters(stream)
+        assert not result.ok
+        assert sorted(result.characters) == [0, 2, 3]
+        assert list(result.errors) == [1, 4, 5, 2, 3]
+        assert result.errors[2] == [
+            "Repeated perk name 'A' (first in #0)",
+            "Repeated addon name 'K addon 2' (first in #2)",
+        ]
+        assert result.errors[3] == ["Repeated character name 'John Doe' (first in #0)"]
+        assert len(result.errors[4]) == 2
+        assert result.errors[5] == ["Character definition must be a mapping"]
+        with raises(ValueError, match="7 character import error"):
+            result.raise_for_errors()
+
+    def test_invalid_yaml(self):
+        stream = yaml.safe_dump(surv_def("John Doe", ["A", "B", "C"]), allow_unicode=True)
+        result = import_characters(stream + "---\nname: [unclosed\n")
+        assert list(result.characters) == [0]
+        assert list(result.errors) == [YAML_ERROR_IX]
+
+    def test_validate_character(self):
+        char, msgs = validate_character(surv_def("John Doe", ["A", "B"]))
+        assert char is None
+        assert msgs == ["perk_names: Assertion failed, You must provide exactly 3 perk names."]
+
+    def test_validate_character_non_str_keys(self):
+        info = surv_def("John Doe", ["A", "B", "C"]) | {1: "x"}
+        char, msgs = validate_character(info)
+        assert char is not None
+        assert msgs == []
+
+        char, msgs = validate_character({1: "x"})
+        assert char is None
+        assert msgs[0] == "name: Field required"
@@ -0,0 +1,78 @@
+"""Tests for the streaming exporters."""
+
+import csv
+import datetime as dt
+import json
+from io import StringIO
+from itertools import count
+
+from pytest import mark, raises
+
+from dbdie_classes.schemas.export import flatten_record, iter_csv, iter_ndjson
+from dbdie_classes.schemas.groupings import LabelsOut, MatchOut
+from tests.mocks import mock_labels
+
+
+def mock_match(i: int) -> MatchOut:
+    return MatchOut(
+        id=i,
+        filename=f"match_{i}.png",
+        match_date=dt.date(2024, 1, 1 + i % 28),
+        dbdv_id=i % 3 or None,
+        special_mode=None,
+        user_id=1,
+        extr_id=None,
+        kills=i % 5,
+        date_created=dt.datetime(2024, 2, 1),
+        date_modified=dt.datetime(2024, 2, 2),
+    )
+
+
+class TestExport:
+    @mark.parametrize("chunk_size", [1, 100, 1 << 16])
+    def test_ndjson(self, chunk_size):
+        matches = [mock_match(i) for i in range(50)]
+        chunks = list(iter_ndjson(matches, chunk_size))
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            json.loads(m.model_dump_json()) for m in matches
+        ]
+        max_line = max(len(line) + 1 for line in lines)
+        assert all(len(chunk) < chunk_size + max_line for chunk in chunks)
+
+    def test_ndjson_dicts(self):
+        rows = [{"id": i, "date": dt.date(2024, 1, 1)} for i in range(3)]
+        assert b"".join(iter_ndjson(rows)).decode().splitlines()[1] == (
+            '{"id":1,"date":"2024-01-01"}'
+        )
+        assert list(iter_ndjson([])) == []
+
+    def test_streaming_is_lazy(self):
+        consumed = count()
+        items = (mock_match(next(consumed)) for _ in range(10_000))
+        first = next(iter_ndjson(items, chunk_size=1000))
+        assert 0 < len(first) < 2000
+        assert next(consumed) < 20
+
+    def test_csv(self):
+        labels = [LabelsOut.from_labels(mock_labels(i)) for i in range(30)]
+        chunks = list(iter_csv(labels, chunk_size=500))
+        assert len(chunks) > 1
+        rows = list(csv.DictReader(StringIO(b"".join(chunks).decode())))
+        assert len(rows) == 30
+        assert rows[3]["match_id"] == "3"
+        assert rows[3]["player.id"] == "3"
+        assert json.loads(rows[3]["player.perk_ids"]) == labels[3].player.perk_ids
+        assert rows[3]["player.points"] == ""
+        assert rows[3]["manual_checks.predictables.perks"] == "True"
+        assert rows[3]["date_modified"] == "2024-01-01T00:00:00"
+
+    def test_csv_fieldnames(self):
+        rows = [{"a": 1, "b": {"c": None}}, {"a": 2, "b": {"c": [1, 2]}}]
+        assert b"".join(iter_csv(rows)).decode().splitlines() == ["a,b.c", "1,", '2,"[1,2]"']
+        assert b"".join(iter_csv([], fieldnames=["a", "b.c"])) == b"a,b.c\r\n"
+        with raises(ValueError):
+            list(iter_csv(rows, fieldnames=["a"]))
+
+    def test_flatten_record(self):
+        assert flatten_record({"a": {"b": {"c": 1}, "d": [None]}}) == {"a.b.c": 1, "a.d": "[null]"}
@@ -1,14 +1,23 @@
 """Tests for groupings schemas."""
 
+import datetime as dt
+import json
 from copy import deepcopy
+from types import SimpleNamespace
+import numpy as np
 from pydantic_core import ValidationError
 from pytest import mark, raises
 
 from dbdie_classes.schemas.helpers import DBDVersionOut
+from dbdie_classes.schemas import groupings
 from dbdie_classes.schemas.groupings import (
     FullCharacterCreate,
+    LabelsBatch,
+    LabelsOut,
+    ManualChecksOut,
     PlayerIn,
 )
+from tests.mocks import mock_labels
 
 BASE_FCC_DICT = {
     "name": "John Doe",
@@ -186,3 +195,114 @@ class TestGroupings:
                 points=0,
                 prestige=0,
             )
+
+
+class TestFromLabels:
+    def test_player_in_from_labels_missing_attrs(self):
+        labels = SimpleNamespace(player_id=3, perks_0=1, perks_1=2, addons_0=4, addons_1=5)
+        player = PlayerIn.from_labels(labels)
+        assert player.perk_ids is None
+        assert player.addon_ids == [4, 5]
+        assert player.character_id is None
+
+    def test_from_labels_many(self):
+        rows = [mock_labels(i) for i in range(250)]
+        exp = [LabelsOut.from_labels(row) for row in rows]
+        assert LabelsOut.from_labels_many(iter(rows)) == exp
+        assert PlayerIn.from_labels_many(rows) == [lo.player for lo in exp]
+        assert ManualChecksOut.from_labels_many(rows) == [lo.manual_checks for lo in exp]
+        assert LabelsOut.from_labels_many([]) == []
+
+    def test_from_labels_many_autocalc(self):
+        mco = ManualChecksOut.from_labels_many([mock_labels(1)])[0]
+        assert mco.is_init and mco.in_progress and mco.completed
+
+    def test_from_labels_many_raises(self):
+        rows = [mock_labels(i) for i in range(150)]
+        rows[50] = mock_labels(50, character=-1)
+        with raises(ValidationError, match="1 validation error"):
+            LabelsOut.from_labels_many(rows)
+
+
+def mock_batch_rows(n: int) -> list[SimpleNamespace]:
+    return [
+        mock_labels(
+            i,
+            points=None if i % 3 else 1000 * i,
+            prestige=i % 4 or None,
+            extr_id=None if i % 2 else 7,
+            perks_2=None if i % 5 == 0 else 3,
+            item=None if i % 4 == 0 else 2,
+            character_mckd=None if i % 3 == 0 else True,
+            date_modified=dt.datetime(2024, 1, 1, 0, 0, i % 60, 1000 * i),
+        )
+        for i in range(n)
+    ]
+
+
+class TestLabelsBatch:
+    def test_matches_labels_out(self):
+        rows = mock_batch_rows(40)
+        batch = LabelsBatch.from_labels(rows)
+        exp = [LabelsOut.from_labels(row) for row in rows]
+        assert len(batch) == 40
+        assert list(batch) == exp
+        assert batch[7] == exp[7]
+        assert batch[-1] == exp[-1]
+        assert batch.to_json() == "[" + ",".join(lo.model_dump_json() for lo in exp) + "]"
+
+    def test_iter_json(self, monkeypatch):
+        monkeypatch.setattr(groupings, "LABELS_BLOCK_ROWS", 7)
+        batch = LabelsBatch.from_labels(mock_batch_rows(40))
+        chunks = list(batch.iter_json(chunk_size=1000))
+        assert len(chunks) > 1
+        assert json.loads(b"".join(chunks)) == [json.loads(lo.model_dump_json()) for lo in batch]
+
+    def test_slicing(self):
+        batch = LabelsBatch.from_labels(mock_batch_rows(10))
+        sliced = batch[2:5]
+        assert isinstance(sliced, LabelsBatch)
+        assert np.shares_memory(sliced.labels, batch.labels)
+        assert list(sliced) == list(batch)[2:5]
+        assert len(batch[batch.player_id == 4]) == 2
+
+    def test_numpy_roundtrip(self):
+        batch = LabelsBatch.from_labels(mock_batch_rows(20))
+        arrays = batch.to_numpy()
+        assert np.shares_memory(arrays["perks_1"], batch.labels)
+        assert np.shares_memory(arrays["status_mckd"], batch.checks)
+        assert list(LabelsBatch.from_numpy(arrays)) == list(batch)
+
+    def test_pandas_roundtrip(self):
+        batch = LabelsBatch.from_labels(mock_batch_rows(20))
+        df = batch.to_pandas()
+        assert df.shape == (20, 2 + 10 + 2 + 8 + 3)
+        assert df["item"].isna().sum() == 5
+        assert df["character_mckd"].isna().sum() == 7
+        assert str(df["points"].dtype) == "Int64"
+        assert list(LabelsBatch.from_pandas(df)) == list(batch)
+
+    def test_empty(self):
+        batch = LabelsBatch.from_labels([])
+        assert len(batch) == 0
+        assert batch.to_json() == "[]"
+        assert batch.to_pandas().shape == (0, 25)
+
+    def test_tz_aware_dates(self):
+        tz = dt.timezone(dt.timedelta(hours=2))
+        rows = mock_batch_rows(10)
+        for row in rows:
+            row.date_modified = row.date_modified.replace(tzinfo=tz)
+        exp = [LabelsOut.from_labels(row) for row in rows]
+
+        batch = LabelsBatch.from_labels(rows)
+        assert batch.tz == tz
+        assert batch.date_modified[0] == np.datetime64("2023-12-31T22:00:00")
+        assert batch.to_json() == "[" + ",".join(lo.model_dump_json() for lo in exp) + "]"
+        assert [lo.model_dump_json() for lo in LabelsBatch.from_pandas(batch.to_pandas())] == [
+            lo.model_dump_json() for lo in exp
+        ]
+
+        rows[3].date_modified = rows[3].date_modified.replace(tzinfo=None)
+        with raises(AssertionError):
+            LabelsBatch.from_labels(rows)
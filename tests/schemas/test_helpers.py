@@ -1 +1,43 @@
-import dbdie_classes.schemas.helpers  # TODO
\ No newline at end of file
+"""Tests for helpers schemas."""
+
+from pytest import mark
+
+from dbdie_classes.schemas.helpers import DBDVersionOut, DBDVersionRange
+
+
+def mock_dbdv(id: int) -> DBDVersionOut:
+    return DBDVersionOut(id=id, name=f"7.{id}.0", common_name=None, release_date=None)
+
+
+def mock_dbdvr(id_min: int, id_max: int | None) -> DBDVersionRange:
+    return DBDVersionRange(
+        dbdv_min=mock_dbdv(id_min),
+        dbdv_max=mock_dbdv(id_max) if id_max is not None else None,
+    )
+
+
+class TestHelpers:
+    @mark.parametrize(
+        "range_a,range_b,exp",
+        [
+            ((1, 5),    (3, 8),    (3, 5)),
+            ((1, 5),    (5, 8),    None),
+            ((1, None), (3, 8),    (3, 8)),
+            ((3, 8),    (1, None), (3, 8)),
+            ((1, None), (3, None), (3, None)),
+            ((6, None), (1, 5),    None),
+        ],
+    )
+    def test_dbdvr_intersection(self, range_a, range_b, exp):
+        dbdvr = mock_dbdvr(*range_a) & mock_dbdvr(*range_b)
+        if exp is None:
+            assert dbdvr is None
+        else:
+            assert dbdvr == mock_dbdvr(*exp)
+
+    def test_dbdv_none_comparison(self):
+        dbdv = mock_dbdv(3)
+        assert dbdv < None
+        assert dbdv <= None
+        assert not dbdv > None
+        assert dbdv != None  # noqa: E711
@@ -1 +1,40 @@
-import dbdie_classes.schemas.objects  # TODO
\ No newline at end of file
+"""Tests for objects schemas."""
+
+import datetime as dt
+from types import SimpleNamespace
+from pydantic_core import ValidationError
+from pytest import raises
+
+from dbdie_classes.schemas.objects import TOTAL_VALID_FMTS, ExtractorOut
+
+
+def mock_extractor(i: int, **kwargs) -> SimpleNamespace:
+    return SimpleNamespace(
+        **{
+            "id": i,
+            "name": f"extractor-{i}",
+            "user_id": 1,
+            "dbdv_min_id": 3,
+            "dbdv_max_id": None,
+            "special_mode": None,
+            "cps_id": 2,
+            "date_created": dt.datetime(2024, 1, 1),
+            "date_modified": dt.datetime(2024, 1, 2),
+            "date_last_trained": dt.date(2024, 1, 3),
+            **{f"mid_{j}": (i + j if j % 2 else None) for j in range(TOTAL_VALID_FMTS)},
+        }
+        | kwargs
+    )
+
+
+class TestObjects:
+    def test_extractor_from_sqla_many(self):
+        extractors = [mock_extractor(i) for i in range(120)]
+        exp = [ExtractorOut.from_sqla(extr) for extr in extractors]
+        assert ExtractorOut.from_sqla_many(extractors) == exp
+        assert exp[5].models_ids.ids[1] == 6
+
+    def test_extractor_from_sqla_many_raises(self):
+        extractors = [mock_extractor(0), mock_extractor(1, mid_1=-1)]
+        with raises(ValidationError, match="1.models_ids.mid_1"):
+            ExtractorOut.from_sqla_many(extractors)
@@ -0,0 +1,53 @@
+"""Tests for the binary codec."""
+
+from pytest import raises
+
+from dbdie_classes.codec import (
+    decode_encoded_infos,
+    decode_matches,
+    decode_player_infos,
+    decode_players_info,
+    encode_encoded_infos,
+    encode_matches,
+    encode_player_infos,
+    encode_players_info,
+)
+from dbdie_classes.extract import MATCH_INFO_DTYPE, MatchInfoTable, PlayerInfo
+from tests.mocks import mock_player_info
+
+
+class TestCodec:
+    def test_player_infos(self):
+        infos = [mock_player_info(i) for i in range(10)]
+        buf = encode_player_infos(infos)
+        assert len(buf) == 10 * 26
+        records = decode_player_infos(memoryview(buf))
+        assert [PlayerInfo.from_record(r) for r in records] == infos
+
+    def test_players_info(self):
+        players_info = {pid: mock_player_info(pid) for pid in [0, 2, 4]}
+        assert decode_players_info(encode_players_info(players_info)) == players_info
+
+    def test_matches(self):
+        matches = {
+            mid: {pid: mock_player_info(mid + pid) for pid in range(5)}
+            for mid in [10, 20]
+        }
+        buf = encode_matches(MatchInfoTable.from_matches(matches))
+        assert len(buf) == 10 * MATCH_INFO_DTYPE.itemsize
+
+        table = decode_matches(buf)
+        assert table.to_matches() == matches
+        table.append(30, 0, mock_player_info(0))
+        assert len(table) == 11
+
+    def test_encoded_infos(self):
+        encoded_infos = [
+            (pid, 10 + pid, (1, 2, 3, 4), 5, (6, 7), 8, 9)
+            for pid in range(5)
+        ]
+        assert decode_encoded_infos(encode_encoded_infos(encoded_infos)) == encoded_infos
+
+    def test_wrong_length_raises(self):
+        with raises(AssertionError):
+            decode_player_infos(b"\x00" * 27)
@@ -0,0 +1,219 @@
+"""Tests for the vectorized consistency engine."""
+
+import numpy as np
+from pytest import fixture, raises
+
+from dbdie_classes.consistency import (
+    ADDONS,
+    CHARACTER,
+    IFK_NULL,
+    ITEM,
+    PERKS,
+    REASONS_BITS,
+    STATUS,
+    UNKNOWN,
+    UNKNOWN_ID,
+    ConsistencyEngine,
+    dense_array,
+    explain,
+    match_rules,
+)
+from dbdie_classes.options.NULL_IDS import NULL_SENTINEL
+from dbdie_classes.schemas.groupings import FullMatchOut, PlayerOut
+from dbdie_classes.schemas.helpers import DBDVersionOut
+from dbdie_classes.schemas.predictables import (
+    AddonOut,
+    CharacterOut,
+    ItemOut,
+    OfferingOut,
+    PerkOut,
+    StatusOut,
+)
+
+IFKS = [None, False, True]
+PERK_CHAR_IDS = [0, 2, 1, 3, 4, 5]  # special character IDs of IFKS, then regular characters
+
+
+@fixture
+def catalogs() -> dict[str, list]:
+    return {
+        "characters": [
+            CharacterOut(
+                id=i, name=f"c{i}", ifk=IFKS[i % 3], base_char_id=None,
+                dbdv_id=None, common_name=None, emoji=None, power_id=None,
+            )
+            for i in range(6)
+        ],
+        "perks": [
+            PerkOut(id=i, name=f"p{i}", character_id=PERK_CHAR_IDS[i % 6], dbdv_id=None, emoji=None)
+            for i in range(12)
+        ],
+        "items": [
+            ItemOut(id=i, name=f"i{i}", type_id=i % 4, dbdv_id=None, rarity_id=None)
+            for i in range(8)
+        ],
+        "addons": [
+            AddonOut(id=i, name=f"a{i}", type_id=i % 5, dbdv_id=None, item_id=None, rarity_id=None)
+            for i in range(10)
+        ],
+        "offerings": [
+            OfferingOut(id=i, name=f"o{i}", type_id=0, user_id=i % 3, dbdv_id=None, rarity_id=None)
+            for i in range(6)
+        ],
+        "statuses": [
+            StatusOut(
+                id=i, name=f"s{i}", character_id=i % 3, is_dead=IFKS[i // 2 % 3],
+                dbdv_id=None, emoji=None,
+            )
+            for i in range(6)
+        ],
+    }
+
+
+def random_ids(rng, n: int) -> np.ndarray:
+    return np.column_stack(
+        [
+            rng.integers(0, 6, size=(n, 1)),
+            rng.integers(0, 12, size=(n, 4)),
+            rng.integers(0, 8, size=(n, 1)),
+            rng.integers(0, 10, size=(n, 2)),
+            rng.integers(0, 6, size=(n, 1)),
+            rng.integers(0, 6, size=(n, 1)),
+        ]
+    )
+
+
+def player_out(catalogs: dict[str, list], pid: int, row: list[int]) -> PlayerOut:
+    return PlayerOut.model_validate(
+        {
+            "id": pid,
+            "character": catalogs["characters"][row[0]],
+            "perks": [catalogs["perks"][p] for p in row[1:5]],
+            "item": catalogs["items"][row[5]],
+            "addons": [catalogs["addons"][a] for a in row[6:8]],
+            "offering": catalogs["offerings"][row[8]],
+            "status": catalogs["statuses"][row[9]],
+            "points": 0,
+            "prestige": 0,
+        },
+        context={"chars_ifk": {c.id: c.ifk for c in catalogs["characters"]}},
+    )
+
+
+class TestConsistencyEngine:
+    def test_matches_player_out(self, catalogs):
+        engine = ConsistencyEngine.from_catalogs(**catalogs)
+        ids = random_ids(np.random.default_rng(0), 500)
+        consistent, reasons = engine.check(ids)
+
+        for row, is_consistent, row_reasons in zip(ids.tolist(), consistent, reasons):
+            assert player_out(catalogs, 0, row).is_consistent == is_consistent
+            assert is_consistent == (row_reasons == 0)
+        assert 0 < consistent.sum() < len(ids)
+
+        # survivor with a survivor character's perk (4) or a killer character's perk (5)
+        rows = [[1, 1, 1, 1, 4, 0, 0, 0, 0, 0], [1, 1, 1, 1, 5, 0, 0, 0, 0, 0]]
+        assert [player_out(catalogs, 0, row).is_consistent for row in rows] == [True, False]
+        assert engine.check(rows)[1].tolist() == [0, REASONS_BITS[PERKS]]
+
+    def test_reasons(self, catalogs):
+        engine = ConsistencyEngine.from_catalogs(**catalogs)
+        # character 2 is a killer, perk 1 is for survivors, item 0 isn't a killer power,
+        # addon 2 is a base addon, status 2 is for survivors
+        consistent, reasons = engine.check(
+            [
+                [2, 1, 2, 2, 2, 1, 1, 1, 1, 1],
+                [2, 2, 2, 2, 2, 1, 1, 1, 1, 1],
+                [2, 2, 2, 2, 2, 0, 2, 1, 1, 2],
+                [0, 2, 2, 2, 2, 1, 1, 1, 1, 1],
+                [2, 2, 2, 2, 99, 1, 1, 1, 1, 1],
+            ]
+        )
+        assert consistent.tolist() == [False, True, False, False, False]
+        assert [explain(r) for r in reasons.tolist()] == [
+            [PERKS],
+            [],
+            [ITEM, ADDONS, STATUS],
+            [CHARACTER],
+            [UNKNOWN_ID],
+        ]
+
+    def test_nulls(self, catalogs):
+        engine = ConsistencyEngine.from_catalogs(**catalogs)
+        null = NULL_SENTINEL
+        consistent, reasons = engine.check(
+            [
+                [null, 1, 1, 1, 1, 0, 2, 2, 1, 1],
+                [2, null, null, null, null, 1, null, null, null, null],
+                [null] * 10,
+            ]
+        )
+        assert consistent.all()
+        assert engine.check(np.empty((0, 10), dtype=np.int64))[0].shape == (0,)
+        with raises(AssertionError):
+            engine.check(np.zeros((3, 4), dtype=np.int64))
+
+    def test_regular_character_perks(self, catalogs):
+        # perks of regular characters take their character's ifk
+        catalogs["perks"] = [
+            PerkOut(id=i, name=f"p{i}", character_id=3 + i, dbdv_id=None, emoji=None)
+            for i in range(3)
+        ]
+        engine = ConsistencyEngine.from_catalogs(**catalogs)
+        assert engine.perk_ifk.tolist() == [IFK_NULL, 0, 1]
+        _, reasons = engine.check([[2, 0, 1, 2, 2, 1, 1, 1, 1, 1]])
+        assert [explain(r) for r in reasons.tolist()] == [[PERKS]]
+
+    def test_dense_array(self):
+        assert dense_array({3: 7, 0: 1}).tolist() == [1, UNKNOWN, UNKNOWN, 7]
+        assert dense_array({}).shape == (0,)
+
+
+class TestMatchesConsistency:
+    def test_matches_full_match_out(self, catalogs):
+        engine = ConsistencyEngine.from_catalogs(**catalogs)
+        rng = np.random.default_rng(1)
+        ids = random_ids(rng, 5 * 400).reshape(400, 5, 10)
+        # Make half of the matches consistent: survivors first, killer last
+        ids[::2, :4] = [1, 1, 0, 1, 0, 0, 0, 0, 0, 0]
+        ids[::2, :4, 9] = rng.choice([0, 2, 3, 5], size=(200, 4))
+        ids[::2, 4] = [2, 2, 0, 2, 2, 1, 1, 1, 1, 4]
+        consistent, kills = engine.check_matches_labels(ids)
+
+        version = DBDVersionOut(id=1, name="7.5.0", common_name=None, release_date=None)
+        for match_ids, is_consistent, match_kills in zip(ids.tolist(), consistent, kills):
+            match = FullMatchOut(
+                version=version,
+                players=[player_out(catalogs, pid, row) for pid, row in enumerate(match_ids)],
+            )
+            assert match.is_consistent == is_consistent
+            assert match.kills == match_kills
+        assert 0 < consistent.sum() < len(ids)
+        assert set(kills.tolist()) == {0, 1, 2, 3, 4}
+
+    def test_check_matches(self, catalogs):
+        engine = ConsistencyEngine.from_catalogs(**catalogs)
+        null = NULL_SENTINEL
+        consistent, kills = engine.check_matches(
+            [[1, 1, 1, 1, 2], [1, null, 1, 1, 2], [1, 1, 1, 2, 2], [1, 1, 1, 1, 1]],
+            [[4, 4, 0, null, 4], [4, 4, 4, 4, 4], [4, 99, 2, 0, 0], [0, 0, 0, 0, 0]],
+        )
+        assert consistent.tolist() == [True, True, False, False]
+        assert kills.tolist() == [2, 4, 1, 0]
+
+        consistent, _ = engine.check_matches(
+            [[1, 1, 1, 1, 2]] * 2,
+            [[0] * 5] * 2,
+            players_consistent=[[True] * 5, [True] * 4 + [False]],
+        )
+        assert consistent.tolist() == [True, False]
+
+    def test_match_rules(self):
+        consistent, kills = match_rules(
+            np.array([[0, -1, 0, 0, 1], [0, 0, 0, 0, -1]]),
+            np.array([[1, 1, -1, 0, 1], [0, 0, 0, 0, 0]]),
+        )
+        assert consistent.tolist() == [True, False]
+        assert kills.tolist() == [2, 0]
+        with raises(AssertionError):
+            match_rules(np.zeros((2, 4)), np.zeros((2, 4)))
@@ -1 +1,246 @@
-import dbdie_classes.extract  # TODO
\ No newline at end of file
+"""Tests for extract classes."""
+
+import numpy as np
+from pytest import mark, raises
+
+from dbdie_classes.extract import (
+    CropCoords,
+    CropCoordsArray,
+    CropLayout,
+    MatchInfoTable,
+    crop_batch,
+    crop_views,
+    find_overlapping_pairs,
+)
+from tests.mocks import mock_player_info
+
+CROPS = [
+    (0, 0, 1920, 1080),
+    (1, 1, 1919, 1079),
+    (100, 100, 300, 300),
+    (150, 150, 250, 350),
+    (2000, 1200, 2400, 1500),
+]
+
+
+class TestCropCoordsArray:
+    def test_roundtrip(self):
+        crops = [CropCoords(*c) for c in CROPS]
+        cca = CropCoordsArray.from_crops(crops)
+        assert cca.coords.shape == (len(CROPS), 4)
+        assert cca.coords.dtype == np.int32
+        assert cca.to_crops() == crops
+        assert cca[2] == crops[2]
+        assert cca[1:3] == CropCoordsArray.from_crops(crops[1:3])
+
+    def test_roundtrip_players(self):
+        players_crops = {pid: CropCoords(*c) for pid, c in zip([4, 0, 2], CROPS)}
+        cca = CropCoordsArray.from_players(players_crops)
+        assert cca.to_players([0, 2, 4]) == players_crops
+        assert len(CropCoordsArray.from_crops([])) == 0
+
+    def test_shapes_and_sizes(self):
+        crops = [CropCoords(*c) for c in CROPS]
+        cca = CropCoordsArray.from_crops(crops)
+        assert [tuple(s) for s in cca.shapes.tolist()] == [cc.shape for cc in crops]
+        assert cca.sizes.tolist() == [cc.size for cc in crops]
+
+    @mark.parametrize("other", CROPS)
+    def test_broadcast_matches_scalar(self, other):
+        crops = [CropCoords(*c) for c in CROPS]
+        cca = CropCoordsArray.from_crops(crops)
+        cc = CropCoords(*other)
+        assert cca.is_fully_inside(cc).tolist() == [c.is_fully_inside(cc) for c in crops]
+        assert cca.check_overlap(cc).tolist() == [c.check_overlap(cc) for c in crops]
+
+    def test_matrices(self):
+        crops = [CropCoords(*c) for c in CROPS]
+        cca = CropCoordsArray.from_crops(crops)
+        inside = cca.is_fully_inside_matrix(cca)
+        overlap = cca.overlap_matrix(cca)
+        assert inside.shape == overlap.shape == (len(CROPS), len(CROPS))
+        for i, ci in enumerate(crops):
+            for j, cj in enumerate(crops):
+                assert inside[i, j] == ci.is_fully_inside(cj)
+                assert overlap[i, j] == ci.check_overlap(cj)
+        assert (cca.is_fully_inside(cca[::-1]) == inside[:, ::-1].diagonal()).all()
+
+    @mark.parametrize("seed, max_wh", [(0, 60), (1, 60), (2, 60), (3, 400)])
+    def test_overlapping_pairs(self, seed, max_wh):
+        rng = np.random.default_rng(seed)
+        lt = rng.integers(-50, 500, size=(200, 2))
+        wh = rng.integers(0, max_wh, size=(200, 2))
+        crops = [CropCoords(*c) for c in np.hstack([lt, lt + wh]).tolist()]
+
+        exp = [
+            [i, j]
+            for i in range(len(crops))
+            for j in range(i + 1, len(crops))
+            if crops[i].check_overlap(crops[j])
+        ]
+        assert find_overlapping_pairs(crops).tolist() == exp
+        assert CropCoordsArray.from_crops(crops).overlapping_pairs().tolist() == exp
+
+    def test_overlapping_pairs_tall_column(self):
+        n = 20_000
+        tops = np.arange(n) * 40
+        coords = np.stack([np.zeros(n), tops, np.full(n, 50), tops + 40], axis=1)
+        assert find_overlapping_pairs(CropCoordsArray(coords)).shape == (0, 2)
+
+        coords[1::2, 3] += 1  # each odd crop overlaps the next one
+        pairs = find_overlapping_pairs(CropCoordsArray(coords))
+        assert pairs.tolist() == [[i, i + 1] for i in range(1, n - 1, 2)]
+
+    def test_overlapping_pairs_mixed_sizes(self):
+        crops = CropCoordsArray([[0, 0, 1, 1], [2, 2, 3, 3], [0, 0, 20_000, 20_000]])
+        assert find_overlapping_pairs(crops).tolist() == [[0, 2], [1, 2]]
+
+        rng = np.random.default_rng(4)
+        lt = rng.integers(0, 2000, size=(300, 2))
+        wh = np.where(rng.random((300, 1)) < 0.05, 1500, rng.integers(0, 30, size=(300, 2)))
+        coords = np.hstack([lt, lt + wh])
+        exp = np.argwhere(np.triu(CropCoordsArray(coords).overlap_matrix(CropCoordsArray(coords)), k=1))
+        assert find_overlapping_pairs(CropCoordsArray(coords)).tolist() == exp.tolist()
+
+    def test_overlapping_pairs_empty(self):
+        assert find_overlapping_pairs([]).shape == (0, 2)
+        assert find_overlapping_pairs([CropCoords(*c) for c in CROPS[:1]]).shape == (0, 2)
+
+
+class TestCropViews:
+    def test_view(self):
+        img = np.arange(20 * 30 * 3, dtype=np.uint8).reshape(20, 30, 3)
+        cc = CropCoords(5, 2, 15, 12)
+        view = cc.view(img)
+        assert view.shape == (10, 10, 3)
+        assert np.shares_memory(view, img)
+
+    def test_crop_views(self):
+        img = np.zeros((20, 30, 3), dtype=np.uint8)
+        crops = [CropCoords(0, 0, 10, 5), CropCoords(10, 5, 30, 20)]
+        views = crop_views(img, crops)
+        assert [v.shape for v in views] == [(5, 10, 3), (15, 20, 3)]
+        assert all(np.shares_memory(v, img) for v in views)
+        with raises(AssertionError):
+            crop_views(img, [CropCoords(20, 0, 31, 5)])
+
+    def test_crop_batch(self):
+        img = np.arange(20 * 30 * 3, dtype=np.uint8).reshape(20, 30, 3)
+        crops = [CropCoords(0, 0, 10, 5), CropCoords(10, 5, 20, 10)]
+        batch = crop_batch(img, crops)
+        assert batch.shape == (2, 5, 10, 3)
+        assert batch.flags["C_CONTIGUOUS"]
+        for i, cc in enumerate(crops):
+            assert (batch[i] == cc.view(img)).all()
+
+        out = np.zeros((3, 5, 10, 3), dtype=np.uint8)
+        assert np.shares_memory(crop_batch(img, crops, out=out[1:]), out)
+        assert (out[1:] == batch).all()
+        assert (out[0] == 0).all()
+
+        with raises(AssertionError):
+            crop_batch(img, [CropCoords(0, 0, 10, 5), CropCoords(0, 0, 5, 5)])
+
+
+class TestMatchInfoTable:
+    def test_roundtrip(self):
+        matches = {
+            mid: {pid: mock_player_info(10 * mid + pid) for pid in range(5)}
+            for mid in range(3)
+        }
+        table = MatchInfoTable.from_matches(matches)
+        assert len(table) == 15
+        assert table.to_matches() == matches
+        assert table.players_info(1) == matches[1]
+        assert table.player_info(7) == matches[1][2]
+
+    def test_append(self):
+        table = MatchInfoTable(capacity=2)
+        for i in range(5):
+            table.append(100, i, mock_player_info(i))
+        table.append_match(101, {0: mock_player_info(9), 4: mock_player_info(8)})
+        table.extend(table[:2])
+
+        assert len(table) == 9
+        assert table["match_id"].tolist() == [100] * 5 + [101] * 2 + [100] * 2
+        assert table["player_id"].tolist() == [0, 1, 2, 3, 4, 0, 4, 0, 1]
+        assert table["perks"].shape == (9, 4)
+        assert table.player_info(6) == mock_player_info(8)
+
+    def test_match_rows(self):
+        table = MatchInfoTable()
+        for mid in [7, 3, 7, 5, 3, 7]:
+            table.append(mid, len(table), mock_player_info(len(table)))
+        assert table.match_rows(7).tolist() == [0, 2, 5]
+        assert table.match_rows(4).tolist() == []
+        assert table.players_info(3) == {1: mock_player_info(1), 4: mock_player_info(4)}
+
+        table.append(3, 6, mock_player_info(6))  # index is rebuilt after appending
+        assert table.match_rows(3).tolist() == [1, 4, 6]
+        assert table.players_info(8) == {}
+
+    def test_slicing(self):
+        table = MatchInfoTable.from_matches({0: {pid: mock_player_info(pid) for pid in range(5)}})
+        sliced = table[1:3]
+        assert isinstance(sliced, MatchInfoTable)
+        assert np.shares_memory(sliced.data, table.data)
+        assert sliced.player_info(0) == mock_player_info(1)
+        assert len(table[table["points"] >= 3000]) == 2
+        assert len(table[4]) == 1
+
+
+class TestCropLayout:
+    def test_rescale(self):
+        players_crops = {
+            0: CropCoords(0, 0, 100, 50),
+            4: CropCoords(0, 50, 100, 100),
+        }
+        fmts_crops = {
+            "perks__surv": [CropCoords(10 * i, 0, 10 * i + 10, 10) for i in range(4)],
+            "offering__killer": [CropCoords(50, 5, 61, 15)],
+        }
+        layout = CropLayout((200, 100), players_crops, fmts_crops, cache_size=2)
+        assert layout.players_crops == players_crops
+        assert layout.fmts_crops == fmts_crops
+        assert layout.rescale((200, 100)) is layout
+
+        big = layout.rescale((400, 200))
+        assert big.img_size == (400, 200)
+        assert big.players_crops == {
+            0: CropCoords(0, 0, 200, 100),
+            4: CropCoords(0, 100, 200, 200),
+        }
+        assert big.fmts_crops["offering__killer"] == [CropCoords(100, 10, 122, 30)]
+        assert layout.rescale((400, 200)) is big
+
+        small = layout.rescale((100, 50))
+        assert small.fmts_crops["perks__surv"][1] == CropCoords(5, 0, 10, 5)
+
+    def test_rescale_keeps_fmt_shapes(self):
+        players_crops = {0: CropCoords(1000, 900, 1300, 1000)}
+        fmts_crops = {"perks__surv": [CropCoords(50 * i + 1, 30, 50 * i + 51, 70) for i in range(4)]}
+        layout = CropLayout((1920, 1080), players_crops, fmts_crops).rescale((1366, 768))
+
+        perks = CropCoordsArray.from_crops(layout.fmts_crops["perks__surv"])
+        assert np.unique(perks.shapes, axis=0).tolist() == [[36, 28]]
+        player_crop = layout.players_crops[0]
+        img = np.zeros((768, 1366, 3), dtype=np.uint8)
+        batch = crop_batch(player_crop.view(img), perks)
+        assert batch.shape == (4, 28, 36, 3)
+
+    def test_rescale_inside_img(self):
+        layout = CropLayout((100, 100), {0: CropCoords(1, 1, 100, 100)}, {})
+        assert layout.rescale((50, 50)).players_crops[0] == CropCoords(0, 0, 50, 50)
+
+        layout = CropLayout((102, 102), {0: CropCoords(3, 3, 102, 102)}, {})
+        small = layout.rescale((51, 51))
+        assert small.players_crops[0] == CropCoords(1, 1, 51, 51)
+        assert crop_views(np.zeros((51, 51)), CropCoordsArray.from_players(small.players_crops))[0].shape == (50, 50)
+
+    def test_lru(self):
+        layout = CropLayout((100, 100), {0: CropCoords(0, 0, 100, 100)}, {}, cache_size=2)
+        first = layout.rescale((10, 10))
+        layout.rescale((20, 20))
+        assert layout.rescale((10, 10)) is first
+        layout.rescale((30, 30))  # evicts (20, 20)
+        assert list(layout._cache) == [(10, 10), (30, 30)]
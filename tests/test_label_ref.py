@@ -0,0 +1,57 @@
+"""Tests for the dense label ref decoders."""
+
+from os import makedirs
+from os.path import dirname
+
+import numpy as np
+from pytest import raises
+
+from dbdie_classes.label_ref import (
+    LabelRefDecoder,
+    label_ref_path,
+    load_decoders,
+)
+
+LABEL_REF = {10: "Flashlight", 3: "Toolbox", 7: "Medkit", 0: "No item", 4: "Toolbox"}
+
+
+class TestLabelRefDecoder:
+    def test_decode(self):
+        dec = LabelRefDecoder.from_label_ref(LABEL_REF)
+        assert len(dec) == 5
+        assert dec.to_label_ref() == LABEL_REF
+
+        argmax = np.array([0, 2, 4, 1])
+        assert dec.decode_ids(argmax).tolist() == [10, 7, 4, 3]
+        assert dec.decode_names(argmax).tolist() == ["Flashlight", "Medkit", "Toolbox", "Toolbox"]
+
+        topk = np.array([[0, 1], [3, 2]])
+        names = dec.decode_names(topk)
+        assert names.shape == (2, 2)
+        assert names.tolist() == [["Flashlight", "Toolbox"], ["No item", "Medkit"]]
+
+    def test_encode(self):
+        dec = LabelRefDecoder.from_label_ref(LABEL_REF)
+        assert dec.encode_ids(["Medkit", "Toolbox"]).tolist() == [7, 3]
+        with raises(KeyError):
+            dec.encode_ids(["Key"])
+        with raises(AssertionError):
+            dec.decode_names_of_ids(np.array([5]))
+
+    def test_raises(self):
+        with raises(AssertionError):
+            LabelRefDecoder(np.array([0, 0]), ["a", "b"])
+        with raises(AssertionError):
+            LabelRefDecoder(np.array([0, 1]), ["a"])
+
+    def test_from_fmt(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DBDIE_MAIN_FD", str(tmp_path))
+        path = label_ref_path("item__surv")
+        makedirs(dirname(path))
+        with open(path, "w") as f:
+            f.write("label_id,name\n")
+            f.writelines(f"{k},{v}\n" for k, v in LABEL_REF.items())
+
+        decoders = load_decoders(["item__surv"])
+        assert decoders["item__surv"].to_label_ref() == LABEL_REF
+        assert label_ref_path("item__surv", is_inference=True) != path
@@ -0,0 +1,54 @@
+"""Tests for the crop pipeline."""
+
+from os import listdir, makedirs
+from os.path import join
+
+from pytest import mark
+
+from dbdie_classes.options import CROP_TYPES
+from dbdie_classes.pipeline import STAGES, CropPipeline
+
+
+def mock_load(path):
+    with open(path) as f:
+        return f.read()
+
+
+def mock_crop(src, crop_type):
+    if isinstance(src, dict):  # previous level crops
+        return f"{src[crop_type.removesuffix('_player')]}-{crop_type}"
+    return f"{src}-{crop_type}"
+
+
+def mock_write(filename, crops):
+    assert list(crops) == CROP_TYPES.ALL
+    assert crops[CROP_TYPES.SURV] == f"{filename}-{CROP_TYPES.SURV}"
+    assert crops[CROP_TYPES.KILLER_PLAYER] == (
+        f"{filename}-{CROP_TYPES.KILLER}-{CROP_TYPES.KILLER_PLAYER}"
+    )
+
+
+class TestCropPipeline:
+    @mark.parametrize("n_workers", [0, 2])
+    def test_run(self, monkeypatch, tmp_path, n_workers):
+        monkeypatch.setenv("DBDIE_MAIN_FD", str(tmp_path))
+        pending_fd = join(tmp_path, "data/img/pending")
+        makedirs(pending_fd)
+        filenames = [f"img_{i}.png" for i in range(7)]
+        for fn in filenames + ["notes.txt"]:
+            with open(join(pending_fd, fn), "w") as f:
+                f.write(fn)
+
+        pipeline = CropPipeline(
+            mock_load,
+            mock_crop,
+            mock_write,
+            n_workers=n_workers,
+            max_pending=2,
+        )
+        assert sorted(pipeline.run()) == filenames
+        assert listdir(pending_fd) == ["notes.txt"]
+        assert sorted(listdir(join(tmp_path, "data/img/cropped"))) == filenames
+
+        assert all(pipeline.stats[stage].items == 7 for stage in STAGES)
+        assert set(pipeline.summary()) == set(STAGES)
@@ -0,0 +1,48 @@
+"""Tests for the predictable groupings classes."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+
+from pytest import raises
+
+from dbdie_classes.groupings import PredictableTuple, PredictableTuples
+from dbdie_classes.options import FMT
+
+FMTS = ["perks__killer", "item__surv", "points"]
+
+
+class TestPredictableTuples:
+    def test_columns(self):
+        pred_tuples = PredictableTuples.from_fmts(FMTS)
+        assert len(pred_tuples) == 3
+        assert pred_tuples.to_lists() == (
+            FMTS,
+            ["perks", "item", "points"],
+            [True, False, None],
+        )
+        assert pred_tuples.pts == ["killer", "surv", None]
+        assert pred_tuples[1] == PredictableTuple(fmt="item__surv", mt="item", ifk=False)
+
+    def test_reentrant_iteration(self):
+        pred_tuples = PredictableTuples.from_fmts(FMTS)
+        pairs = [(a.fmt, b.fmt) for a in pred_tuples for b in pred_tuples]
+        assert len(pairs) == 9
+        assert [pt.fmt for pt in pred_tuples] == FMTS
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda _: [pt.fmt for pt in pred_tuples], range(50)))
+        assert all(r == FMTS for r in results)
+
+    def test_get(self):
+        pred_tuples = PredictableTuples.from_fmts(FMT.ALL)
+        assert "perks__surv" in pred_tuples
+        assert "perks" not in pred_tuples
+        assert pred_tuples.get("status__surv").mt == "status"
+        assert pred_tuples.get("perks") is None
+
+    def test_immutable(self):
+        pred_tuples = PredictableTuples.from_fmts(FMTS)
+        with raises(FrozenInstanceError):
+            pred_tuples.pred_tuples = ()
+        pred_tuples.fmts.append("character__surv")
+        assert pred_tuples.fmts == FMTS
@@ -0,0 +1,82 @@
+"""Tests for the crop shards."""
+
+import numpy as np
+from pytest import raises
+
+from dbdie_classes.shards import CropShard, CropShardReader, shards_fd, write_shard
+
+MOCK_DBDIE_MAIN_FD = "/home/troonies/dbdie"
+
+
+def mock_crops(n: int, offset: int = 0) -> np.ndarray:
+    crops = np.zeros((n, 4, 6, 3), dtype=np.uint8)
+    crops[:] = (np.arange(n) + offset)[:, None, None, None]
+    return crops
+
+
+class TestShards:
+    def test_shards_fd(self, monkeypatch):
+        monkeypatch.setenv("DBDIE_MAIN_FD", MOCK_DBDIE_MAIN_FD)
+        assert shards_fd("perks__surv") == f"{MOCK_DBDIE_MAIN_FD}/data/crops/perks__surv/shards"
+        assert shards_fd("perks__surv", is_inference=True) == (
+            f"{MOCK_DBDIE_MAIN_FD}/inference/crops/perks__surv/shards"
+        )
+
+    def test_shard(self, tmp_path):
+        keys = [(10, pid, slot) for pid in range(4) for slot in range(4)]
+        write_shard(str(tmp_path), "shard_0000", mock_crops(16), keys)
+
+        shard = CropShard.open(str(tmp_path), "shard_0000")
+        assert len(shard) == 16
+        assert isinstance(shard.crops, np.memmap)
+        assert (10, 2, 3) in shard
+        assert shard.row((10, 2, 3)) == 11
+        assert (shard.get((10, 2, 3)) == 11).all()
+        assert np.shares_memory(shard[2:5], shard.crops)
+
+        assert (10, 4, 0) not in shard
+        assert shard.rows_of([(10, 3, 3), (10, 0, 1)]).tolist() == [15, 1]
+        with raises(KeyError):
+            shard.get((11, 0, 0))
+
+        batch = shard.batch([5, 1, 5])
+        assert batch.shape == (3, 4, 6, 3)
+        assert batch[:, 0, 0, 0].tolist() == [5, 1, 5]
+
+    def test_write_shard_raises(self, tmp_path):
+        with raises(AssertionError):
+            write_shard(str(tmp_path), "shard", mock_crops(2), [(0, 0, 0)])
+        with raises(AssertionError):
+            write_shard(str(tmp_path), "shard", mock_crops(2), [(0, 0, 0), (0, 0, 0)])
+
+    def test_reader(self, tmp_path):
+        write_shard(str(tmp_path), "shard_0000", mock_crops(5), [(1, pid, 0) for pid in range(5)])
+        write_shard(str(tmp_path), "shard_0001", mock_crops(5, 5), [(2, pid, 0) for pid in range(5)])
+
+        reader = CropShardReader(str(tmp_path))
+        assert len(reader) == 10
+        assert (2, 4, 0) in reader
+        assert (reader.get((2, 4, 0)) == 9).all()
+
+        keys = [(2, 0, 0), (1, 3, 0), (2, 1, 0)]
+        out = np.empty((3, 4, 6, 3), dtype=np.uint8)
+        assert reader.batch(keys, out=out) is out
+        assert out[:, 0, 0, 0].tolist() == [5, 3, 6]
+        assert reader.locate(keys)[0].tolist() == [1, 0, 1]
+        assert reader.keys[4:6] == [(1, 4, 0), (2, 0, 0)]
+        assert (3, 0, 0) not in reader
+        with raises(KeyError):
+            reader.batch([(2, 0, 0), (3, 0, 0)])
+        assert len(CropShardReader(str(tmp_path / "missing"))) == 0
+
+    def test_reader_empty_batch(self, tmp_path):
+        with raises(AssertionError):
+            CropShardReader(str(tmp_path)).batch([])
+        write_shard(str(tmp_path), "shard_0000", mock_crops(2), [(1, 0, 0), (1, 1, 0)])
+        assert CropShardReader(str(tmp_path)).batch([]).shape == (0, 4, 6, 3)
+
+    def test_reader_repeated_keys(self, tmp_path):
+        write_shard(str(tmp_path), "shard_0000", mock_crops(2), [(1, 0, 0), (1, 1, 0)])
+        write_shard(str(tmp_path), "shard_0001", mock_crops(2), [(1, 1, 0), (2, 0, 0)])
+        with raises(AssertionError):
+            CropShardReader(str(tmp_path))